@@ -0,0 +1,107 @@
+"""Measure `patch_fastapi_dependencies` on large, nested FastAPI apps.
+
+> Note: `fastapi` must be installed.
+
+Usage:
+    python benchmarks/bench_fastapi.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any, Callable, Dict, List, Tuple
+
+from harness import Result, add_arguments, finish, measure
+
+import mockish
+
+# (number of mounted sub-apps, routes per app)
+SHAPES: List[Tuple[int, int]] = [
+    (0, 100),
+    (0, 1000),
+    (10, 100),
+    (100, 10),
+    (0, 10_000),
+    (40, 250),
+]
+
+
+def get_settings() -> Dict[str, str]:
+    return {"hello": "world"}
+
+
+def make_app(n_mounts: int, n_routes: int) -> Any:
+    from fastapi import Depends, FastAPI  # pylint: disable=import-error
+
+    def _add_routes(app: FastAPI) -> FastAPI:
+        for i in range(n_routes):
+
+            @app.get(f"/items/{i}")
+            def _get(settings: Dict[str, str] = Depends(get_settings)) -> Any:
+                return settings
+
+        return app
+
+    app: FastAPI = _add_routes(FastAPI())
+    for i in range(n_mounts):
+        app.mount(f"/sub/{i}", _add_routes(FastAPI()))
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    overrides: Dict[Callable[..., Any], Callable[..., Any]] = {
+        get_settings: lambda: {"hello": "mockish"},
+    }
+
+    results: List[Result] = []
+
+    for n_mounts, n_routes in SHAPES:
+        app: Any = make_app(n_mounts, n_routes)
+        case: str = f"{n_mounts} mounts x {n_routes} routes"
+
+        results.append(
+            Result(
+                name="patch",
+                case=case,
+                seconds=measure(
+                    lambda: mockish.patch_fastapi_dependencies(
+                        app,
+                        overrides=overrides,
+                    ),
+                ),
+            ),
+        )
+
+        def _patch_and_remove() -> None:
+            mockish.patch_fastapi_dependencies(app, overrides=overrides)
+            mockish.patch_fastapi_dependencies(app, overrides=overrides, remove=True)
+
+        results.append(
+            Result(
+                name="patch+remove",
+                case=case,
+                seconds=measure(_patch_and_remove),
+            ),
+        )
+
+        def _patch_and_restore() -> None:
+            with mockish.patch_fastapi_dependencies(app, overrides=overrides):
+                pass
+
+        results.append(
+            Result(
+                name="patch+restore",
+                case=case,
+                seconds=measure(_patch_and_restore),
+            ),
+        )
+
+    finish("fastapi", results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Measure `mockish.Mock`/`AsyncMock`/`FastMock` construction and per-call overhead.
+
+Usage:
+    python benchmarks/bench_mock.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from harness import Result, add_arguments, finish, measure
+
+import httpx
+import requests
+
+import mockish
+
+# specs commonly given to `Mock(spec_set=...)`
+SPECS: Dict[str, Any] = {
+    "httpx": httpx,
+    "httpx.Request": httpx.Request,
+    "requests.Session": requests.Session,
+}
+
+# keyword arguments of each `return_*` mode; sequences are long enough
+# to never be exhausted while measuring.
+MODES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "return_value": lambda: {"return_value": "hello world"},
+    "return_call": lambda: {"return_call": lambda *args, **kwargs: "hello world"},
+    "return_once": lambda: {"return_once": "hello world"},
+    "return_each": lambda: {"return_each": itertools.repeat("hello world")},
+    "return_cycle": lambda: {"return_cycle": ["hello", "world"]},
+    "return_exception": lambda: {"return_exception": ValueError("hello world")},
+}
+
+
+def _call(obj: mock.Mock) -> None:
+    try:
+        obj("hello", world=True)
+    except ValueError:
+        pass
+
+
+def _await(obj: mock.Mock) -> None:
+    # drives the coroutine directly, to leave out event loop overhead.
+    try:
+        obj("hello", world=True).send(None)
+    except (StopIteration, ValueError):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    results: List[Result] = []
+
+    for factory, call in ((mockish.Mock, _call), (mockish.AsyncMock, _await)):
+        for mode, make_kwargs in MODES.items():
+            name: str = factory.__name__
+
+            results.append(
+                Result(
+                    name=f"{name}()",
+                    case=mode,
+                    seconds=measure(lambda: factory(**make_kwargs())),
+                ),
+            )
+
+            for record in ("full", "count"):
+                if mode == "return_once":
+                    # exhausted after the first call; measure fresh mocks.
+                    continue
+                obj: mock.Mock = factory(record=record, **make_kwargs())
+                results.append(
+                    Result(
+                        name=f"{name}.__call__[record={record}]",
+                        case=mode,
+                        seconds=measure(lambda: call(obj)),
+                    ),
+                )
+
+    for mode, make_kwargs in MODES.items():
+        results.append(
+            Result(
+                name="FastMock()",
+                case=mode,
+                seconds=measure(lambda: mockish.FastMock(**make_kwargs())),
+            ),
+        )
+        if mode != "return_once":
+            fast: Any = mockish.FastMock(**make_kwargs())
+            results.append(
+                Result(
+                    name="FastMock.__call__",
+                    case=mode,
+                    seconds=measure(lambda: _call(fast)),
+                ),
+            )
+
+    # spec introspection is cached by `mockish`, and repeated by `unittest.mock`.
+    for case, spec in SPECS.items():
+        for name, factory in (
+            ("unittest.mock.Mock", mock.Mock),
+            ("Mock", mockish.Mock),
+        ):
+            results.append(
+                Result(
+                    name=f"{name}(spec_set=...)",
+                    case=case,
+                    seconds=measure(lambda: factory(spec_set=spec)),
+                ),
+            )
+
+    finish("mock", results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Measure `Response` construction for both HTTP backends across payload sizes.
+
+Usage:
+    python benchmarks/bench_response.py [--max-size BYTES] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from bench_serializers import SIZES, make_payload
+from harness import (
+    Result,
+    add_arguments,
+    finish,
+    format_size,
+    measure,
+    measure_memory,
+)
+
+import httpx
+
+import mockish
+from mockish.cache import compression_cache
+from mockish.models import Response
+
+BACKENDS: Dict[str, type[Response]] = {
+    "httpx": mockish.httpx.Response,
+    "requests": mockish.requests.Response,
+}
+
+# number of responses in a sequence
+N_RECORDS: int = 10_000
+
+# size of the binary body passed to `Response(content=...)`
+BINARY_SIZE: int = 10 * 1024**2
+
+# keyword arguments of each `from_file` variant
+FILE_MODES: Dict[str, Dict[str, Any]] = {
+    "text": {},
+    "binary": {"binary": True},
+    "mmap": {"mmap": True},
+    "cached": {"cache": True},
+}
+
+
+def _httpx_with_request() -> httpx.Response:
+    resp: httpx.Response = mockish.httpx.Response(content="hello world")
+    _ = resp.request
+    return resp
+
+
+def _httpx_with_mock_request() -> httpx.Response:
+    # how the request was stubbed before it was created lazily.
+    resp: httpx.Response = mockish.httpx.Response(content="hello world")
+    resp.request = mockish.Mock(spec_set=httpx.Request)
+    return resp
+
+
+# ways to construct a small `httpx` response, by how its request is set
+HTTPX_REQUESTS: Dict[str, Callable[[], httpx.Response]] = {
+    "lazy": lambda: mockish.httpx.Response(content="hello world"),
+    "accessed": _httpx_with_request,
+    "mock stub": _httpx_with_mock_request,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-size", type=int, default=10 * 1024**2)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    results: List[Result] = []
+
+    for case, factory in HTTPX_REQUESTS.items():
+        results.append(
+            Result(
+                name="httpx.Response[request]",
+                case=case,
+                seconds=measure(factory),
+                nbytes=measure_memory(factory),
+            ),
+        )
+
+    # `Response(content=...)` with a large binary body, by its type
+    body: bytes = b"x" * min(args.max_size, BINARY_SIZE)
+    binary_contents: Dict[str, Any] = {
+        "str": body.decode(),
+        "bytes": body,
+        "bytearray": bytearray(body),
+        "memoryview": memoryview(body),
+        "array": array.array("B", body),
+    }
+    for backend, response_cls in BACKENDS.items():
+        for kind, content in binary_contents.items():
+            results.append(
+                Result(
+                    name=f"{backend}.Response[content={kind}]",
+                    case=format_size(len(body)),
+                    seconds=measure(
+                        lambda: response_cls(content=content),
+                        repeat=3,
+                    ),
+                    nbytes=measure_memory(
+                        lambda: response_cls(content=content),
+                        number=10,
+                    ),
+                ),
+            )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in [x for x in SIZES if x <= args.max_size]:
+            payload: Dict[str, Any] = make_payload(size)
+            path: Path = Path(tmp_dir) / f"{size}.json"
+            path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+            for backend, response_cls in BACKENDS.items():
+                results.append(
+                    Result(
+                        name=f"{backend}.from_dict",
+                        case=format_size(size),
+                        seconds=measure(
+                            lambda: response_cls.from_dict(payload),
+                            repeat=3,
+                        ),
+                    ),
+                )
+
+                results.append(
+                    Result(
+                        name=f"{backend}.from_dict[lazy]",
+                        case=format_size(size),
+                        seconds=measure(
+                            lambda: response_cls.from_dict(payload, lazy=True),
+                            repeat=3,
+                        ),
+                    ),
+                )
+
+                for cached in (False, True):
+                    compression_cache.enabled = cached
+                    results.append(
+                        Result(
+                            name=f"{backend}.from_dict[gzip"
+                            + (", cached]" if cached else "]"),
+                            case=format_size(size),
+                            seconds=measure(
+                                lambda: response_cls.from_dict(
+                                    payload,
+                                    content_encoding="gzip",
+                                ),
+                                repeat=3,
+                            ),
+                        ),
+                    )
+                compression_cache.enabled = True
+
+                for mode, kwargs in FILE_MODES.items():
+                    results.append(
+                        Result(
+                            name=f"{backend}.from_file[{mode}]",
+                            case=format_size(size),
+                            seconds=measure(
+                                lambda: response_cls.from_file(str(path), **kwargs),
+                                repeat=3,
+                            ),
+                        ),
+                    )
+
+    # a sequence of small responses, e.g. for `Mock(return_each=...)`
+    records: List[Dict[str, Any]] = make_payload(N_RECORDS * 100)["items"][:N_RECORDS]
+    case: str = f"{len(records)} records"
+    for backend, response_cls in BACKENDS.items():
+        results.append(
+            Result(
+                name=f"{backend}.from_dict (loop)",
+                case=case,
+                seconds=measure(
+                    lambda: [response_cls.from_dict(x) for x in records],
+                    repeat=3,
+                ),
+            ),
+        )
+        results.append(
+            Result(
+                name=f"{backend}.from_records",
+                case=case,
+                seconds=measure(
+                    lambda: list(response_cls.from_records(records)),
+                    repeat=3,
+                ),
+            ),
+        )
+
+    finish("response", results, args)
+
+
+if __name__ == "__main__":
+    main()
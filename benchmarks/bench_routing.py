@@ -0,0 +1,88 @@
+"""Measure route lookups of `mockish.httpx.Router`/`mockish.requests.Router`,
+and opening and looking up interactions of large `mockish.cassette.Cassette`s.
+
+Usage:
+    python benchmarks/bench_routing.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from typing import List
+
+from harness import Result, add_arguments, finish, measure
+
+import mockish
+from mockish.cassette import Cassette, CassetteWriter
+from mockish.routing import RouteTable
+
+N_ROUTES: List[int] = [100, 10_000]
+N_INTERACTIONS: List[int] = [1000, 100_000]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    results: List[Result] = []
+
+    handler = mockish.FastMock()
+    for n_routes in N_ROUTES:
+        table = RouteTable()
+        for i in range(n_routes):
+            table.add("GET", f"/exact/{i}", handler)
+            table.add("GET", f"/template/{i}/{{item_id}}", handler)
+            table.add("GET", f"/{{tenant}}/{i}/{{item_id}}", handler)
+
+        last: int = n_routes - 1
+        for case, url in (
+            ("exact", f"http://localhost/exact/{last}"),
+            ("template", f"http://localhost/template/{last}/asdf"),
+            ("wildcards", f"http://localhost/tenant/{last}/asdf"),
+        ):
+            results.append(
+                Result(
+                    name="RouteTable.match",
+                    case=f"{case}[{n_routes}]",
+                    seconds=measure(lambda: table.match("GET", url)),
+                ),
+            )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_interactions in N_INTERACTIONS:
+            path: str = os.path.join(tmp, f"{n_interactions}.cassette")
+            with CassetteWriter(path) as writer:
+                for i in range(n_interactions):
+                    writer.add(
+                        "GET",
+                        f"http://localhost/items/{i}",
+                        content=str(i).encode(),
+                    )
+
+            results.append(
+                Result(
+                    name="Cassette()",
+                    case=str(n_interactions),
+                    seconds=measure(lambda: Cassette(path).close()),
+                ),
+            )
+
+            cassette = Cassette(path)
+            url: str = f"http://localhost/items/{n_interactions - 1}"
+            results.append(
+                Result(
+                    name="Cassette.get",
+                    case=str(n_interactions),
+                    seconds=measure(lambda: cassette.get("GET", url)),
+                ),
+            )
+            cassette.close()
+
+    finish("routing", results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare JSON serializer backends used by `Response.from_dict`.
+
+Usage:
+    python benchmarks/bench_serializers.py [--max-size BYTES] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any, Dict, Iterator, List
+
+from harness import Result, add_arguments, finish, format_size, measure
+
+from mockish.requests import Response
+from mockish.serializers import SERIALIZERS, JsonSerializer
+
+SIZES: List[int] = [
+    1024,
+    64 * 1024,
+    1024**2,
+    10 * 1024**2,
+    50 * 1024**2,
+]
+
+
+def make_payload(nbytes: int) -> Dict[str, Any]:
+    """Return an object whose (stdlib) JSON representation is roughly `nbytes`."""
+    record: Dict[str, Any] = {
+        "id": 123456,
+        "name": "mockish ☃",
+        "active": True,
+        "score": 3.14159,
+        "tags": ["a", "b", "c"],
+    }
+    n_records: int = max(1, nbytes // len(json.dumps(record, ensure_ascii=False)))
+    return {"items": [dict(record, id=i) for i in range(n_records)]}
+
+
+def available_serializers() -> Iterator[tuple[str, JsonSerializer]]:
+    for name, serializer in SERIALIZERS.items():
+        try:
+            serializer({})
+        except ImportError:
+            continue
+        yield name, serializer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-size", type=int, default=max(SIZES))
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    results: List[Result] = []
+
+    for size in [x for x in SIZES if x <= args.max_size]:
+        payload: Dict[str, Any] = make_payload(size)
+        for name, serializer in available_serializers():
+            results.append(
+                Result(
+                    name=f"from_dict[{name}]",
+                    case=format_size(size),
+                    seconds=measure(
+                        lambda: Response.from_dict(payload, serializer=serializer),
+                        repeat=3,
+                    ),
+                ),
+            )
+
+    finish("serializers", results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Minimal timing helpers shared by the benchmark scripts in this directory."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# previous results of each suite, compared against by the next run (gitignored)
+RESULTS_DIR: Path = Path(__file__).resolve().parent.parent / ".benchmarks"
+
+
+@dataclass
+class Result:
+    name: str
+    case: str
+    seconds: float  # best time of a single call
+    nbytes: Optional[float] = None  # memory retained by each object returned
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> float:
+    """Return the best per-call time (in seconds) of `func`."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_memory(func: Callable[[], Any], number: int = 1000) -> float:
+    """Return the memory (in bytes) retained by each object returned by `func`."""
+    func()  # warm up caches, so they are not attributed to the objects
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        objects: List[Any] = [func() for _ in range(number)]
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objects
+    return (after - before) / number
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def format_size(nbytes: int) -> str:
+    for unit, scale in (("MB", 1024**2), ("KB", 1024)):
+        if nbytes >= scale:
+            return f"{nbytes / scale:.3g}{unit}"
+    return f"{nbytes}B"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options common to every suite: saving and comparing results."""
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="results to compare against (default: the previous run of the suite)",
+    )
+    parser.add_argument(
+        "--no-save",
+        action="store_true",
+        help="do not save the results as the baseline of the next run",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown reported as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with a non-zero status if any case regressed",
+    )
+
+
+def save(results: Iterable[Result], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "results": [asdict(x) for x in results],
+            },
+            indent=2,
+        ),
+    )
+
+
+def load(path: Path) -> Dict[Tuple[str, str], float]:
+    """Return the saved time of each (name, case)."""
+    data: Dict[str, Any] = json.loads(path.read_text())
+    return {(x["name"], x["case"]): x["seconds"] for x in data["results"]}
+
+
+def report(
+    results: Iterable[Result],
+    baseline: Optional[Dict[Tuple[str, str], float]] = None,
+    threshold: float = 0.2,
+) -> List[Result]:
+    """Print results, with their change from `baseline`; return the regressions."""
+    rows: List[Result] = list(results)
+    width_name: int = max([len(x.name) for x in rows] + [4])
+    width_case: int = max([len(x.case) for x in rows] + [4])
+
+    show_memory: bool = any(x.nbytes is not None for x in rows)
+
+    header: str = f"{'name':<{width_name}}  {'case':<{width_case}}  {'time':>10}"
+    if show_memory:
+        header += f"  {'memory':>10}"
+    if baseline is not None:
+        header += f"  {'baseline':>10}  {'change':>8}"
+    print(header)
+
+    regressions: List[Result] = []
+    for x in rows:
+        line: str = (
+            f"{x.name:<{width_name}}  {x.case:<{width_case}}  "
+            f"{format_seconds(x.seconds):>10}"
+        )
+        if show_memory:
+            line += f"  {'' if x.nbytes is None else format_size(int(x.nbytes)):>10}"
+        previous: Optional[float] = (
+            None if baseline is None else baseline.get((x.name, x.case))
+        )
+        if previous:
+            change: float = x.seconds / previous - 1
+            line += f"  {format_seconds(previous):>10}  {change:>+8.1%}"
+            if change > threshold:
+                line += "  (regressed)"
+                regressions.append(x)
+        print(line)
+
+    return regressions
+
+
+def finish(suite: str, results: Iterable[Result], args: argparse.Namespace) -> None:
+    """Report results against the baseline, then save them as the next baseline."""
+    rows: List[Result] = list(results)
+    path: Path = RESULTS_DIR / f"{suite}.json"
+    baseline_path: Path = args.baseline or path
+
+    baseline: Optional[Dict[Tuple[str, str], float]] = (
+        load(baseline_path) if baseline_path.exists() else None
+    )
+    regressions: List[Result] = report(rows, baseline, threshold=args.threshold)
+
+    if not args.no_save:
+        save(rows, path)
+        print(f"\nSaved results to {path}")
+
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+        if args.check:
+            sys.exit(1)
@@ -1,17 +1,47 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from . import httpx, requests
 from .__version__ import __version__
-from .mockish import AsyncMock, Mock, patch_fastapi_dependencies
+from .mockish import (
+    AsyncMock,
+    DependencyPatch,
+    FastMock,
+    Mock,
+    calls_by_thread,
+    patch,
+    patch_fastapi_dependencies,
+)
+
+if TYPE_CHECKING:
+    from . import httpx, requests
 
 __all__ = [
     "__version__",
     "Mock",
     "AsyncMock",
+    "FastMock",
+    "calls_by_thread",
+    "DependencyPatch",
     "patch",
     "patch_fastapi_dependencies",
     "requests",
     "httpx",
 ]
+
+# Submodules that import third-party HTTP libraries;
+# loaded on first attribute access to keep `import mockish` cheap.
+_LAZY_SUBMODULES = ("httpx", "requests")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        module = import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
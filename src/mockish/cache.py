@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from .models import ResponseData
+
+__all__ = [
+    "CacheInfo",
+    "LRUCache",
+    "compression_cache",
+    "fixture_cache",
+]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe LRU cache bounded by the total size of its values (in bytes).
+
+    Args:
+        max_bytes: evict least-recently used entries beyond this many bytes
+        enabled: whether callers should consult this cache by default
+
+    Examples:
+        >>> from mockish.cache import LRUCache
+        >>> cache = LRUCache(max_bytes=10)
+        >>> cache.put("a", b"12345", size=5)
+        >>> cache.put("b", b"67890", size=5)
+        >>> cache.get("a")
+        b'12345'
+        >>> cache.put("c", b"abcde", size=5)
+        >>> cache.get("b") is None
+        True
+        >>> cache.cache_info()  # doctest: +NORMALIZE_WHITESPACE
+        CacheInfo(hits=1, misses=1, evictions=1, entries=2, current_bytes=10,
+                  max_bytes=10)
+    """
+
+    def __init__(self, max_bytes: int, enabled: bool = True) -> None:
+        self.max_bytes: int = max_bytes
+        self.enabled: bool = enabled
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._current_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry: Optional[tuple[V, int]] = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: K, value: V, size: int) -> None:
+        with self._lock:
+            if size > self.max_bytes:
+                # would evict everything else and still not fit.
+                return
+
+            previous: Optional[tuple[V, int]] = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self._evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+# Process-wide cache of `ResponseData` read by `Response.from_file`. Opt-in by
+# setting `fixture_cache.enabled = True`, or per call with `from_file(..., cache=True)`.
+fixture_cache: LRUCache[Hashable, ResponseData] = LRUCache(
+    max_bytes=256 * 1024 * 1024,
+    enabled=False,
+)
+
+# Process-wide cache of compressed content, keyed by (content digest, codec, level),
+# used by `mockish.compression.compress` (e.g., `from_dict(..., content_encoding=...)`).
+compression_cache: LRUCache[Hashable, bytes] = LRUCache(
+    max_bytes=256 * 1024 * 1024,
+    enabled=True,
+)
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import threading
+from datetime import timedelta
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+from .models import ResponseData
+
+__all__ = [
+    "Cassette",
+    "CassetteWriter",
+]
+
+# File layout (little-endian):
+#
+#   header   magic, flags, number of slots, number of records, index offset
+#   records  next-record offset, key, metadata (JSON), body -- back to back
+#   index    open-addressing hash table of (key hash, first-record offset) slots
+#
+# Records sharing a key (the same request made several times) are chained
+# through their next-record offset, in the order they were recorded.
+# Opening a cassette reads only the header; lookups probe the memory-mapped
+# index, and bodies are returned as zero-copy views into the mapping,
+# so they are paged in from disk only when read.
+
+_MAGIC: bytes = b"MOCKCAS1"
+_HEADER = struct.Struct("<8sIIIQ")
+_SLOT = struct.Struct("<QQ")
+_RECORD = struct.Struct("<QI")
+_META_LENGTH = struct.Struct("<I")
+_BODY_LENGTH = struct.Struct("<Q")
+
+_FLAG_MATCH_BODY: int = 1
+
+# dropped when recording, as recorded bodies are already decoded.
+_HOP_HEADERS = frozenset(["content-encoding", "content-length", "transfer-encoding"])
+
+
+def _request_key(
+    method: str,
+    url: str,
+    body: Union[str, bytes, None],
+    match_body: bool,
+) -> bytes:
+    key: str = f"{method.upper()} {url}"
+    if match_body and body:
+        if isinstance(body, str):
+            body = body.encode()
+        key += " " + hashlib.blake2b(body, digest_size=16).hexdigest()
+    return key.encode()
+
+
+def _key_hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class CassetteWriter:
+    def __init__(self, path: str, match_body: bool = False) -> None:
+        """Record interactions to a cassette file, to be replayed with `Cassette`.
+
+        Use `record` as a response hook on a real `httpx` client or
+        `requests` session to capture its traffic, or `add` for full control.
+
+        Args:
+            path: file to write; written completely once closed
+            match_body: include a digest of the request body in the request key
+
+        Examples:
+            ```py
+            with CassetteWriter("api.cassette") as writer:
+                # httpx
+                client = httpx.Client(event_hooks={"response": [writer.record]})
+                client.get("http://localhost:8000/users/123")
+                # requests
+                session = requests.Session()
+                session.hooks["response"].append(writer.record)
+                session.get("http://localhost:8000/users/123")
+            ```
+        """
+        self.match_body: bool = match_body
+        self._file: BinaryIO = open(path, "w+b")  # noqa: SIM115
+        self._file.write(_HEADER.pack(_MAGIC, 0, 0, 0, 0))
+        # key -> (key hash, first record offset, last record offset)
+        self._keys: Dict[bytes, Tuple[int, int, int]] = {}
+        self._n_records: int = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> CassetteWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def add(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        content: bytes = b"",
+        body: Union[str, bytes, None] = None,
+        elapsed: Optional[timedelta] = None,
+    ) -> None:
+        """Add an interaction: a request (method, URL, body) and its response."""
+        key: bytes = _request_key(method, url, body, self.match_body)
+        meta: bytes = json.dumps(
+            {
+                "status_code": status_code,
+                "headers": list((headers or {}).items()),
+                "elapsed": elapsed.total_seconds() if elapsed is not None else None,
+            },
+        ).encode()
+
+        with self._lock:
+            f: BinaryIO = self._file
+            offset: int = f.seek(0, 2)
+            f.write(_RECORD.pack(0, len(key)))
+            f.write(key)
+            f.write(_META_LENGTH.pack(len(meta)))
+            f.write(meta)
+            f.write(_BODY_LENGTH.pack(len(content)))
+            f.write(content)
+
+            previous: Optional[Tuple[int, int, int]] = self._keys.get(key)
+            if previous is None:
+                self._keys[key] = (_key_hash(key), offset, offset)
+            else:
+                # chain onto the last record with the same key.
+                f.seek(previous[2])
+                f.write(_RECORD.pack(offset, len(key)))
+                self._keys[key] = (previous[0], previous[1], offset)
+
+            self._n_records += 1
+
+    def record(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """Add a `httpx.Response` or `requests.Response`; usable as a response hook.
+
+        Returns `None`, so `requests` keeps the original response.
+        """
+        request: Any = response.request
+
+        if hasattr(response, "read"):
+            # httpx: response hooks run before the body is read.
+            response.read()
+
+        # `requests.PreparedRequest.body` or `httpx.Request.content`
+        body: Any = getattr(request, "body", None) or getattr(request, "content", None)
+        if not isinstance(body, (str, bytes)):
+            body = None
+
+        self.add(
+            method=request.method,
+            url=str(request.url),
+            status_code=response.status_code,
+            headers={
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _HOP_HEADERS
+            },
+            content=response.content,
+            body=body,
+            elapsed=getattr(response, "elapsed", None),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            f: BinaryIO = self._file
+            if f.closed:
+                return
+
+            n_slots: int = 1
+            while n_slots < 2 * len(self._keys):
+                n_slots *= 2
+            mask: int = n_slots - 1
+
+            slots: List[Tuple[int, int]] = [(0, 0)] * n_slots
+            for key_hash, first, _ in self._keys.values():
+                i: int = key_hash & mask
+                while slots[i][1]:
+                    i = (i + 1) & mask
+                slots[i] = (key_hash, first)
+
+            index_offset: int = f.seek(0, 2)
+            f.write(b"".join(_SLOT.pack(*x) for x in slots))
+
+            f.seek(0)
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _FLAG_MATCH_BODY if self.match_body else 0,
+                    n_slots,
+                    self._n_records,
+                    index_offset,
+                ),
+            )
+            f.close()
+
+
+class Cassette:
+    def __init__(self, path: str) -> None:
+        """Replay interactions recorded with `CassetteWriter`.
+
+        Opening a cassette maps the file and reads only its header, so it is
+        instant regardless of the number of interactions. Lookups are O(1),
+        and response bodies are zero-copy views that are read from disk
+        only when accessed.
+
+        Pass a cassette to `mockish.httpx.Router` or `mockish.requests.Router`
+        to replay it for requests that match no route.
+
+        Args:
+            path: cassette file
+
+        Raises:
+            ValueError: raised if `path` is not a cassette
+
+        Examples:
+            >>> import os, tempfile
+            >>> from mockish.cassette import Cassette, CassetteWriter
+            >>> from mockish.requests import Response
+            >>> path = os.path.join(tempfile.mkdtemp(), "api.cassette")
+
+            >>> with CassetteWriter(path) as writer:
+            ...     writer.add("GET", "http://localhost/hello", content=b"hello")
+            ...     writer.add("GET", "http://localhost/hello", content=b"world")
+
+            >>> with Cassette(path) as cassette:
+            ...     data = cassette.play("GET", "http://localhost/hello")
+            ...     Response.from_data(data).text
+            ...     data = cassette.play("GET", "http://localhost/hello")
+            ...     Response.from_data(data).text
+            ...     len(cassette)
+            'hello'
+            'world'
+            2
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, flags, n_slots, n_records, index_offset = _HEADER.unpack_from(
+            self._mmap,
+        )
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a cassette: {path}")
+
+        self.match_body: bool = bool(flags & _FLAG_MATCH_BODY)
+        self._n_slots: int = n_slots
+        self._n_records: int = n_records
+        self._index_offset: int = index_offset
+        self._view = memoryview(self._mmap)
+        # key -> offset of the next record to play
+        self._cursors: Dict[bytes, int] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Cassette:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n_records
+
+    def __contains__(self, request: Tuple[str, str]) -> bool:
+        return self._find(_request_key(*request, None, self.match_body)) is not None
+
+    def close(self) -> None:
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # bodies still referenced; the mapping is closed once they are released.
+            pass
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """Return the offset of the first record with the given key, if any."""
+        if not self._n_slots:
+            return None
+        key_hash: int = _key_hash(key)
+        mask: int = self._n_slots - 1
+        i: int = key_hash & mask
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(
+                self._mmap,
+                self._index_offset + i * _SLOT.size,
+            )
+            if not offset:
+                return None
+            if slot_hash == key_hash and self._record_key(offset) == key:
+                return int(offset)
+            i = (i + 1) & mask
+
+    def _record_key(self, offset: int) -> bytes:
+        _, key_length = _RECORD.unpack_from(self._mmap, offset)
+        start: int = offset + _RECORD.size
+        return self._mmap[start : start + key_length]
+
+    def _read(self, offset: int) -> Tuple[ResponseData, int]:
+        """Return the response data of a record, and the offset of the next one."""
+        next_offset, key_length = _RECORD.unpack_from(self._mmap, offset)
+        offset += _RECORD.size + key_length
+
+        (meta_length,) = _META_LENGTH.unpack_from(self._mmap, offset)
+        offset += _META_LENGTH.size
+        meta: Dict[str, Any] = json.loads(self._mmap[offset : offset + meta_length])
+        offset += meta_length
+
+        (body_length,) = _BODY_LENGTH.unpack_from(self._mmap, offset)
+        offset += _BODY_LENGTH.size
+
+        headers: Dict[str, str] = dict(meta["headers"])
+        if body_length:
+            headers["Content-Length"] = str(body_length)
+
+        return (
+            ResponseData(
+                status_code=meta["status_code"],
+                headers=headers,
+                content=self._view[offset : offset + body_length],
+                elapsed=(
+                    timedelta(seconds=meta["elapsed"])
+                    if meta["elapsed"] is not None
+                    else None
+                ),
+            ),
+            int(next_offset),
+        )
+
+    def get(
+        self,
+        method: str,
+        url: str,
+        body: Union[str, bytes, None] = None,
+    ) -> Optional[ResponseData]:
+        """Return the first recorded response to a request, if any."""
+        offset: Optional[int] = self._find(
+            _request_key(method, url, body, self.match_body),
+        )
+        return None if offset is None else self._read(offset)[0]
+
+    def play(
+        self,
+        method: str,
+        url: str,
+        body: Union[str, bytes, None] = None,
+    ) -> Optional[ResponseData]:
+        """Return the next recorded response to a request, if any.
+
+        Repeated requests replay their responses in the order recorded;
+        the last one is repeated once all have been played.
+        """
+        key: bytes = _request_key(method, url, body, self.match_body)
+        with self._lock:
+            offset: Optional[int] = self._cursors.get(key)
+            if offset is None:
+                offset = self._find(key)
+                if offset is None:
+                    return None
+            data, next_offset = self._read(offset)
+            if next_offset:
+                self._cursors[key] = next_offset
+            else:
+                self._cursors[key] = offset
+            return data
+
+    def rewind(self) -> None:
+        """Replay every request from its first recorded response again."""
+        with self._lock:
+            self._cursors.clear()
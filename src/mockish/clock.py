@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar, Union
+
+__all__ = [
+    "Latency",
+    "VirtualClock",
+    "sample_latency",
+]
+
+T = TypeVar("T")
+
+Latency = Union[float, timedelta, Callable[[], Union[float, timedelta]]]
+"""A fixed latency, in seconds or as a `timedelta`, or a callable that samples one,
+e.g. `functools.partial(random.uniform, 0.05, 0.2)`."""
+
+
+def sample_latency(latency: Latency) -> timedelta:
+    """Return a latency, sampled if `latency` is a distribution (callable).
+
+    Raises:
+        ValueError: raised if the latency is negative
+
+    Examples:
+        >>> from datetime import timedelta
+        >>> from mockish.clock import sample_latency
+        >>> sample_latency(0.25)
+        datetime.timedelta(microseconds=250000)
+        >>> sample_latency(lambda: timedelta(seconds=1))
+        datetime.timedelta(seconds=1)
+    """
+    value: float | timedelta = latency() if callable(latency) else latency
+    if not isinstance(value, timedelta):
+        value = timedelta(seconds=value)
+    if value < timedelta(0):
+        raise ValueError(f"Expected a non-negative latency; given: {value}")
+    return value
+
+
+class VirtualClock:
+    def __init__(self, start: Optional[float] = None) -> None:
+        """A virtual clock for `asyncio` event loops.
+
+        While attached, the loop reads time from this clock, and whenever
+        it would wait for its next timer (e.g., `asyncio.sleep`, `wait_for`
+        timeouts, `AsyncMock(latency=...)`) with no I/O ready,
+        the clock jumps straight to that timer instead.
+        Thousands of concurrent awaits of simulated latency then complete
+        in as much wall time as it takes to run their callbacks.
+
+        Real I/O still happens in real time, but does not advance the clock.
+
+        > Note: requires a selector-based event loop (the default on POSIX).
+
+        Args:
+            start: initial time; defaults to the loop's time when attached
+
+        Examples:
+            >>> import asyncio
+            >>> from mockish import AsyncMock
+            >>> from mockish.clock import VirtualClock
+            >>> fetch = AsyncMock(return_value="hello world", latency=3600)
+
+            >>> async def main():
+            ...     return await asyncio.gather(*[fetch() for _ in range(1000)])
+
+            >>> clock = VirtualClock(start=0)
+            >>> len(clock.run(main()))
+            1000
+            >>> clock.time()
+            3600.0
+        """
+        self._now: Optional[float] = start
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __enter__(self) -> VirtualClock:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.detach()
+
+    def time(self) -> float:
+        """Return the current virtual time, in seconds."""
+        if self._now is None:
+            raise RuntimeError(
+                "VirtualClock has not been started; attach it to a loop."
+            )
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by `seconds`.
+
+        Timers that become due fire on the loop's next pass.
+        """
+        if seconds < 0:
+            raise ValueError(f"Cannot move the clock backwards; given: {seconds}")
+        self._now = self.time() + seconds
+
+    def attach(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> VirtualClock:
+        """Drive `loop` (default: the running loop) with this clock until detached.
+
+        Raises:
+            TypeError: raised if `loop` is not a selector-based event loop
+            RuntimeError: raised if this clock is already attached
+        """
+        if loop is None:
+            loop = asyncio.get_running_loop()
+
+        # `BaseSelectorEventLoop._run_once` calls `self.time()` and
+        # `self._selector.select(timeout)`; both are overridden on the instance.
+        selector: Any = getattr(loop, "_selector", None)
+        if selector is None:
+            raise TypeError(
+                f"Expected a selector-based event loop; given: {type(loop)}",
+            )
+        if self._loop is not None:
+            raise RuntimeError("VirtualClock is already attached to a loop.")
+
+        if self._now is None:
+            self._now = loop.time()
+
+        real_select: Callable[..., List[Any]] = selector.select
+
+        def select(timeout: Optional[float] = None) -> List[Any]:
+            if timeout is None:
+                # no timers to jump to; wait for I/O (or another thread) in real time.
+                return real_select(timeout)
+            events: List[Any] = real_select(0)
+            if not events and timeout > 0:
+                self._now = self.time() + timeout
+            return events
+
+        loop.time = self.time  # type: ignore[method-assign]
+        selector.select = select
+        self._loop = loop
+        return self
+
+    def detach(self) -> None:
+        """Return the attached loop, if any, to real time."""
+        loop: Optional[asyncio.AbstractEventLoop] = self._loop
+        if loop is None:
+            return
+        del loop.time
+        del loop._selector.select  # type: ignore[attr-defined]
+        self._loop = None
+
+    def run(self, main: Awaitable[T]) -> T:
+        """Run `main` to completion in a new event loop driven by this clock."""
+        loop: asyncio.AbstractEventLoop = asyncio.SelectorEventLoop()
+        try:
+            self.attach(loop)
+            return loop.run_until_complete(main)
+        finally:
+            self.detach()
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
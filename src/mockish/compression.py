@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import zlib
+from typing import Callable, Dict, Hashable, Optional, Union
+
+from .cache import compression_cache
+
+__all__ = [
+    "COMPRESSORS",
+    "Compressor",
+    "compress",
+    "compress_brotli",
+    "compress_deflate",
+    "compress_gzip",
+    "compress_zstd",
+]
+
+Compressor = Callable[[Union[bytes, memoryview], Optional[int]], bytes]
+"""Compresses content at the given level, or the codec's default level if `None`."""
+
+
+def compress_gzip(content: bytes | memoryview, level: Optional[int] = None) -> bytes:
+    """Compress with `gzip`; the header has no timestamp, so output is reproducible."""
+    compressor = zlib.compressobj(-1 if level is None else level, zlib.DEFLATED, 31)
+    return compressor.compress(content) + compressor.flush()
+
+
+def compress_deflate(content: bytes | memoryview, level: Optional[int] = None) -> bytes:
+    """Compress with `deflate` (zlib format, as sent by HTTP servers)."""
+    return zlib.compress(content, -1 if level is None else level)
+
+
+def compress_brotli(content: bytes | memoryview, level: Optional[int] = None) -> bytes:
+    """Compress with `brotli`.
+
+    > Note: `brotli` must be installed.
+    """
+    import brotli  # pylint: disable=import-error
+
+    compressed: bytes = (
+        brotli.compress(bytes(content))
+        if level is None
+        else brotli.compress(bytes(content), quality=level)
+    )
+    return compressed
+
+
+def compress_zstd(content: bytes | memoryview, level: Optional[int] = None) -> bytes:
+    """Compress with `zstd`.
+
+    > Note: `zstandard` must be installed.
+    """
+    import zstandard  # pylint: disable=import-error
+
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    compressed: bytes = compressor.compress(content)
+    return compressed
+
+
+# by `Content-Encoding`
+COMPRESSORS: Dict[str, Compressor] = {
+    "gzip": compress_gzip,
+    "deflate": compress_deflate,
+    "br": compress_brotli,
+    "zstd": compress_zstd,
+}
+
+
+def compress(
+    content: bytes | memoryview,
+    encoding: str,
+    level: Optional[int] = None,
+    cache: Optional[bool] = None,
+) -> bytes:
+    """Compress content for the given `Content-Encoding`.
+
+    Args:
+        content: content to compress
+        encoding: a name in `COMPRESSORS`, e.g. `'gzip'`, `'br'`, or `'zstd'`
+        level: compression level; defaults to the codec's default
+        cache: read through `mockish.cache.compression_cache`, keyed on the
+            content's digest, `encoding`, and `level`;
+            defaults to `compression_cache.enabled`
+
+    Raises:
+        ValueError: raised if `encoding` is unknown
+
+    Returns:
+        : The compressed content
+
+    Examples:
+        >>> import gzip
+        >>> from mockish.compression import compress
+        >>> gzip.decompress(compress(b'hello world', 'gzip'))
+        b'hello world'
+    """
+    try:
+        compressor: Compressor = COMPRESSORS[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Unknown content encoding '{encoding}'; expected one of: "
+            f"{list(COMPRESSORS)}",
+        ) from None
+
+    if cache is None:
+        cache = compression_cache.enabled
+
+    if not cache:
+        return compressor(content, level)
+
+    key: Hashable = (
+        hashlib.blake2b(content, digest_size=16).digest(),
+        encoding,
+        level,
+    )
+    compressed: Optional[bytes] = compression_cache.get(key)
+    if compressed is None:
+        compressed = compressor(content, level)
+        compression_cache.put(key, compressed, size=len(compressed))
+    return compressed
@@ -1,2 +1,5 @@
 CONTENT_TYPE_DEFAULT = "text/plain"
 CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_BINARY = "application/octet-stream"
+REQUEST_METHOD_DEFAULT = "GET"
+REQUEST_URL_DEFAULT = "http://localhost/"
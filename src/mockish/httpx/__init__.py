@@ -1,3 +1,4 @@
 from .response import Response
+from .router import Router
 
-__all__ = ["Response"]
+__all__ = ["Response", "Router"]
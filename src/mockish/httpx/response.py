@@ -1,11 +1,45 @@
 from __future__ import annotations
 
+import json
 from datetime import timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Iterable, Iterator
 
 import httpx
 
-from .. import models
-from ..mockish import Mock
+from .. import constants, models
+
+if TYPE_CHECKING:
+    from ..clock import Latency
+
+
+class _ChunkStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Streams chunks lazily from a (async) iterable, in sync or async contexts."""
+
+    def __init__(self, chunks: models.ByteChunks) -> None:
+        self._chunks: models.ByteChunks = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        if not isinstance(self._chunks, Iterable):
+            raise RuntimeError("Attempted to call a sync iterator on an async stream.")
+        yield from self._chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if isinstance(self._chunks, AsyncIterable):
+            async for chunk in self._chunks:
+                yield chunk
+        else:
+            for chunk in self._chunks:
+                yield chunk
+
+    def close(self) -> None:
+        if hasattr(self._chunks, "close"):
+            self._chunks.close()
+
+    async def aclose(self) -> None:
+        if hasattr(self._chunks, "aclose"):
+            await self._chunks.aclose()
+        else:
+            self.close()
 
 
 class Response(httpx.Response, models.Response):
@@ -13,10 +47,14 @@ class Response(httpx.Response, models.Response):
         self,
         status_code: int | None = None,
         headers: dict[str, str] | None = None,
-        content: str | None = None,
+        content: models.Content | None = None,
         content_type: str | None = None,
         encoding: str | None = None,
         elapsed: timedelta | None = None,
+        latency: Latency | None = None,
+        request: httpx.Request | None = None,
+        content_encoding: str | None = None,
+        compression_level: int | None = None,
         _data: models.ResponseData | None = None,
     ):
         """A `httpx.Response` object, useful when mocking/patching HTTP calls.
@@ -24,10 +62,21 @@ class Response(httpx.Response, models.Response):
         Args:
             status_code:
             headers:
-            content:
+            content: text, or bytes-like content (e.g., `bytes`, `bytearray`,
+                `memoryview`, or another buffer); read-only buffers are used
+                without copying, and writable ones are copied;
+                `Content-Length` is its size in bytes
             content_type:
             encoding:
             elapsed:
+            latency: simulated latency used as `elapsed`, if not given;
+                a fixed value or a callable sampling one (`mockish.clock.Latency`)
+            request: the request that this is a response to; by default,
+                a `GET` request to `http://localhost/` is created on first access
+            content_encoding: send `content` compressed with this `Content-Encoding`
+                (`gzip`, `deflate`, `br`, `zstd`); it is decoded by `httpx`,
+                as the body of a real response is
+            compression_level: compression level; defaults to the codec's default
 
         Examples:
             *Common imports*
@@ -86,8 +135,6 @@ class Response(httpx.Response, models.Response):
             {'hello': 'world'}
         """
 
-        super().__init__(status_code=200)
-
         if not _data:
             _data = super()._prepare_response_data(
                 status_code=status_code,
@@ -96,16 +143,87 @@ class Response(httpx.Response, models.Response):
                 content_type=content_type,
                 encoding=encoding,
                 elapsed=elapsed,
+                latency=latency,
+                content_encoding=content_encoding,
+                compression_level=compression_level,
+            )
+
+        if _data.content and models._content_encoding(_data.headers):
+            # decoded by `httpx` (per `Content-Encoding`), as a real response is.
+            super().__init__(
+                status_code=200,
+                headers=_data.headers,
+                content=bytes(_data.content),
+            )
+        else:
+            super().__init__(
+                status_code=200,
+                stream=None if _data.stream is None else _ChunkStream(_data.stream),
             )
+            if _data.content:
+                # buffer content (e.g., memory-mapped files) is kept as a view.
+                self._content = _data.content  # type: ignore[assignment]
 
         self.status_code = _data.status_code
 
         self.headers = httpx.Headers(_data.headers)
 
-        if _data.content:
-            self._content = _data.content
-
         if _data.elapsed:
             self.elapsed = _data.elapsed
 
-        self._request = Mock(spec_set=httpx.Request)
+        self._request = request
+
+        if _data.lazy is not None:
+            self._set_lazy(_data.lazy, _data.headers)
+
+    @property
+    def request(self) -> httpx.Request:
+        # created on first access, as most mocked responses never read it.
+        if self._request is None:
+            self._request = httpx.Request(
+                constants.REQUEST_METHOD_DEFAULT,
+                constants.REQUEST_URL_DEFAULT,
+            )
+        return self._request
+
+    @request.setter
+    def request(self, value: httpx.Request) -> None:
+        self._request = value
+
+    def raise_for_status(self) -> Response:
+        # `httpx` reads `_request` directly.
+        _ = self.request
+        return super().raise_for_status()  # type: ignore[return-value]
+
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        # slices of buffer content are views; `bytes` of `bytes` is not a copy.
+        for chunk in super().iter_bytes(chunk_size):
+            yield bytes(chunk)
+
+    async def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        async for chunk in super().aiter_bytes(chunk_size):
+            yield bytes(chunk)
+
+    # serves lazy JSON first; otherwise shadowed by `httpx.Response.json`.
+    json = models.Response.json
+
+    def _parse_json(self, **kwargs: Any) -> Any:
+        content: bytes | memoryview = self.content
+        if isinstance(content, (bytes, bytearray)):
+            return super().json(**kwargs)
+        # `json.loads` does not accept buffers (e.g., memory-mapped files).
+        return json.loads(self.text, **kwargs)
+
+    @staticmethod
+    def _new_headers(headers: dict[str, str]) -> httpx.Headers:
+        return httpx.Headers(headers)
+
+    def _clone(self) -> Response:
+        clone: Response = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__.pop("_decoder", None)
+        if "headers" in self.__dict__:
+            clone.headers = self.headers.copy()
+        clone.extensions = dict(self.extensions)
+        clone.history = list(self.history)
+        return clone
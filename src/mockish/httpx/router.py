@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Pattern, Sequence, Union
+from unittest import mock
+
+import httpx
+
+from .. import models
+from ..cassette import Cassette
+from ..mockish import _HAS_CALL_HOOKS, Mock
+from ..routing import RouteTable
+from .response import Response
+
+
+def _to_response(result: Any) -> httpx.Response:
+    if isinstance(result, models.ResponseTemplate):
+        return result.build(Response)
+    if isinstance(result, Response):
+        # a shared response (e.g., a `return_value`) is handed out as a copy,
+        # as `httpx` sets its `request` and wraps its `stream` when sent.
+        return result._clone()
+    if not isinstance(result, httpx.Response):
+        raise TypeError(f"Expected type 'httpx.Response'; given: {type(result)}")
+    return result
+
+
+async def _to_response_async(result: Awaitable[Any]) -> httpx.Response:
+    return _to_response(await result)
+
+
+class Router(httpx.MockTransport):
+    def __init__(self, cassette: Optional[Cassette] = None) -> None:
+        """A `httpx` transport that routes requests to mocked responses.
+
+        Routes are indexed: exact routes are found with a dict lookup on
+        (method, host, path), and only routes with path placeholders or
+        compiled patterns are scanned, so lookups stay fast with many routes.
+
+        Each route is backed by a `mockish.Mock` that is called with the
+        request (and any path parameters), so `return_once`, `return_each`,
+        etc. behave as they do for `mockish.Mock`, except that an exhausted
+        route raises `LookupError`, with `httpx.Client` and `httpx.AsyncClient`
+        alike. Routes are `thread_safe` mocks (from Python 3.8), so a
+        `return_call` may itself send requests. Routes may also
+        return a `mockish.models.ResponseTemplate` to hand out a fresh response
+        on each call.
+
+        Args:
+            cassette: replay interactions from a `mockish.cassette.Cassette`
+                for requests that match no route
+
+        Examples:
+            >>> import httpx
+            >>> from mockish.httpx import Response, Router
+
+            >>> router = Router()
+            >>> users = router.add(
+            ...     "GET",
+            ...     "https://www.fresh2.dev/users/{id}",
+            ...     return_call=lambda request, id: Response.from_dict({"id": id}),
+            ... )
+            >>> _ = router.add(
+            ...     "POST",
+            ...     "/users",
+            ...     return_once=Response.from_dict({"id": "123"}, status_code=201),
+            ... )
+
+            >>> client = httpx.Client(transport=router)
+            >>> client.get("https://www.fresh2.dev/users/456").json()
+            {'id': '456'}
+            >>> users.assert_called_once()
+            >>> client.post("https://www.fresh2.dev/users")
+            <Response [201 Created]>
+        """
+        # `_handle` returns an awaitable for async routes, as `MockTransport` expects.
+        super().__init__(self._handle)  # type: ignore[arg-type]
+        self._routes = RouteTable()
+        self._cassette: Optional[Cassette] = cassette
+
+    def add(
+        self,
+        method: str,
+        url: Union[str, Pattern[str]],
+        *,
+        body: Union[str, bytes, None] = None,
+        return_value: Optional[Any] = None,
+        return_call: Optional[Callable[..., Optional[Any]]] = None,
+        return_once: Optional[Any] = None,
+        return_each: Optional[Sequence[Any]] = None,
+        return_exception: Optional[Exception] = None,
+        **kwargs: Any,
+    ) -> mock.Mock:
+        """Add a route, returning the `mockish.Mock` that handles it.
+
+        Args:
+            method: HTTP method
+            url: an absolute URL, or a path to match any host;
+                a path may contain placeholders (e.g., `/users/{id}`)
+                that are passed to the mock as keyword arguments;
+                a compiled `re.Pattern` is matched against the full URL,
+                and its named groups are passed the same way.
+            body: only match requests with this exact body
+            return_value: see `mockish.Mock`
+            return_call: see `mockish.Mock`
+            return_once: see `mockish.Mock`
+            return_each: see `mockish.Mock`
+            return_exception: see `mockish.Mock`
+            **kwargs: passed to `mockish.Mock`
+
+        Returns:
+            : The route's `Mock`
+        """
+        kwargs.setdefault("thread_safe", _HAS_CALL_HOOKS)
+        handler: mock.Mock = Mock(
+            return_value=return_value,
+            return_call=return_call,
+            return_once=return_once,
+            return_each=return_each,
+            return_exception=return_exception,
+            **kwargs,
+        )
+        self._routes.add(method, url, handler, body=body)
+        return handler
+
+    def _handle(
+        self,
+        request: httpx.Request,
+    ) -> Union[httpx.Response, Awaitable[httpx.Response]]:
+        route, params = self._routes.match(
+            request.method, str(request.url), request.content
+        )
+        if route is None:
+            return self._replay(request)
+
+        result: Any = route.call(request, **params)
+        if inspect.isawaitable(result):
+            return _to_response_async(result)
+        return _to_response(result)
+
+    def _replay(self, request: httpx.Request) -> httpx.Response:
+        data: Optional[models.ResponseData] = (
+            None
+            if self._cassette is None
+            else self._cassette.play(request.method, str(request.url), request.content)
+        )
+        if data is None:
+            raise LookupError(f"No route matches: {request.method} {request.url}")
+        return Response.from_data(data)
@@ -1,20 +1,435 @@
-from typing import Any, Callable, Dict, Optional, Sequence
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from datetime import timedelta
+from types import MappingProxyType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from unittest import mock
+from weakref import WeakKeyDictionary, ref
+
+from . import profiling
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI  # pylint: disable=import-error
+
+    from .clock import Latency
 
 __all__ = [
+    "patch",
     "Mock",
     "AsyncMock",
+    "FastMock",
+    "calls_by_thread",
+    "DependencyPatch",
     "patch_fastapi_dependencies",
 ]
 
+RECORD_FULL = "full"
+RECORD_COUNT = "count"
+
+EXHAUSTED_RAISE = "raise"
+EXHAUSTED_REPEAT_LAST = "repeat_last"
+EXHAUSTED_RETURN_VALUE = "return_value"
+_EXHAUSTED_POLICIES = (EXHAUSTED_RAISE, EXHAUSTED_REPEAT_LAST, EXHAUSTED_RETURN_VALUE)
+
+# `record`, `thread_safe`, and `profile` hook into how `mock` records and
+# executes calls, which is split into these methods from Python 3.8.
+_HAS_CALL_HOOKS: bool = hasattr(mock.CallableMixin, "_execute_mock_call")
+
+
+def _record_limit(record: Union[str, int]) -> Optional[int]:
+    # `None` keeps every call; `0` keeps none; `N` keeps the last N.
+    if record == RECORD_FULL:
+        return None
+    if record == RECORD_COUNT:
+        return 0
+    if isinstance(record, int) and not isinstance(record, bool) and record > 0:
+        return record
+    raise ValueError(
+        f"Expected `record` to be '{RECORD_FULL}', '{RECORD_COUNT}', "
+        f"or a positive integer; given: {record!r}",
+    )
+
+
+class _RecentCalls(deque):  # type: ignore[type-arg]
+    # the last N calls of a mock with `record=N`: `mock` appends to its call
+    # lists on every call, which a bounded `deque` keeps in O(1).
+
+    __hash__ = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, deque)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, deque)):
+            return list(self) != list(other)
+        return NotImplemented
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return mock._CallList(self)[index]
+        return super().__getitem__(index)
+
+    def __contains__(self, value: object) -> bool:
+        # `mock` also looks up a list of calls as a contiguous sub-list.
+        return mock._CallList(self).__contains__(value)
+
+    def __repr__(self) -> str:
+        return repr(mock._CallList(self))
+
+
+def _bound_call_lists(obj: mock.Mock) -> None:
+    limit: Optional[int] = obj.__dict__.get("_mockish_record_limit")
+    if limit is None:
+        return
+    for name in ("_mock_call_args_list", "_mock_mock_calls", "method_calls"):
+        obj.__dict__[name] = _RecentCalls(obj.__dict__[name], limit)
+
+
+def _raise_if_exception(value: Any) -> Any:
+    if isinstance(value, BaseException) or (
+        isinstance(value, type) and issubclass(value, BaseException)
+    ):
+        raise value
+    return value
+
+
+def _require_call_hooks(option: str) -> None:
+    if not _HAS_CALL_HOOKS:
+        raise ValueError(f"`{option}` requires Python 3.8 or later.")
+
+
+# Attributes set by `NonCallableMock._mock_add_spec`, except `_spec_set` and
+# `_spec_class` (the spec itself, for classes, which must not be kept alive);
+# `_spec_asyncs` is set from Python 3.8.
+_SPEC_ATTRIBUTES = ("_spec_signature", "_mock_methods", "_spec_asyncs")
+
+# (fingerprint, attributes)
+_SpecEntry = Tuple[Tuple[int, ...], Dict[str, Any]]
+# (as instance, eat self) -> entry
+_SpecEntries = Dict[Tuple[bool, bool], _SpecEntry]
+
+_SPEC_CACHE: "WeakKeyDictionary[Any, _SpecEntries]" = WeakKeyDictionary()
+_SPEC_CACHE_LOCK = threading.Lock()
+
+
+def _spec_fingerprint(spec: Any) -> Optional[Tuple[int, ...]]:
+    # Modules and classes are cached, as they are long-lived and commonly shared;
+    # adding, removing, or replacing attributes (of a class or any of its bases)
+    # changes the fingerprint.
+    if isinstance(spec, ModuleType):
+        return _namespace_fingerprint(vars(spec))
+    if isinstance(spec, type):
+        return tuple(
+            x for cls in spec.__mro__ for x in _namespace_fingerprint(vars(cls))
+        )
+    return None
+
+
+def _namespace_fingerprint(namespace: Mapping[str, Any]) -> Tuple[int, ...]:
+    # the identities of names and values, e.g., of a method replaced by `patch`.
+    return tuple(id(x) for item in namespace.items() for x in item)
+
+
+class _Sequence:
+    """A `side_effect` that returns each item of a (lazy) iterable in turn.
+
+    Items are pulled only as the mock is called; once exhausted,
+    `StopIteration` is raised, the last item is repeated,
+    or the mock's `return_value` is returned.
+    """
+
+    _MISSING = object()
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        exhausted: str = EXHAUSTED_RAISE,
+        lock: Optional[threading.Lock] = None,
+    ) -> None:
+        self._next: Callable[[], Any] = iter(items).__next__
+        self._exhausted: str = exhausted
+        self._last: Any = self._MISSING
+        self._lock: Optional[threading.Lock] = lock
+
+    def _next_item(self) -> Any:
+        try:
+            item: Any = self._next()
+        except StopIteration:
+            if self._exhausted == EXHAUSTED_RETURN_VALUE:
+                return mock.DEFAULT
+            if (
+                self._exhausted == EXHAUSTED_REPEAT_LAST
+                and self._last is not self._MISSING
+            ):
+                return self._last
+            raise
+        if self._exhausted == EXHAUSTED_REPEAT_LAST:
+            self._last = item
+        return item
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._lock is None:
+            return _raise_if_exception(self._next_item())
+        with self._lock:
+            item: Any = self._next_item()
+        return _raise_if_exception(item)
+
+
+class _Cycle:
+    """A `side_effect` that repeats a finite pattern, by index."""
+
+    def __init__(
+        self,
+        pattern: Sequence[Any],
+        lock: Optional[threading.Lock] = None,
+    ) -> None:
+        if not isinstance(pattern, Sequence):
+            raise TypeError(
+                f"Expected `return_cycle` to be a sequence; given: {type(pattern)}",
+            )
+        if not pattern:
+            raise ValueError("Expected `return_cycle` to be non-empty.")
+        self._pattern: Sequence[Any] = pattern
+        self._size: int = len(pattern)
+        self._index: int = 0
+        self._lock: Optional[threading.Lock] = lock
+
+    def _next_index(self) -> int:
+        i: int = self._index
+        self._index = 0 if i + 1 == self._size else i + 1
+        return i
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._lock is None:
+            return _raise_if_exception(self._pattern[self._next_index()])
+        with self._lock:
+            i: int = self._next_index()
+        return _raise_if_exception(self._pattern[i])
+
+
+class _Mock(mock.Mock):
+    def __init__(
+        self,
+        *args: Any,
+        record: Union[str, int] = RECORD_FULL,
+        thread_safe: bool = False,
+        profile: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
+        limit: Optional[int] = _record_limit(record)
+        if profile is None:
+            profile = profiling.profiler.enabled
+        for option, given in (
+            ("record", limit is not None),
+            ("thread_safe", thread_safe),
+            ("profile", profile),
+        ):
+            if given:
+                _require_call_hooks(option)
+
+        # set via `__dict__` to get around `spec_set` restrictions.
+        self.__dict__["_mockish_record_limit"] = limit
+        # one lock per tree of mocks, as calls are also recorded on parents.
+        self.__dict__["_mockish_lock"] = threading.Lock() if thread_safe else None
+        self.__dict__["_mockish_thread_calls"] = {}
+        # `True` until the first call, which resolves the mock's `MockProfile`.
+        self.__dict__["_mockish_profile"] = True if profile else None
+        super().__init__(*args, **kwargs)
+        _bound_call_lists(self)
+
+    def __repr__(self) -> str:
+        # e.g., `<Mock id=...>`, by the public name of the class.
+        name: str = type(self).__name__
+        text: str = super().__repr__()
+        return "<" + name.lstrip("_") + text[len(name) + 1 :]
+
+    def _mock_add_spec(
+        self,
+        spec: Any,
+        spec_set: Any,
+        _spec_as_instance: bool = False,
+        _eat_self: bool = False,
+    ) -> None:
+        # `dir()` and signature introspection of a spec are done once per spec.
+        fingerprint: Optional[Tuple[int, ...]] = _spec_fingerprint(spec)
+        if fingerprint is None:
+            super()._mock_add_spec(spec, spec_set, _spec_as_instance, _eat_self)
+            return
+
+        key: Tuple[bool, bool] = (_spec_as_instance, _eat_self)
+        with _SPEC_CACHE_LOCK:
+            cached: Optional[_SpecEntry] = _SPEC_CACHE.get(spec, {}).get(key)
+
+        if cached is None or cached[0] != fingerprint:
+            super()._mock_add_spec(spec, spec_set, _spec_as_instance, _eat_self)
+            with _SPEC_CACHE_LOCK:
+                _SPEC_CACHE.setdefault(spec, {})[key] = (
+                    fingerprint,
+                    {
+                        k: self.__dict__[k]
+                        for k in _SPEC_ATTRIBUTES
+                        if k in self.__dict__
+                    },
+                )
+            return
+
+        # the cached lists are never mutated by `mock`, so they are shared.
+        self.__dict__.update(cached[1])
+        self.__dict__["_spec_class"] = spec if isinstance(spec, type) else type(spec)
+        self.__dict__["_spec_set"] = spec_set
+
+    def _get_child_mock(self, **kwargs: Any) -> Any:
+        child = super()._get_child_mock(**kwargs)
+        if isinstance(child, _Mock):
+            child.__dict__["_mockish_record_limit"] = self._mockish_record_limit
+            child.__dict__["_mockish_lock"] = self._mockish_lock
+            child.__dict__["_mockish_profile"] = (
+                None if self._mockish_profile is None else True
+            )
+            _bound_call_lists(child)
+        return child
+
+    def _execute_mock_call(self, *args: Any, **kwargs: Any) -> Any:
+        profile: Any = self._mockish_profile
+        if profile is None:
+            return super()._execute_mock_call(*args, **kwargs)
+
+        if profile is True:
+            profile = profiling.profiler.profile(self._mockish_profile_name())
+            self.__dict__["_mockish_profile"] = profile
+
+        start: float = time.perf_counter()
+        try:
+            return super()._execute_mock_call(*args, **kwargs)
+        finally:
+            profile.add(time.perf_counter() - start)
+
+    def _mockish_profile_name(self) -> str:
+        # e.g., `requests.Session().get`, if `requests.Session` was patched.
+        name: str = self._extract_mock_name()
+        root: mock.Mock = self
+        while root._mock_new_parent is not None:
+            root = root._mock_new_parent
+        target: Optional[str] = root.__dict__.get("_mockish_patch_target")
+        if target is None:
+            return name
+        return target + name[len(root._extract_mock_name()) :]
+
+    def _increment_mock_call(self, *args: Any, **kwargs: Any) -> None:
+        lock: Optional[threading.Lock] = self._mockish_lock
+        if lock is None:
+            self._record_mock_call(args, kwargs)
+            return
+
+        with lock:
+            self._record_mock_call(args, kwargs)
+            limit: Optional[int] = self._mockish_record_limit
+            if limit != 0:
+                calls: List[Any] = self._mockish_thread_calls.setdefault(
+                    threading.get_ident(),
+                    [] if limit is None else _RecentCalls((), limit),
+                )
+                calls.append(mock.call(*args, **kwargs))
 
-class _AsyncMock(mock.Mock):
+    def _record_mock_call(self, args: Any, kwargs: Any) -> None:
+        super()._increment_mock_call(*args, **kwargs)
+
+        # the call lists are bounded by `_RecentCalls`; `call_args` is not.
+        node: Optional[mock.Mock] = self
+        while node is not None:
+            if node.__dict__.get("_mockish_record_limit") == 0:
+                node.__dict__["_mock_call_args"] = None
+            node = node._mock_new_parent
+
+    def reset_mock(self, *args: Any, **kwargs: Any) -> None:
+        super().reset_mock(*args, **kwargs)
+        _bound_call_lists(self)
+        self._mockish_thread_calls.clear()
+
+    def _assert_call_args_recorded(self) -> None:
+        if self._mockish_record_limit == 0:
+            raise ValueError(
+                f"Call arguments are not recorded with record='{RECORD_COUNT}'.",
+            )
+
+    def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
+        self._assert_call_args_recorded()
+        super().assert_called_with(*args, **kwargs)
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        self._assert_call_args_recorded()
+        super().assert_called_once_with(*args, **kwargs)
+
+    def assert_any_call(self, *args: Any, **kwargs: Any) -> None:
+        self._assert_call_args_recorded()
+        super().assert_any_call(*args, **kwargs)
+
+    def assert_has_calls(self, calls: Sequence[Any], any_order: bool = False) -> None:
+        self._assert_call_args_recorded()
+        super().assert_has_calls(calls, any_order=any_order)
+
+
+class _AsyncMock(_Mock):
     # AsyncMock for Python 3.7
     # (added to stdlib in Python 3.8)
 
-    # pylint: disable=invalid-overridden-method, useless-parent-delegation
+    def __init__(
+        self,
+        *args: Any,
+        latency: Optional["Latency"] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.__dict__["_mockish_latency"] = latency
+        super().__init__(*args, **kwargs)
+
+    def _get_child_mock(self, **kwargs: Any) -> Any:
+        child = super()._get_child_mock(**kwargs)
+        if isinstance(child, _AsyncMock):
+            child.__dict__["_mockish_latency"] = self._mockish_latency
+        return child
+
+    # pylint: disable=invalid-overridden-method
     async def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return super().__call__(*args, **kwargs)
+        latency: Optional["Latency"] = self._mockish_latency
+        if latency is None:
+            return super().__call__(*args, **kwargs)
+
+        # imported here to keep `import mockish` light; loaded once awaited anyway.
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+
+        from .clock import sample_latency
+        from .models import Response
+
+        delay: timedelta = sample_latency(latency)
+
+        # the call is recorded (and its result computed) when awaited,
+        # and the result or exception is delivered after the delay.
+        try:
+            result: Any = super().__call__(*args, **kwargs)
+        finally:
+            await asyncio.sleep(delay.total_seconds())
+
+        if isinstance(result, Response):
+            result = result._clone()
+            result.elapsed = delay
+        return result
 
 
 def _build_mock(
@@ -23,45 +438,84 @@ def _build_mock(
     return_value: Optional[Any] = None,
     return_call: Optional[Callable[..., Optional[Any]]] = None,
     return_once: Optional[Any] = None,
-    return_each: Optional[Sequence[Any]] = None,
+    return_each: Optional[Iterable[Any]] = None,
+    return_cycle: Optional[Sequence[Any]] = None,
     return_exception: Optional[Exception] = None,
     side_effect: Optional[Any] = None,
+    exhausted: str = EXHAUSTED_RAISE,
+    thread_safe: bool = False,
     **kwargs: Any,
 ) -> mock.Mock:
+    if exhausted not in _EXHAUSTED_POLICIES:
+        raise ValueError(
+            f"Expected `exhausted` to be one of {list(_EXHAUSTED_POLICIES)}; "
+            f"given: {exhausted!r}",
+        )
+
+    is_sequence: bool = return_once is not None or return_each is not None
+
+    if exhausted != EXHAUSTED_RAISE and not is_sequence:
+        raise ValueError("`exhausted` applies only to `return_once` and `return_each`.")
+
+    # `return_value` is the fallback of an exhausted sequence.
+    fallback: bool = exhausted == EXHAUSTED_RETURN_VALUE and return_value is not None
+
     if (
         sum(
             [
-                bool(return_value),
-                bool(return_once),
-                bool(return_each),
-                bool(return_call),
-                bool(return_exception),
-                bool(side_effect),
+                return_value is not None and not fallback,
+                return_once is not None,
+                return_each is not None,
+                return_cycle is not None,
+                return_call is not None,
+                return_exception is not None,
+                side_effect is not None,
             ],
         )
         > 1
     ):
         raise ValueError("Specify exactly one argument.")
 
-    if side_effect:
+    lock: Optional[threading.Lock] = threading.Lock() if thread_safe else None
+
+    if side_effect is not None:
         kwargs["side_effect"] = side_effect
 
-    elif return_value:
+    elif is_sequence:
+        # one of `return_once` and `return_each` is given (see above).
+        items: Iterable[Any] = [return_once] if return_each is None else return_each
+        if lock is None and exhausted == EXHAUSTED_RAISE:
+            # iterated by `mock` itself, as before.
+            kwargs["side_effect"] = items
+        else:
+            kwargs["side_effect"] = _Sequence(items, exhausted=exhausted, lock=lock)
+        if fallback:
+            kwargs["return_value"] = return_value
+
+    elif return_value is not None:
         kwargs["side_effect"] = lambda *args, **kwargs: return_value
 
-    elif return_call:
+    elif return_call is not None:
         kwargs["side_effect"] = return_call
 
-    elif return_once:
-        kwargs["side_effect"] = [return_once]
-
-    elif return_each:
-        kwargs["side_effect"] = return_each
+    elif return_cycle is not None:
+        kwargs["side_effect"] = _Cycle(return_cycle, lock=lock)
 
-    elif return_exception:
+    elif return_exception is not None:
         kwargs["side_effect"] = return_exception
 
-    return _AsyncMock(**kwargs) if is_async else mock.Mock(**kwargs)
+    effect: Any = kwargs.get("side_effect")
+    if (
+        lock is not None
+        and effect is not None
+        and not callable(effect)
+        and not isinstance(effect, BaseException)
+    ):
+        # the stdlib iterates `side_effect` without synchronization.
+        kwargs["side_effect"] = _Sequence(effect, lock=lock)
+
+    kwargs["thread_safe"] = thread_safe
+    return _AsyncMock(**kwargs) if is_async else _Mock(**kwargs)
 
 
 def Mock(
@@ -69,18 +523,45 @@ def Mock(
     return_value: Optional[Any] = None,
     return_call: Optional[Callable[..., Optional[Any]]] = None,
     return_once: Optional[Any] = None,
-    return_each: Optional[Sequence[Any]] = None,
+    return_each: Optional[Iterable[Any]] = None,
+    return_cycle: Optional[Sequence[Any]] = None,
     return_exception: Optional[Exception] = None,
+    exhausted: str = EXHAUSTED_RAISE,
+    record: Union[str, int] = RECORD_FULL,
+    thread_safe: bool = False,
+    profile: Optional[bool] = None,
     **kwargs: Any,
 ) -> mock.Mock:
     """A thin wrapper around [unittest.mock.Mock](https://docs.python.org/3/library/unittest.mock.html#the-mock-class) to abstract away the use of `side_effect` in favor of these explicit `return_X` parameters:
 
+    Only one `return_X` may be given; a `None` argument is ignored, but any other
+    value is used, even if falsy (e.g., `0`, `""`, or a 404 response).
+
     Args:
         return_value: return the given value
         return_call: return the value returned by the given callable
         return_once: return the given value exactly once
-        return_each: consecutively return each element of the given iterable
+        return_each: consecutively return each element of the given iterable;
+            lazy iterables (e.g., generators) are consumed only as called
+        return_cycle: repeatedly return each element of the given sequence, in order
         return_exception: raise the given exception
+        exhausted: what `return_once` and `return_each` do once exhausted;
+            `'raise'` raises `StopIteration` (default), `'repeat_last'` repeats
+            the last value, and `'return_value'` returns `return_value`
+        record: how calls are recorded; `'full'` keeps every call (default),
+            an integer `N` keeps only the last `N` calls,
+            and `'count'` keeps only `call_count` (Python 3.8+).
+        thread_safe: safe to call from many threads at once; `return_once`
+            and `return_each` hand out each value exactly once, calls are
+            recorded atomically, and attributed to the calling thread
+            (see `calls_by_thread`) (Python 3.8+).
+        profile: time each call of the side effect (e.g., `return_call`)
+            in `mockish.profiling.profiler`; defaults to `profiler.enabled`
+            (see `pytest --mockish-profile`) (Python 3.8+).
+
+    Raises:
+        ValueError: raised if more than one `return_X` is given, or if
+            `record`, `thread_safe`, or `profile` is given before Python 3.8
 
     Returns:
         : A `Mock` object
@@ -122,12 +603,34 @@ def Mock(
         ...
         StopIteration
 
+        - `return_cycle`
+        >>> obj = Mock(return_cycle=[1, 2])
+        >>> [obj() for _ in range(5)]
+        [1, 2, 1, 2, 1]
+
+        - `exhausted`
+        >>> obj = Mock(return_each=(x for x in [1, 2]), exhausted='repeat_last')
+        >>> [obj() for _ in range(4)]
+        [1, 2, 2, 2]
+        >>> obj = Mock(return_once=1, return_value=0, exhausted='return_value')
+        >>> [obj() for _ in range(3)]
+        [1, 0, 0]
+
         - `return_exception`:
         >>> obj = Mock(return_exception=ValueError("hello world"))
         >>> obj()
         Traceback (most recent call last):
         ...
         ValueError: hello world
+
+        - `record`
+        >>> obj = Mock(return_value='hello world', record=2)
+        >>> for i in range(1000):
+        ...     _ = obj(i)
+        >>> obj.call_count
+        1000
+        >>> obj.call_args_list
+        [call(998), call(999)]
     """
     return _build_mock(
         is_async=False,
@@ -135,7 +638,12 @@ def Mock(
         return_call=return_call,
         return_once=return_once,
         return_each=return_each,
+        return_cycle=return_cycle,
         return_exception=return_exception,
+        exhausted=exhausted,
+        record=record,
+        thread_safe=thread_safe,
+        profile=profile,
         **kwargs,
     )
 
@@ -145,14 +653,40 @@ def AsyncMock(
     return_value: Optional[Any] = None,
     return_call: Optional[Callable[..., Optional[Any]]] = None,
     return_once: Optional[Any] = None,
-    return_each: Optional[Sequence[Any]] = None,
+    return_each: Optional[Iterable[Any]] = None,
+    return_cycle: Optional[Sequence[Any]] = None,
     return_exception: Optional[Exception] = None,
+    exhausted: str = EXHAUSTED_RAISE,
+    record: Union[str, int] = RECORD_FULL,
+    thread_safe: bool = False,
+    profile: Optional[bool] = None,
+    latency: Optional["Latency"] = None,
     **kwargs: Any,
 ) -> mock.Mock:
     """Same as `mockish.Mock`, but returns an *async* `Mock`.
 
+    Args:
+        latency: simulated latency of each call; a fixed value (seconds or
+            `timedelta`) or a callable sampling one. The result is delivered
+            after `asyncio.sleep`-ing for it, so it runs in no time with a
+            `mockish.clock.VirtualClock`. Returned `mockish` responses are
+            copies with `elapsed` set to the latency.
+
     Returns:
         : An async `Mock` object
+
+    Examples:
+        >>> import asyncio
+        >>> from mockish import AsyncMock
+        >>> from mockish.clock import VirtualClock
+        >>> from mockish.requests import Response
+        >>> get = AsyncMock(return_value=Response.from_dict({}), latency=30)
+
+        >>> clock = VirtualClock(start=0)
+        >>> clock.run(get()).elapsed.total_seconds()
+        30.0
+        >>> clock.time()
+        30.0
     """
     return _build_mock(
         is_async=True,
@@ -160,18 +694,486 @@ def AsyncMock(
         return_call=return_call,
         return_once=return_once,
         return_each=return_each,
+        return_cycle=return_cycle,
         return_exception=return_exception,
+        exhausted=exhausted,
+        record=record,
+        thread_safe=thread_safe,
+        profile=profile,
+        latency=latency,
         **kwargs,
     )
 
 
+class _FastMock:
+    """A lean callable mock; each subclass implements `__call__` for one mode."""
+
+    __slots__ = ("call_count", "_args", "_kwargs")
+
+    def __init__(self) -> None:
+        self.call_count: int = 0
+        self._args: Optional[Tuple[Any, ...]] = None
+        self._kwargs: Optional[Dict[str, Any]] = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        self._args = args
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"<{FastMock.__name__} id='{id(self)}'>"
+
+    @property
+    def called(self) -> bool:
+        return self.call_count > 0
+
+    @property
+    def call_args(self) -> Optional[Any]:
+        """The arguments of the last call, as a `unittest.mock.call`."""
+        if self._args is None:
+            return None
+        return mock.call(*self._args, **(self._kwargs or {}))
+
+    def reset_mock(self) -> None:
+        self.call_count = 0
+        self._args = None
+        self._kwargs = None
+
+    def assert_called(self) -> None:
+        if not self.call_count:
+            raise AssertionError("Expected mock to have been called.")
+
+    def assert_not_called(self) -> None:
+        if self.call_count:
+            raise AssertionError(
+                f"Expected mock to not have been called. "
+                f"Called {self.call_count} times.",
+            )
+
+    def assert_called_once(self) -> None:
+        if self.call_count != 1:
+            raise AssertionError(
+                f"Expected mock to have been called once. "
+                f"Called {self.call_count} times.",
+            )
+
+    def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
+        expected: Any = mock.call(*args, **kwargs)
+        if self.call_args is None:
+            raise AssertionError(f"Expected call: {expected}\nNot called")
+        if self.call_args != expected:
+            raise AssertionError(
+                f"Expected call: {expected}\nActual call: {self.call_args}",
+            )
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        self.assert_called_once()
+        self.assert_called_with(*args, **kwargs)
+
+
+class _FastReturnValue(_FastMock):
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        super().__init__()
+        self._value: Any = value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        self._args = args
+        self._kwargs = kwargs
+        return self._value
+
+
+class _FastReturnCall(_FastMock):
+    __slots__ = ("_func",)
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        super().__init__()
+        self._func: Callable[..., Any] = func
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        self._args = args
+        self._kwargs = kwargs
+        return self._func(*args, **kwargs)
+
+
+class _FastReturnEach(_FastMock):
+    __slots__ = ("_next",)
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        super().__init__()
+        self._next: Callable[[], Any] = iter(values).__next__
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        self._args = args
+        self._kwargs = kwargs
+        return _raise_if_exception(self._next())
+
+
+class _FastReturnCycle(_FastMock):
+    __slots__ = ("_pattern", "_size")
+
+    def __init__(self, pattern: Sequence[Any]) -> None:
+        super().__init__()
+        if not pattern:
+            raise ValueError("Expected `return_cycle` to be non-empty.")
+        self._pattern: Sequence[Any] = pattern
+        self._size: int = len(pattern)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        self._args = args
+        self._kwargs = kwargs
+        return _raise_if_exception(self._pattern[(self.call_count - 1) % self._size])
+
+
+class _FastReturnException(_FastMock):
+    __slots__ = ("_exception",)
+
+    def __init__(self, exception: BaseException) -> None:
+        super().__init__()
+        self._exception: BaseException = exception
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        self._args = args
+        self._kwargs = kwargs
+        raise self._exception
+
+
+def FastMock(
+    *,
+    return_value: Optional[Any] = None,
+    return_call: Optional[Callable[..., Optional[Any]]] = None,
+    return_once: Optional[Any] = None,
+    return_each: Optional[Iterable[Any]] = None,
+    return_cycle: Optional[Sequence[Any]] = None,
+    return_exception: Optional[BaseException] = None,
+) -> Any:
+    """A lean alternative to `mockish.Mock` for calls in hot loops.
+
+    Takes the same `return_X` parameters as `mockish.Mock` (but not `exhausted`),
+    but each call only counts itself and keeps its arguments; there is no
+    call history, no child mocks, and no `spec`. Calls are over 10x cheaper.
+    Supports `call_count`, `called`, `call_args` (last call only),
+    `reset_mock`, and `assert_called`, `assert_not_called`, `assert_called_once`,
+    `assert_called_with`, `assert_called_once_with`.
+
+    > Note: not thread-safe.
+
+    Returns:
+        : A `FastMock` object; returns `None` when called if no `return_X` is given
+
+    Examples:
+        >>> from mockish import FastMock
+        >>> obj = FastMock(return_each=[1, 2, 3])
+        >>> [obj(i) for i in range(3)]
+        [1, 2, 3]
+        >>> obj.call_count
+        3
+        >>> obj.call_args
+        call(2)
+        >>> obj.assert_called_with(2)
+    """
+    given: Dict[str, Any] = {
+        k: v
+        for k, v in (
+            ("return_value", return_value),
+            ("return_call", return_call),
+            ("return_once", return_once),
+            ("return_each", return_each),
+            ("return_cycle", return_cycle),
+            ("return_exception", return_exception),
+        )
+        if v is not None
+    }
+    if len(given) > 1:
+        raise ValueError("Specify exactly one argument.")
+
+    if return_value is not None:
+        return _FastReturnValue(return_value)
+    if return_call is not None:
+        return _FastReturnCall(return_call)
+    if return_once is not None:
+        return _FastReturnEach([return_once])
+    if return_each is not None:
+        return _FastReturnEach(return_each)
+    if return_cycle is not None:
+        return _FastReturnCycle(return_cycle)
+    if return_exception is not None:
+        return _FastReturnException(return_exception)
+    return _FastMock()
+
+
+def _set_patch_target(new: Any, target: str) -> None:
+    if isinstance(new, _Mock):
+        new.__dict__["_mockish_patch_target"] = target
+
+
+def _qualified_name(obj: Any) -> str:
+    if isinstance(obj, ModuleType):
+        return obj.__name__
+    if not isinstance(obj, type) and not callable(obj):
+        obj = type(obj)
+    module: Optional[str] = getattr(obj, "__module__", None)
+    name: str = getattr(obj, "__qualname__", type(obj).__qualname__)
+    return name if module in (None, "builtins") else f"{module}.{name}"
+
+
+class _Patch:
+    """`unittest.mock.patch`, which also names `mockish` mocks patched in
+    after their target, e.g., in `mockish.profiling` reports.
+
+    Examples:
+        >>> import json
+        >>> from mockish import Mock, patch
+        >>> with patch.object(json, 'dumps', Mock(return_value='{}')):
+        ...     json.dumps({'hello': 'world'})
+        '{}'
+    """
+
+    # a class, so not bound as a method.
+    dict = mock.patch.dict
+    stopall = staticmethod(mock.patch.stopall)
+
+    @property
+    def TEST_PREFIX(self) -> str:
+        return mock.patch.TEST_PREFIX
+
+    @TEST_PREFIX.setter
+    def TEST_PREFIX(self, value: str) -> None:
+        mock.patch.TEST_PREFIX = value
+
+    def __call__(
+        self, target: Any, new: Any = mock.DEFAULT, *args: Any, **kwargs: Any
+    ) -> Any:
+        if isinstance(target, str):
+            _set_patch_target(new, target)
+        return mock.patch(target, new, *args, **kwargs)
+
+    def object(  # noqa: A003
+        self,
+        target: Any,
+        attribute: str,
+        new: Any = mock.DEFAULT,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        _set_patch_target(new, f"{_qualified_name(target)}.{attribute}")
+        return mock.patch.object(target, attribute, new, *args, **kwargs)
+
+    def multiple(self, target: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(target, str):
+            for k, v in kwargs.items():
+                _set_patch_target(v, f"{target}.{k}")
+        return mock.patch.multiple(target, *args, **kwargs)
+
+
+patch = _Patch()
+
+
+def calls_by_thread(obj: mock.Mock) -> Dict[int, List[Any]]:
+    """Return the calls of a `thread_safe` mock, by calling thread identifier.
+
+    Args:
+        obj: a mock created with `thread_safe=True`
+
+    Raises:
+        ValueError: raised if `obj` is not thread-safe, or does not record calls
+
+    Returns:
+        : A mapping of `threading.get_ident()` to the calls made by that thread,
+            subject to the mock's `record` limit.
+
+    Examples:
+        >>> import threading
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from mockish import Mock, calls_by_thread
+        >>> obj = Mock(return_each=range(100), thread_safe=True)
+        >>> with ThreadPoolExecutor(max_workers=4) as pool:
+        ...     results = list(pool.map(lambda i: obj(i), range(100)))
+        >>> sorted(results) == list(range(100))
+        True
+        >>> sum(len(x) for x in calls_by_thread(obj).values())
+        100
+    """
+    if not isinstance(obj, _Mock) or obj._mockish_lock is None:
+        raise ValueError("Calls are attributed to threads only with thread_safe=True.")
+    obj._assert_call_args_recorded()
+    with obj._mockish_lock:
+        return {k: list(v) for k, v in obj._mockish_thread_calls.items()}
+
+
+# root app -> (number of routes of each app in its tree, apps in its tree);
+# apps are weakly referenced, as the root is among them.
+_APP_TREES: "WeakKeyDictionary[Any, Tuple[Tuple[int, ...], List[ref[Any]]]]" = (
+    WeakKeyDictionary()
+)
+_APP_TREES_LOCK = threading.Lock()
+
+
+def _walk_fastapi_apps(app: "FastAPI", apps: List["FastAPI"]) -> None:
+    from fastapi import FastAPI  # pylint: disable=import-error
+    from starlette.routing import Mount  # pylint: disable=import-error
+
+    apps.append(app)
+    for x in app.routes:
+        if isinstance(x, Mount) and isinstance(x.app, FastAPI):
+            _walk_fastapi_apps(x.app, apps)
+
+
+def _fastapi_app_tree(app: "FastAPI") -> List["FastAPI"]:
+    """Return the app and every `FastAPI` app mounted within it, recursively.
+
+    Trees are cached; adding or removing routes (or mounts) of any app
+    in a tree invalidates it, which is checked without walking the routes.
+    """
+    with _APP_TREES_LOCK:
+        cached: Optional[Tuple[Tuple[int, ...], List[ref[Any]]]] = _APP_TREES.get(
+            app,
+        )
+    if cached is not None:
+        apps: List[Any] = [x() for x in cached[1]]
+        if all(x is not None for x in apps) and cached[0] == tuple(
+            len(x.routes) for x in apps
+        ):
+            return apps
+
+    apps = []
+    _walk_fastapi_apps(app, apps)
+    with _APP_TREES_LOCK:
+        _APP_TREES[app] = (
+            tuple(len(x.routes) for x in apps),
+            [ref(x) for x in apps],
+        )
+    return apps
+
+
+_NO_OVERRIDES: Mapping[Any, Any] = MappingProxyType({})
+
+
+class _ContextOverrides(dict):  # type: ignore[type-arg]
+    """An app's `dependency_overrides`, with a context-local layer on top.
+
+    FastAPI resolves an override with `.get(dependency, dependency)`,
+    which looks in the layer of the current context first, then in the
+    app-global overrides (the dict itself). Each `asyncio` task (or thread)
+    has its own context, so concurrent tests against one app can each
+    see their own overrides.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.local: ContextVar[Mapping[Any, Any]] = ContextVar(
+            "mockish_dependency_overrides",
+            default=_NO_OVERRIDES,
+        )
+
+    def __bool__(self) -> bool:
+        # FastAPI skips the lookup of overrides when they are empty.
+        return bool(self.local.get()) or super().__len__() > 0
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.local.get() or super().__contains__(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        local: Mapping[Any, Any] = self.local.get()
+        if key in local:
+            return local[key]
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        local: Mapping[Any, Any] = self.local.get()
+        if key in local:
+            return local[key]
+        return super().get(key, default)
+
+
+def _context_overrides(app: "FastAPI") -> _ContextOverrides:
+    """Return the overrides of `app`, replaced with a `_ContextOverrides` if needed."""
+    with _APP_TREES_LOCK:
+        current: Dict[Any, Any] = app.dependency_overrides
+        if not isinstance(current, _ContextOverrides):
+            current = _ContextOverrides(current)
+            app.dependency_overrides = current
+        return current
+
+
+class DependencyPatch:
+    """The overrides changed by `patch_fastapi_dependencies`, which can be restored.
+
+    Use as a context manager, or call `restore`, to undo exactly the changes made,
+    in O(changes).
+    """
+
+    _MISSING = object()
+
+    def __init__(self) -> None:
+        # (app, dependency, previous override or `_MISSING`); restored into the
+        # app's overrides as they are then, as a `local` patch replaces them.
+        self._changes: List[Tuple["FastAPI", Any, Any]] = []
+        # context-local layers set, with the tokens to reset them
+        self._tokens: List[Tuple[ContextVar[Mapping[Any, Any]], Token[Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._changes) + len(self._tokens)
+
+    def __enter__(self) -> "DependencyPatch":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.restore()
+
+    def _set(self, app: "FastAPI", key: Any, value: Any) -> None:
+        overrides: Dict[Any, Any] = app.dependency_overrides
+        # `dict.get`, as the context-local layer is not app-global.
+        self._changes.append((app, key, dict.get(overrides, key, self._MISSING)))
+        overrides[key] = value
+
+    def _delete(self, app: "FastAPI", key: Any) -> None:
+        previous: Any = app.dependency_overrides.pop(key)
+        self._changes.append((app, key, previous))
+
+    def _set_local(
+        self,
+        overrides: _ContextOverrides,
+        layer: Dict[Any, Any],
+    ) -> None:
+        self._tokens.append((overrides.local, overrides.local.set(layer)))
+
+    def restore(self) -> None:
+        """Undo the changes, latest first; restoring again does nothing.
+
+        Raises:
+            ValueError: raised if context-local overrides are restored
+                in a different context than they were set in
+        """
+        while self._tokens:
+            var, token = self._tokens.pop()
+            var.reset(token)
+        while self._changes:
+            app, key, previous = self._changes.pop()
+            overrides: Dict[Any, Any] = app.dependency_overrides
+            if previous is self._MISSING:
+                overrides.pop(key, None)
+            else:
+                overrides[key] = previous
+
+
 def patch_fastapi_dependencies(
     *args: "FastAPI",
     overrides: Optional[Dict[Callable[..., Any], Callable[..., Any]]],
     remove: bool = False,
-) -> None:
+    local: bool = False,
+) -> DependencyPatch:
     """Recursively patch dependencies of `FastAPI` instance(s).
 
+    The tree of mounted apps is cached, so repeated calls on the same app
+    only visit its apps, not its routes.
+
     [Read about FastAPI test dependencies.](https://fastapi.tiangolo.com/advanced/testing-dependencies/)
     > Note: `fastapi` must be installed.
 
@@ -179,12 +1181,16 @@ def patch_fastapi_dependencies(
         *args: FastAPI instance(s) to patch
         overrides: A mapping of overrides, or `None` to remove all
         remove: Remove the provided overrides
+        local: Patch only the current context (e.g., `asyncio` task or thread);
+            the overrides are looked up before, and hide, the app-global ones.
+            With `None` or `remove`, only context-local overrides are removed.
 
     Raises:
         TypeError: raised if any of `args` is not a FastAPI instance
 
     Returns:
-        : No value returned
+        : A `DependencyPatch`, which restores the overrides as they were
+            when used as a context manager or when `restore`d.
 
     Examples:
         ```py
@@ -206,28 +1212,87 @@ def patch_fastapi_dependencies(
 
         return TestClient(app)
         ```
+
+        Or, restored at the end of each test:
+        ```py
+        @pytest.fixture
+        def client() -> Iterator[TestClient]:
+            with mockish.patch_fastapi_dependencies(
+                app,
+                overrides={
+                    get_app_settings: lambda: app_settings,
+                },
+            ):
+                yield TestClient(app)
+        ```
+
+        Or, isolated per task, for concurrent tests against one app:
+        ```py
+        async def scenario(settings: AppSettings) -> None:
+            with mockish.patch_fastapi_dependencies(
+                app,
+                overrides={get_app_settings: lambda: settings},
+                local=True,
+            ):
+                async with httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=app),
+                    base_url="http://test",
+                ) as client:
+                    ...
+
+        async with anyio.create_task_group() as tg:
+            for settings in scenarios:
+                tg.start_soon(scenario, settings)
+        ```
     """
     from fastapi import FastAPI  # pylint: disable=import-error
-    from starlette.routing import Mount  # pylint: disable=import-error
 
     for x in args:
         if not isinstance(x, FastAPI):
             raise TypeError(f"Expected type 'FastAPI'; given: {type(x)}")
 
-        if overrides is None:
-            x.dependency_overrides.clear()
-        elif remove:
+    patch = DependencyPatch()
+
+    try:
+        for x in args:
+            for app in _fastapi_app_tree(x):
+                if local:
+                    _patch_local(patch, app, overrides, remove)
+                    continue
+
+                if overrides is None:
+                    for k in list(app.dependency_overrides):
+                        patch._delete(app, k)
+                elif remove:
+                    for k in overrides:
+                        patch._delete(app, k)
+                else:
+                    for k, v in overrides.items():
+                        patch._set(app, k, v)
+    except BaseException:
+        # e.g., removing an override that is not set; leave no partial changes.
+        patch.restore()
+        raise
+
+    return patch
+
+
+def _patch_local(
+    patch: DependencyPatch,
+    app: "FastAPI",
+    overrides: Optional[Dict[Callable[..., Any], Callable[..., Any]]],
+    remove: bool,
+) -> None:
+    current: _ContextOverrides = _context_overrides(app)
+
+    # copied, not changed in place, as other contexts may share the layer.
+    layer: Dict[Any, Any] = {}
+    if overrides is not None:
+        layer.update(current.local.get())
+        if remove:
             for k in overrides:
-                del x.dependency_overrides[k]
+                del layer[k]
         else:
-            x.dependency_overrides.update(overrides)
+            layer.update(overrides)
 
-        patch_fastapi_dependencies(
-            *[
-                y.app
-                for y in x.routes
-                if isinstance(y, Mount) and isinstance(y.app, FastAPI)
-            ],
-            overrides=overrides,
-            remove=remove,
-        )
+    patch._set_local(current, layer)
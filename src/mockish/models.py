@@ -1,22 +1,266 @@
 from __future__ import annotations
 
-import json
+import codecs
+import copy
+import hashlib
+import itertools
+import mimetypes
+import mmap as mmaplib
+import os
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
-from typing import Any, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakValueDictionary
 
 from . import constants
+from .cache import fixture_cache
+from .compression import compress
+from .serializers import JsonSerializer, get_json_serializer
+
+if TYPE_CHECKING:
+    from .clock import Latency
 
 T = TypeVar("T", bound="Response")
 
+ByteChunks = Union[Iterable[bytes], AsyncIterable[bytes]]
+
+Binary = Union[bytes, memoryview]
+
+Content = Union[str, bytes, bytearray, memoryview]
+"""Text, or binary content: `bytes`, `bytearray`, `memoryview`, or any other object
+supporting the buffer protocol (e.g., `array.array`, `mmap.mmap`)."""
+
+
+def _nbytes(content: Binary) -> int:
+    return content.nbytes if isinstance(content, memoryview) else len(content)
+
+
+def _as_binary(content: Any) -> Binary:
+    """Return read-only binary content as-is, or as a flat view of its bytes; writable
+    (e.g., `bytearray`) or non-contiguous buffers are copied to `bytes`."""
+    if isinstance(content, bytes):
+        return content
+    try:
+        view: memoryview = (
+            content if isinstance(content, memoryview) else memoryview(content)
+        )
+    except TypeError:
+        raise TypeError(
+            f"Expected `content` to be a str or bytes-like; given: {type(content)}",
+        ) from None
+    if not view.readonly or not view.c_contiguous:
+        # a writable buffer may change after the response (and its clones) is made.
+        return view.tobytes()
+    if view.ndim == 1 and view.format == "B":
+        return view
+    return view.cast("B")
+
+
+def _encode_json(serialized: str | bytes, encoding: str | None) -> bytes:
+    if isinstance(serialized, bytes):
+        if not encoding or codecs.lookup(encoding).name == "utf-8":
+            return serialized
+        serialized = serialized.decode()
+    return serialized.encode(encoding) if encoding else serialized.encode()
+
+
+class LazyJson:
+    """JSON content serialized from an object when first read, at most once.
+
+    Args:
+        obj: object to serialize
+        serializer: serializes `obj` to JSON
+        encoding: encoding of the content; defaults to UTF-8
+    """
+
+    def __init__(
+        self,
+        obj: Any,
+        serializer: JsonSerializer,
+        encoding: str | None = None,
+    ) -> None:
+        self.obj: Any = obj
+        self._serializer: JsonSerializer = serializer
+        self._encoding: str | None = encoding
+        self._content: bytes | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # locks cannot be pickled; a new one is created when unpickled.
+        state: dict[str, Any] = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def encode(self) -> bytes:
+        if self._content is None:
+            with self._lock:
+                if self._content is None:
+                    self._content = _encode_json(
+                        self._serializer(self.obj),
+                        self._encoding,
+                    )
+        return self._content
+
+    def copy(self) -> Any:
+        """Return an independent copy of the object, without a JSON round-trip."""
+        return copy.deepcopy(self.obj)
+
 
 @dataclass
 class ResponseData:
     status_code: int
     headers: dict[str, str]
+    content: Binary | None
+    elapsed: timedelta | None
+    # chunks streamed lazily in place of `content`; consumed once.
+    stream: ByteChunks | None = None
+    # serialized in place of `content` when first read; see `from_dict(lazy=True)`.
+    lazy: LazyJson | None = None
+
+
+def _materialize(data: ResponseData) -> ResponseData:
+    """Return `data` with lazy content serialized, and its `Content-Length` set."""
+    if data.lazy is None:
+        return data
+    content: bytes = data.lazy.encode()
+    headers: dict[str, str] = dict(data.headers)
+    headers.setdefault("Content-Length", str(len(content)))
+    return replace(data, headers=headers, content=content, lazy=None)
+
+
+_TemplateKey = Tuple[int, Tuple[Tuple[str, str], ...], bytes, Optional[timedelta]]
+
+_TEMPLATES: WeakValueDictionary[_TemplateKey, ResponseTemplate] = WeakValueDictionary()
+_TEMPLATE_CONTENTS: WeakValueDictionary[bytes, ResponseTemplate] = WeakValueDictionary()
+_TEMPLATES_LOCK = threading.Lock()
+
+
+def _sample_latency(latency: Latency) -> timedelta:
+    # imported here, as `mockish.clock` loads `asyncio`.
+    from .clock import sample_latency  # pylint: disable=import-outside-toplevel
+
+    return sample_latency(latency)
+
+
+def _content_encoding(headers: dict[str, str]) -> str | None:
+    """Return the `Content-Encoding` of content that clients must decode, if any."""
+    for k, v in headers.items():
+        if k.lower() == "content-encoding" and v.lower() != "identity":
+            return v
+    return None
+
+
+def _content_digest(content: bytes | None) -> bytes:
+    return hashlib.blake2b(content or b"", digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class ResponseTemplate:
+    """An immutable response that is prepared once and cloned many times.
+
+    Templates are interned: identical payloads share one template,
+    and templates with identical content share one `bytes` object.
+
+    Examples:
+        >>> from mockish.models import ResponseData, ResponseTemplate
+        >>> from mockish.requests import Response
+        >>> template = ResponseTemplate.from_data(
+        ...     ResponseData(
+        ...         status_code=200,
+        ...         headers={"Content-Type": "application/json"},
+        ...         content=b'{"hello": "world"}',
+        ...         elapsed=None,
+        ...     ),
+        ... )
+        >>> resp = template.build(Response)
+        >>> resp.json()
+        {'hello': 'world'}
+        >>> resp is template.build(Response)
+        False
+    """
+
+    status_code: int
+    headers: Tuple[Tuple[str, str], ...]
     content: bytes | None
     elapsed: timedelta | None
+    _prototypes: dict[type[Response], Response] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        hash=False,
+    )
+
+    @classmethod
+    def from_data(cls, data: ResponseData) -> ResponseTemplate:
+        """Return the (interned) template of the given response data.
+
+        Raises:
+            ValueError: raised if `data` is streamed, as streams are consumed once
+        """
+        if data.stream is not None:
+            raise ValueError("Cannot create a template from a streamed response.")
+
+        data = _materialize(data)
+        content: bytes | None = bytes(data.content) if data.content else None
+        digest: bytes = _content_digest(content)
+        key: _TemplateKey = (
+            data.status_code,
+            tuple(data.headers.items()),
+            digest,
+            data.elapsed,
+        )
+
+        with _TEMPLATES_LOCK:
+            template: ResponseTemplate | None = _TEMPLATES.get(key)
+            if template is None:
+                same_content: ResponseTemplate | None = _TEMPLATE_CONTENTS.get(digest)
+                if same_content is not None:
+                    content = same_content.content
+                template = cls(
+                    status_code=data.status_code,
+                    headers=key[1],
+                    content=content,
+                    elapsed=data.elapsed,
+                )
+                _TEMPLATES[key] = template
+                _TEMPLATE_CONTENTS.setdefault(digest, template)
+            return template
+
+    def to_data(self) -> ResponseData:
+        return ResponseData(
+            status_code=self.status_code,
+            headers=dict(self.headers),
+            content=self.content,
+            elapsed=self.elapsed,
+        )
+
+    def build(self, response_cls: type[T]) -> T:
+        """Return a new `response_cls` instance cloned from this template."""
+        prototype: Response | None = self._prototypes.get(response_cls)
+        if prototype is None:
+            prototype = self._prototypes.setdefault(
+                response_cls,
+                response_cls._create(self.to_data()),
+            )
+        return prototype._clone()  # type: ignore[return-value]
 
 
 class Response(ABC):
@@ -25,10 +269,14 @@ class Response(ABC):
         self,
         status_code: int | None = None,
         headers: dict[str, str] | None = None,
-        content: str | None = None,
+        content: Content | None = None,
         content_type: str | None = None,
         encoding: str | None = None,
         elapsed: timedelta | None = None,
+        latency: Latency | None = None,
+        request: Any = None,
+        content_encoding: str | None = None,
+        compression_level: int | None = None,
         _data: ResponseData | None = None,
     ) -> None:
         ...
@@ -37,61 +285,510 @@ class Response(ABC):
     def _prepare_response_data(
         status_code: int | None = None,
         headers: dict[str, str] | None = None,
-        content: str | None = None,
+        content: Content | None = None,
         content_type: str | None = None,
         encoding: str | None = None,
         elapsed: timedelta | None = None,
+        stream: ByteChunks | None = None,
+        latency: Latency | None = None,
+        content_encoding: str | None = None,
+        compression_level: int | None = None,
     ) -> ResponseData:
         if not headers:
             headers = {}
 
+        if elapsed is None and latency is not None:
+            elapsed = _sample_latency(latency)
+
+        if content is not None and not isinstance(content, str):
+            # e.g., a large buffer; viewed, not copied.
+            content = _as_binary(content)
+
+        if stream is not None:
+            if content:
+                raise ValueError("Specify exactly one of `content` or `stream`.")
+            if content_encoding:
+                raise ValueError("Cannot compress streamed content.")
+            # length is unknown unless given in `headers`.
+            headers["Content-Type"] = content_type or constants.CONTENT_TYPE_BINARY
+
+        content_encoded: Binary | None = None
+
         if content:
             if not content_type:
                 content_type = constants.CONTENT_TYPE_DEFAULT
 
-            content_encoded: bytes
+            if isinstance(content, str):
+                content_encoded = (
+                    content.encode(encoding) if encoding else content.encode()
+                )
+            else:
+                # already binary; passed through as-is.
+                content_encoded = content
 
             if encoding:
-                content_encoded = content.encode(encoding)
                 content_type += f"; charset={encoding}"
-            else:
-                content_encoded = content.encode()
 
             headers["Content-Type"] = content_type
 
+            if content_encoding:
+                # sent compressed, and decoded by the client (`httpx`, `urllib3`).
+                content_encoded = compress(
+                    content_encoded,
+                    content_encoding,
+                    compression_level,
+                )
+                headers["Content-Encoding"] = content_encoding
+
             if "Content-Length" not in headers:
-                headers["Content-Length"] = str(len(content_encoded))
+                headers["Content-Length"] = str(_nbytes(content_encoded))
 
         return ResponseData(
             status_code=int(status_code) if status_code else 200,
             headers=headers,
             content=content_encoded,
             elapsed=elapsed,
+            stream=stream,
+        )
+
+    @abstractmethod
+    def _clone(self: T) -> T:
+        """Return a shallow copy with its own mutable state (headers, history, ...)."""
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def _new_headers(headers: dict[str, str]) -> Any:
+        """Return `headers` as the headers of this response type."""
+        ...
+
+    @abstractmethod
+    def _parse_json(self, **kwargs: Any) -> Any:
+        """Parse the content as JSON, as the client library does."""
+        ...
+
+    def _set_lazy(self, lazy: LazyJson, headers: dict[str, str]) -> None:
+        # `_content` and `headers` are set when first accessed (see `__getattr__`).
+        self.__dict__["_lazy"] = lazy
+        self.__dict__["_lazy_headers"] = headers
+        self.__dict__.pop("_content", None)
+        self.__dict__.pop("headers", None)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for missing attributes, e.g. the content of lazy responses.
+        if name in ("_content", "headers") and "_lazy" in self.__dict__:
+            self._load_lazy()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
         )
 
+    def _load_lazy(self) -> None:
+        content: bytes = self.__dict__["_lazy"].encode()
+        if "headers" not in self.__dict__:
+            headers: Any = self._new_headers(self.__dict__["_lazy_headers"])
+            if "Content-Length" not in headers:
+                headers["Content-Length"] = str(len(content))
+            self.__dict__["headers"] = headers
+        if "_content" not in self.__dict__:
+            self.__dict__["_content"] = content
+
+    def json(self, **kwargs: Any) -> Any:
+        lazy: LazyJson | None = self.__dict__.get("_lazy")
+        if lazy is not None and not kwargs:
+            # a copy of the object given to `from_dict(lazy=True)`; nothing is parsed.
+            return lazy.copy()
+        return self._parse_json(**kwargs)
+
     @classmethod
-    def _create(cls: type[T], data: ResponseData) -> T:
-        return cls(_data=data)
+    def _create(cls: type[T], data: ResponseData, request: Any = None) -> T:
+        return cls(_data=data, request=request)
 
     @classmethod
-    def from_dict(cls: type[T], content: dict[str, Any], **kwargs: Any) -> T:
+    def from_data(cls: type[T], data: ResponseData) -> T:
+        """Create a response from already-prepared response data."""
+        return cls._create(data)
+
+    @classmethod
+    def from_template(cls: type[T], template: ResponseTemplate) -> T:
+        return template.build(cls)
+
+    @classmethod
+    def from_dict(
+        cls: type[T],
+        content: dict[str, Any],
+        serializer: JsonSerializer | str | None = None,
+        lazy: bool = False,
+        **kwargs: Any,
+    ) -> T:
+        """Create a JSON response from the given object.
+
+        Args:
+            content: object to serialize
+            serializer: a `mockish.serializers.JsonSerializer`, or its name,
+                used instead of the default set with `set_json_serializer`
+            lazy: serialize `content` only when the response's content or
+                headers (e.g., `Content-Length`) are first accessed, and have
+                `.json()` return a (deep) copy of `content` without parsing it;
+                `content` must not be mutated in the meantime
+            **kwargs: passed to the response; e.g., `content_encoding="gzip"`
+                (or `"deflate"`, `"br"`, `"zstd"`) sends the content compressed,
+                to be decoded by the client, and `compression_level` sets its level
+
+        Returns:
+            : A response
+
+        Examples:
+            >>> from mockish.requests import Response
+            >>> payload = {'items': list(range(3))}
+            >>> resp = Response.from_dict(payload, lazy=True)
+            >>> resp.status_code
+            200
+            >>> resp.json() == payload and resp.json() is not payload
+            True
+            >>> resp.headers['Content-Length']
+            '20'
+        """
+        if lazy:
+            return cls._from_dict_lazy(content, serializer, **kwargs)
+
+        serialized: str | bytes = get_json_serializer(serializer)(content)
+
+        encoding: str | None = kwargs.get("encoding")
+        if (
+            isinstance(serialized, bytes)
+            and encoding
+            and codecs.lookup(encoding).name != "utf-8"
+        ):
+            serialized = serialized.decode()
+
+        request: Any = kwargs.pop("request", None)
+
         return cls._create(
             cls._prepare_response_data(
-                content=json.dumps(content, ensure_ascii=False),
-                content_type="application/json",
+                content=serialized,
+                content_type=constants.CONTENT_TYPE_JSON,
                 **kwargs,
             ),
+            request=request,
         )
 
     @classmethod
-    def from_file(cls: type[T], path: str, encoding: str = "utf-8", **kwargs: Any) -> T:
-        with open(path, encoding=encoding) as f:
-            return cls._create(
-                cls._prepare_response_data(
-                    content=f.read(),
-                    content_type=(
-                        "application/json" if path.lower().endswith(".json") else None
-                    ),
-                    **kwargs,
+    def _from_dict_lazy(
+        cls: type[T],
+        content: dict[str, Any],
+        serializer: JsonSerializer | str | None = None,
+        **kwargs: Any,
+    ) -> T:
+        if kwargs.get("content_encoding"):
+            raise ValueError("Cannot compress lazily serialized content.")
+
+        request: Any = kwargs.pop("request", None)
+        encoding: str | None = kwargs.get("encoding")
+
+        # same headers as `from_dict`, except `Content-Length`, set when serialized.
+        data: ResponseData = cls._prepare_response_data(**kwargs)
+        content_type: str = constants.CONTENT_TYPE_JSON
+        if encoding:
+            content_type += f"; charset={encoding}"
+        data.headers["Content-Type"] = content_type
+        data.lazy = LazyJson(content, get_json_serializer(serializer), encoding)
+
+        return cls._create(data, request=request)
+
+    @classmethod
+    def from_records(
+        cls: type[T],
+        records: Iterable[Any],
+        serializer: JsonSerializer | str | None = None,
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        """Lazily create a JSON response for each of the given objects.
+
+        Responses are created as they are consumed, in batches of `batch_size`
+        that share their headers, so a sequence of a million responses
+        for `Mock(return_each=...)` costs memory only for those consumed.
+
+        Args:
+            records: objects to serialize, one per response
+            serializer: a `mockish.serializers.JsonSerializer`, or its name,
+                used instead of the default set with `set_json_serializer`
+            batch_size: number of records serialized at a time
+            **kwargs: passed to each response (`status_code`, `headers`, ...)
+
+        Returns:
+            : An iterator of responses
+
+        Examples:
+            >>> from mockish import Mock
+            >>> from mockish.requests import Response
+            >>> obj = Mock(
+            ...     return_each=Response.from_records({"id": i} for i in range(10**6)),
+            ... )
+            >>> obj().json()
+            {'id': 0}
+            >>> obj().json()
+            {'id': 1}
+        """
+        serialize: JsonSerializer = get_json_serializer(serializer)
+        return cls._from_json_bodies(
+            (serialize(x) for x in records),
+            batch_size=batch_size,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_jsonl(
+        cls: type[T],
+        path: str,
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        """Lazily create a JSON response for each line of a JSON Lines file.
+
+        Lines are used as content as-is, without parsing them,
+        and the file is read only as responses are consumed.
+
+        Args:
+            path: path to a file with one JSON document per line
+            batch_size: number of lines read at a time
+            **kwargs: passed to each response (`status_code`, `headers`, ...)
+
+        Returns:
+            : An iterator of responses
+        """
+
+        def _lines() -> Iterator[bytes]:
+            with open(path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield line
+
+        return cls._from_json_bodies(_lines(), batch_size=batch_size, **kwargs)
+
+    @classmethod
+    def _from_json_bodies(  # pylint: disable=too-many-arguments
+        cls: type[T],
+        bodies: Iterable[str | bytes],
+        batch_size: int,
+        status_code: int | None = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        elapsed: timedelta | None = None,
+        latency: Latency | None = None,
+        request: Any = None,
+    ) -> Iterator[T]:
+        if batch_size < 1:
+            raise ValueError(f"Expected a positive `batch_size`; given: {batch_size}")
+
+        # same headers as `from_dict`, prepared once for every response.
+        content_type: str = constants.CONTENT_TYPE_JSON
+        if encoding:
+            content_type += f"; charset={encoding}"
+        shared_headers: dict[str, str] = dict(headers) if headers else {}
+        shared_headers["Content-Type"] = content_type
+
+        target: str = encoding or "utf-8"
+        transcode: bool = codecs.lookup(target).name != "utf-8"
+
+        def _encode(body: str | bytes) -> bytes:
+            if transcode:
+                if isinstance(body, bytes):
+                    body = body.decode()
+                return body.encode(target)
+            return body if isinstance(body, bytes) else body.encode()
+
+        status: int = int(status_code) if status_code else 200
+        set_length: bool = "Content-Length" not in shared_headers
+
+        def _responses() -> Iterator[T]:
+            # responses are cloned from a prototype, instead of each being built.
+            prototype: T = cls._create(
+                ResponseData(
+                    status_code=status,
+                    headers=shared_headers,
+                    content=None,
+                    elapsed=elapsed,
                 ),
+                request=request,
+            )
+
+            iterator: Iterator[str | bytes] = iter(bodies)
+            while True:
+                contents: list[bytes] = [
+                    _encode(x) for x in itertools.islice(iterator, batch_size)
+                ]
+                if not contents:
+                    return
+
+                lengths: list[str] = [str(len(x)) for x in contents]
+                for content, length in zip(contents, lengths):
+                    resp: Any = prototype._clone()
+                    resp._content = content
+                    if set_length:
+                        resp.headers["Content-Length"] = length
+                    if elapsed is None and latency is not None:
+                        resp.elapsed = _sample_latency(latency)
+                    yield resp
+
+        # validated above when called, rather than when first consumed.
+        return _responses()
+
+    @classmethod
+    def from_iter(cls: type[T], chunks: ByteChunks, **kwargs: Any) -> T:
+        """Create a response whose body is streamed lazily from `chunks`.
+
+        Chunks are pulled only as the body is read, e.g. with `iter_bytes()`
+        or `aiter_bytes()` (`httpx`) or `iter_content()` (`requests`),
+        so arbitrarily large bodies are read in constant memory.
+        Like a real streamed response, the body can be read only once.
+
+        Args:
+            chunks: an iterable of `bytes`, or an async iterable for `httpx`
+            **kwargs: passed to the response
+
+        Returns:
+            : A response
+
+        Examples:
+            >>> from mockish.requests import Response
+            >>> resp = Response.from_iter(b"x" * 1024 for _ in range(3))
+            >>> [len(x) for x in resp.iter_content(2048)]
+            [2048, 1024]
+        """
+        request: Any = kwargs.pop("request", None)
+        return cls._create(
+            cls._prepare_response_data(stream=chunks, **kwargs),
+            request=request,
+        )
+
+    @classmethod
+    def from_stream(cls: type[T], stream: ByteChunks, **kwargs: Any) -> T:
+        """Same as `from_iter`; reads naturally with (async) generators."""
+        return cls.from_iter(stream, **kwargs)
+
+    @staticmethod
+    def _with_overrides(
+        data: ResponseData,
+        status_code: int | None = None,
+        headers: dict[str, str] | None = None,
+        elapsed: timedelta | None = None,
+        latency: Latency | None = None,
+        content_encoding: str | None = None,
+        compression_level: int | None = None,
+    ) -> ResponseData:
+        # Applies per-response arguments to shared data without mutating it,
+        # with the same precedence as `_prepare_response_data`.
+        if elapsed is None and latency is not None:
+            elapsed = _sample_latency(latency)
+
+        merged_headers: dict[str, str] = dict(headers) if headers else {}
+        for k, v in data.headers.items():
+            if k == "Content-Type" or k not in merged_headers:
+                merged_headers[k] = v
+
+        content: Binary | None = data.content
+        if content_encoding and content:
+            content = compress(content, content_encoding, compression_level)
+            merged_headers["Content-Encoding"] = content_encoding
+            merged_headers["Content-Length"] = str(len(content))
+
+        return replace(
+            data,
+            status_code=int(status_code) if status_code else data.status_code,
+            headers=merged_headers,
+            content=content,
+            elapsed=elapsed or data.elapsed,
+        )
+
+    @classmethod
+    def _read_file(
+        cls,
+        path: str,
+        encoding: str,
+        binary: bool,
+        mmap: bool,
+    ) -> ResponseData:
+        content_type: str | None = mimetypes.guess_type(path)[0]
+
+        if not (binary or mmap):
+            with open(path, encoding=encoding) as f:
+                return cls._prepare_response_data(
+                    content=f.read(),
+                    content_type=content_type,
+                )
+
+        content: bytes | memoryview
+
+        with open(path, "rb") as f:
+            if mmap and os.fstat(f.fileno()).st_size:
+                content = memoryview(
+                    mmaplib.mmap(f.fileno(), 0, access=mmaplib.ACCESS_READ),
+                )
+            else:
+                content = f.read()
+
+        return cls._prepare_response_data(
+            content=content,
+            content_type=content_type or constants.CONTENT_TYPE_BINARY,
+        )
+
+    @classmethod
+    def from_file(
+        cls: type[T],
+        path: str,
+        encoding: str = "utf-8",
+        binary: bool = False,
+        mmap: bool = False,
+        cache: bool | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Create a response from the contents of a file.
+
+        The content type is guessed from the file extension.
+
+        Args:
+            path: path to the file
+            encoding: encoding used to read the file in text mode
+            binary: read the file as bytes, skipping the decode/encode round-trip
+            mmap: memory-map the file and use it as content without copying
+                (implies `binary`); `content` is then a read-only `memoryview`
+            cache: read through `mockish.cache.fixture_cache`, keyed on the
+                file's path, mtime, and size; defaults to `fixture_cache.enabled`
+            **kwargs: passed to the response; e.g., `content_encoding`
+                and `compression_level`, as with `from_dict`
+
+        Returns:
+            : A response
+        """
+        request: Any = kwargs.pop("request", None)
+
+        if cache is None:
+            cache = fixture_cache.enabled
+
+        if not cache:
+            data: ResponseData = cls._read_file(path, encoding, binary, mmap)
+            return cls._create(cls._with_overrides(data, **kwargs), request=request)
+
+        stat: os.stat_result = os.stat(path)
+        key: Hashable = (
+            os.path.abspath(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            encoding,
+            binary,
+            mmap,
+        )
+
+        cached: ResponseData | None = fixture_cache.get(key)
+        if cached is None:
+            cached = cls._read_file(path, encoding, binary, mmap)
+            fixture_cache.put(
+                key,
+                cached,
+                size=_nbytes(cached.content) if cached.content else 0,
             )
+
+        return cls._create(cls._with_overrides(cached, **kwargs), request=request)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+__all__ = [
+    "MockProfile",
+    "Profiler",
+    "profiler",
+]
+
+# percentiles reported for the time spent in each mock's side effect
+PERCENTILES = (50, 90, 99)
+
+
+class MockProfile:
+    """Calls of (and time spent in the side effects of) the mocks sharing a name.
+
+    Mocks are named by their patch target (see `mockish.patch`),
+    or else by their `mock` name (e.g., `'mock.get'`).
+
+    Args:
+        name: name of the mock(s)
+        max_samples: durations kept to estimate percentiles (a uniform sample)
+    """
+
+    def __init__(self, name: str, max_samples: int = 10_000) -> None:
+        self.name: str = name
+        self.calls: int = 0
+        self.total_seconds: float = 0.0
+        self.samples: List[float] = []
+        self.max_samples: int = max_samples
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += seconds
+            if len(self.samples) < self.max_samples:
+                self.samples.append(seconds)
+            else:
+                # reservoir sampling, so every call is equally likely to be kept.
+                i: int = random.randrange(self.calls)
+                if i < self.max_samples:
+                    self.samples[i] = seconds
+
+    def percentile(self, q: float) -> float:
+        """Return the `q`-th percentile (nearest rank) of the sampled durations."""
+        if not 0 <= q <= 100:
+            raise ValueError(f"Expected a percentile in [0, 100]; given: {q}")
+        with self._lock:
+            samples: List[float] = sorted(self.samples)
+        if not samples:
+            return 0.0
+        return samples[max(0, math.ceil(len(samples) * q / 100) - 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            **{f"p{q}_seconds": self.percentile(q) for q in PERCENTILES},
+            "samples": list(self.samples),
+        }
+
+
+class Profiler:
+    """Collects a `MockProfile` per mock name, while enabled.
+
+    Mocks created while enabled (or with `profile=True`) time each call
+    of their side effect (`return_call`, `side_effect`, ...).
+
+    Args:
+        enabled: whether new mocks are profiled by default
+        max_samples: durations kept per mock name to estimate percentiles
+
+    Examples:
+        >>> from mockish import Mock
+        >>> from mockish.profiling import profiler
+        >>> obj = Mock(return_call=lambda: 'hello world', name='greet', profile=True)
+        >>> for _ in range(3):
+        ...     _ = obj()
+        >>> profiler.profile('greet').calls
+        3
+    """
+
+    def __init__(self, enabled: bool = False, max_samples: int = 10_000) -> None:
+        self.enabled: bool = enabled
+        self.max_samples: int = max_samples
+        self._profiles: Dict[str, MockProfile] = {}
+        self._lock = threading.Lock()
+
+    def profile(self, name: str) -> MockProfile:
+        """Return the profile of the given mock name, created if needed."""
+        with self._lock:
+            profile: Optional[MockProfile] = self._profiles.get(name)
+            if profile is None:
+                profile = self._profiles[name] = MockProfile(name, self.max_samples)
+            return profile
+
+    def stats(self, top: Optional[int] = None) -> List[MockProfile]:
+        """Return the profiles, by total time spent (then calls), highest first."""
+        with self._lock:
+            profiles: List[MockProfile] = list(self._profiles.values())
+        profiles.sort(key=lambda x: (x.total_seconds, x.calls), reverse=True)
+        return profiles[:top]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"mocks": [x.to_dict() for x in self.stats()]}
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add profiles exported by `to_dict` (e.g., from another process)."""
+        for x in data["mocks"]:
+            profile: MockProfile = self.profile(x["name"])
+            with profile._lock:
+                profile.calls += x["calls"]
+                profile.total_seconds += x["total_seconds"]
+                room: int = profile.max_samples - len(profile.samples)
+                profile.samples.extend(x["samples"][:room])
+
+    def export(self, path: str) -> None:
+        """Write the profiles to a JSON file, e.g., to track them over time."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self, top: Optional[int] = 10) -> str:
+        """Return a table of the `top` hottest mocks."""
+        rows: List[List[str]] = [
+            ["name", "calls", "total", *[f"p{q}" for q in PERCENTILES]],
+        ]
+        for x in self.stats(top):
+            rows.append(
+                [
+                    x.name,
+                    str(x.calls),
+                    _format_seconds(x.total_seconds),
+                    *[_format_seconds(x.percentile(q)) for q in PERCENTILES],
+                ],
+            )
+        widths: List[int] = [
+            max(len(row[i]) for row in rows) for i in range(len(rows[0]))
+        ]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(w) if i == 0 else cell.rjust(w)
+                for i, (cell, w) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-6:.2f}us"
+
+
+profiler: Profiler = Profiler()
+"""The default profiler, enabled by `pytest --mockish-profile`."""
@@ -0,0 +1,319 @@
+"""A pytest plugin that builds large responses once and shares them across
+`pytest-xdist` workers, and reports the hottest mocks with `--mockish-profile`.
+
+Responses are returned, by name, from the `pytest_mockish_responses` hook.
+With `pytest-xdist`, the hook is called once, in the controller process,
+which writes the bodies to a temporary file; each worker memory-maps that
+file and wraps the bodies without copying them. Without `pytest-xdist`,
+the hook is called once per session, in-process.
+
+> Note: the controller calls the hook before tests are collected,
+> so implement it in the `conftest.py` at the root of the tests
+> (or in a plugin), not in a `conftest.py` of a subdirectory.
+
+Examples:
+    ```py
+    # conftest.py
+    import mockish
+    from mockish.models import Response
+
+    def pytest_mockish_responses(config) -> dict[str, Response]:
+        return {
+            "catalog": mockish.requests.Response.from_file("catalog.json"),
+        }
+
+    # test_catalog.py
+    def test_catalog(mockish_responses) -> None:
+        resp = mockish_responses.build("catalog", mockish.httpx.Response)
+        assert resp.json()
+    ```
+
+    ```sh
+    pytest --mockish-profile --mockish-profile-top 20 --mockish-profile-json mocks.json
+    ```
+"""
+
+from __future__ import annotations
+
+import mmap as mmaplib
+import os
+import tempfile
+from datetime import timedelta
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import pytest
+
+from .mockish import _HAS_CALL_HOOKS
+from .models import (
+    Binary,
+    Response,
+    ResponseData,
+    _content_encoding,
+    _materialize,
+    _nbytes,
+)
+from .profiling import profiler
+
+__all__ = [
+    "SharedResponses",
+]
+
+T = TypeVar("T", bound=Response)
+
+# (status code, headers, offset, size (-1 if no content), elapsed seconds)
+_IndexEntry = Tuple[int, List[Tuple[str, str]], int, int, Optional[float]]
+
+_WORKERINPUT_KEY = "mockish_responses"
+_WORKEROUTPUT_KEY = "mockish_profile"
+
+
+class SharedResponses(Mapping[str, ResponseData]):
+    """Response data built once per test session, by name.
+
+    Data is shared, and must not be mutated; use `build` to create responses.
+    """
+
+    def __init__(self, data: Dict[str, ResponseData]) -> None:
+        self._data: Dict[str, ResponseData] = data
+
+    def __getitem__(self, name: str) -> ResponseData:
+        return self._data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def build(self, name: str, response_cls: type[T], **kwargs: Any) -> T:
+        """Create a `response_cls` from the named data, without copying its content.
+
+        Args:
+            name: name of the response
+            response_cls: e.g., `mockish.httpx.Response`, `mockish.requests.Response`
+            **kwargs: `status_code`, `headers`, `elapsed`, or `latency`
+                of this response
+        """
+        return response_cls.from_data(
+            response_cls._with_overrides(self._data[name], **kwargs),
+        )
+
+
+class _HookSpecs:
+    @pytest.hookspec
+    def pytest_mockish_responses(
+        self,
+        config: pytest.Config,
+    ) -> Dict[str, Union[Response, ResponseData]]:
+        """Return responses to build once per test session, by name.
+
+        Implement in the root `conftest.py` (or a plugin); with `pytest-xdist`,
+        the hooks of `conftest.py` files in subdirectories are not called.
+        """
+        raise NotImplementedError
+
+
+def _to_data(name: str, value: Union[Response, ResponseData]) -> ResponseData:
+    if isinstance(value, ResponseData):
+        if value.stream is not None:
+            raise ValueError(f"Cannot share a streamed response; given: {name!r}")
+        return _materialize(value)
+    if isinstance(value, Response):
+        resp: Any = value
+        headers: Dict[str, str] = dict(resp.headers.items())
+        content: Optional[Binary] = resp.content or None
+        if _content_encoding(headers):
+            # `content` is decoded already; so is its length.
+            headers = {
+                k: v
+                for k, v in headers.items()
+                if k.lower() not in ("content-encoding", "content-length")
+            }
+            if content is not None:
+                headers["Content-Length"] = str(_nbytes(content))
+        return ResponseData(
+            status_code=resp.status_code,
+            headers=headers,
+            content=content,
+            elapsed=None,
+        )
+    raise TypeError(
+        f"Expected a 'Response' or 'ResponseData' for {name!r}; given: {type(value)}",
+    )
+
+
+def _collect(config: pytest.Config) -> Dict[str, ResponseData]:
+    data: Dict[str, ResponseData] = {}
+    for responses in config.hook.pytest_mockish_responses(config=config):
+        for name, value in responses.items():
+            if name in data:
+                raise ValueError(f"Response {name!r} is defined more than once.")
+            data[name] = _to_data(name, value)
+    return data
+
+
+def _publish(data: Mapping[str, ResponseData]) -> Tuple[str, Dict[str, _IndexEntry]]:
+    """Write the bodies to a temporary file; return its path and an index of it."""
+    index: Dict[str, _IndexEntry] = {}
+    fd, path = tempfile.mkstemp(prefix="mockish-", suffix=".bin")
+    with os.fdopen(fd, "wb") as f:
+        offset: int = 0
+        for name, x in data.items():
+            size: int = -1
+            if x.content is not None:
+                size = f.write(x.content)
+            index[name] = (
+                x.status_code,
+                list(x.headers.items()),
+                offset,
+                size,
+                None if x.elapsed is None else x.elapsed.total_seconds(),
+            )
+            offset += max(size, 0)
+    return path, index
+
+
+def _attach(path: str, index: Mapping[str, _IndexEntry]) -> SharedResponses:
+    """Wrap the bodies published to `path` as views of a read-only memory map."""
+    view: memoryview = memoryview(b"")
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            view = memoryview(
+                mmaplib.mmap(f.fileno(), 0, access=mmaplib.ACCESS_READ),
+            )
+
+    return SharedResponses(
+        {
+            name: ResponseData(
+                status_code=status_code,
+                headers=dict(headers),
+                content=None if size < 0 else view[offset : offset + size],
+                elapsed=None if elapsed is None else timedelta(seconds=elapsed),
+            )
+            for name, (status_code, headers, offset, size, elapsed) in index.items()
+        },
+    )
+
+
+class _XdistController:
+    """Publishes the responses once, when the first worker is configured."""
+
+    def __init__(self) -> None:
+        self._published: Optional[Dict[str, Any]] = None
+
+    def pytest_configure_node(self, node: Any) -> None:
+        if self._published is None:
+            data: Dict[str, ResponseData] = _collect(node.config)
+            # no file, if the hook is not implemented.
+            self._published = {"path": None, "index": {}}
+            if data:
+                path, index = _publish(data)
+                self._published = {"path": path, "index": index}
+        node.workerinput[_WORKERINPUT_KEY] = self._published
+
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:
+        data: Optional[Dict[str, Any]] = getattr(node, "workeroutput", {}).get(
+            _WORKEROUTPUT_KEY,
+        )
+        if data is not None:
+            profiler.merge(data)
+
+    def pytest_unconfigure(self) -> None:
+        if self._published is not None and self._published["path"] is not None:
+            os.remove(self._published["path"])
+        self._published = None
+
+
+def pytest_addhooks(pluginmanager: pytest.PytestPluginManager) -> None:
+    pluginmanager.add_hookspecs(_HookSpecs)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("mockish")
+    group.addoption(
+        "--mockish-profile",
+        action="store_true",
+        help="profile calls of mockish mocks and report the hottest.",
+    )
+    group.addoption(
+        "--mockish-profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="number of mocks in the profile report (default: 10).",
+    )
+    group.addoption(
+        "--mockish-profile-json",
+        default=None,
+        metavar="PATH",
+        help="export the profile of every mock to a JSON file.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not hasattr(config, "workerinput") and config.pluginmanager.hasplugin("xdist"):
+        config.pluginmanager.register(_XdistController(), "mockish-xdist-controller")
+
+    if config.getoption("mockish_profile"):
+        if not _HAS_CALL_HOOKS:
+            raise pytest.UsageError("--mockish-profile requires Python 3.8 or later.")
+        profiler.reset()
+        profiler.enabled = True
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    # sent to the controller (`pytest_testnodedown`) by `pytest-xdist` workers.
+    workeroutput: Optional[Dict[str, Any]] = getattr(
+        session.config,
+        "workeroutput",
+        None,
+    )
+    if workeroutput is not None and profiler.enabled:
+        workeroutput[_WORKEROUTPUT_KEY] = profiler.to_dict()
+
+
+def pytest_terminal_summary(
+    terminalreporter: Any,
+    config: pytest.Config,
+) -> None:
+    if not config.getoption("mockish_profile") or hasattr(config, "workerinput"):
+        return
+
+    top: int = config.getoption("mockish_profile_top")
+    terminalreporter.write_sep("=", f"mockish profile: top {top} mocks")
+    terminalreporter.write_line(profiler.report(top=top))
+
+    path: Optional[str] = config.getoption("mockish_profile_json")
+    if path:
+        profiler.export(path)
+        terminalreporter.write_line(f"mockish profile written to: {path}")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if config.getoption("mockish_profile"):
+        profiler.enabled = False
+
+
+@pytest.fixture(scope="session")
+def mockish_responses(pytestconfig: pytest.Config) -> SharedResponses:
+    """Responses from `pytest_mockish_responses`, shared across xdist workers."""
+    published: Optional[Dict[str, Any]] = getattr(
+        pytestconfig,
+        "workerinput",
+        {},
+    ).get(_WORKERINPUT_KEY)
+    if published is None:
+        return SharedResponses(_collect(pytestconfig))
+    if published["path"] is None:
+        return SharedResponses({})
+    return _attach(published["path"], published["index"])
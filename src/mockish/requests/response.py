@@ -1,21 +1,75 @@
 from __future__ import annotations
 
+import io
+import json
 from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 import requests
+import urllib3
 
 from .. import models
 
+if TYPE_CHECKING:
+    from ..clock import Latency
+
+# bytes sampled to detect the encoding of buffer content (e.g., memory-mapped files)
+_ENCODING_SAMPLE_SIZE: int = 64 * 1024
+
+
+class _ChunkReader(io.RawIOBase):
+    """A file-like `raw` that reads lazily from an iterable of chunks."""
+
+    def __init__(self, chunks: models.ByteChunks) -> None:
+        super().__init__()
+        if not isinstance(chunks, Iterable):
+            raise TypeError("`requests` responses cannot stream async iterables.")
+        self._chunks: models.ByteChunks = chunks
+        self._iterator: Iterator[bytes] = iter(chunks)
+        self._pending: memoryview = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        return super().read(-1 if size is None else size)
+
+    def readinto(self, buffer: Any) -> int:
+        # fills `buffer` across chunk boundaries, like `urllib3` does for `read(amt)`.
+        size: int = len(buffer)
+        n: int = 0
+        while n < size:
+            if not self._pending:
+                try:
+                    self._pending = memoryview(next(self._iterator))
+                except StopIteration:
+                    break
+                continue
+            k: int = min(size - n, len(self._pending))
+            buffer[n : n + k] = self._pending[:k]
+            self._pending = self._pending[k:]
+            n += k
+        return n
+
+    def close(self) -> None:
+        if hasattr(self._chunks, "close"):
+            self._chunks.close()
+        super().close()
+
 
 class Response(requests.Response, models.Response):
     def __init__(
         self,
         status_code: int | None = None,
         headers: dict[str, str] | None = None,
-        content: str | None = None,
+        content: models.Content | None = None,
         content_type: str | None = None,
         encoding: str | None = None,
         elapsed: timedelta | None = None,
+        latency: Latency | None = None,
+        request: requests.PreparedRequest | None = None,
+        content_encoding: str | None = None,
+        compression_level: int | None = None,
         _data: models.ResponseData | None = None,
     ):
         """A `requests.Response` object, useful when mocking/patching HTTP calls.
@@ -23,10 +77,20 @@ class Response(requests.Response, models.Response):
         Args:
             status_code:
             headers:
-            content:
+            content: text, or bytes-like content (e.g., `bytes`, `bytearray`,
+                `memoryview`, or another buffer); read-only buffers are used
+                without copying, and writable ones are copied;
+                `Content-Length` is its size in bytes
             content_type:
             encoding:
             elapsed:
+            latency: simulated latency used as `elapsed`, if not given;
+                a fixed value or a callable sampling one (`mockish.clock.Latency`)
+            request: the request that this is a response to; also sets `url`
+            content_encoding: send `content` compressed with this `Content-Encoding`
+                (`gzip`, `deflate`, `br`, `zstd`); it is decoded by `urllib3`,
+                as the body of a real response is
+            compression_level: compression level; defaults to the codec's default
 
         Examples:
             *Common imports*
@@ -95,14 +159,113 @@ class Response(requests.Response, models.Response):
                 content_type=content_type,
                 encoding=encoding,
                 elapsed=elapsed,
+                latency=latency,
+                content_encoding=content_encoding,
+                compression_level=compression_level,
             )
 
         self.status_code = _data.status_code
 
         self.headers = requests.structures.CaseInsensitiveDict(_data.headers)
 
-        if _data.content:
-            self._content = _data.content
+        if _data.content and models._content_encoding(_data.headers):
+            # decoded by `urllib3` (per `Content-Encoding`), as a real response is.
+            self.raw = urllib3.HTTPResponse(
+                body=io.BytesIO(_data.content),
+                headers=_data.headers,
+                status=_data.status_code,
+                preload_content=False,
+                decode_content=True,
+            )
+            _ = self.content
+        elif _data.content:
+            # buffer content (e.g., memory-mapped files) is kept as a view.
+            self._content = _data.content  # type: ignore[assignment]
+
+        if _data.stream is not None:
+            self.raw = _ChunkReader(_data.stream)
 
         if _data.elapsed:
             self.elapsed = _data.elapsed
+
+        if request is not None:
+            self.request = request
+            self.url = request.url or ""
+
+        if _data.lazy is not None:
+            self._set_lazy(_data.lazy, _data.headers)
+
+        if _data.content or _data.lazy is not None:
+            # as if read, so `iter_content` slices the content instead of `raw`.
+            self._content_consumed = True
+
+    def _peek_headers(self) -> requests.structures.CaseInsensitiveDict[str]:
+        # the headers, without serializing lazy responses (but no `Content-Length`).
+        if "headers" not in self.__dict__ and "_lazy" in self.__dict__:
+            return self._new_headers(self._lazy_headers)
+        return self.headers
+
+    @property
+    def is_redirect(self) -> bool:
+        # checked by `requests.Session.send` for every response.
+        return (
+            "location" in self._peek_headers()
+            and self.status_code in requests.models.REDIRECT_STATI
+        )
+
+    @property
+    def apparent_encoding(self) -> str | None:
+        content: bytes | memoryview = self.content
+        if isinstance(content, (bytes, bytearray)):
+            return super().apparent_encoding
+        if requests.compat.chardet is None:
+            return "utf-8"
+        encoding: str | None = requests.compat.chardet.detect(
+            bytes(content[:_ENCODING_SAMPLE_SIZE]),
+        )["encoding"]
+        return encoding
+
+    def iter_content(
+        self,
+        chunk_size: int | None = 1,
+        decode_unicode: bool = False,
+    ) -> Iterator[Any]:
+        # slices of buffer content (e.g., memory-mapped files) are views.
+        chunks: Iterator[Any] = super().iter_content(  # type: ignore[call-overload]
+            chunk_size,
+            decode_unicode,
+        )
+        return (bytes(x) if isinstance(x, memoryview) else x for x in chunks)
+
+    # serves lazy JSON first; otherwise shadowed by `requests.Response.json`.
+    json = models.Response.json
+
+    def _parse_json(self, **kwargs: Any) -> Any:
+        content: bytes | memoryview = self.content
+        if not content or isinstance(content, (bytes, bytearray)):
+            return super().json(**kwargs)
+        # `json.loads` does not accept buffers (e.g., memory-mapped files).
+        encoding: str = (
+            self.encoding
+            or requests.utils.guess_json_utf(bytes(content[:4]))
+            or "utf-8"
+        )
+        try:
+            return json.loads(str(content, encoding), **kwargs)
+        except json.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    @staticmethod
+    def _new_headers(
+        headers: dict[str, str]
+    ) -> requests.structures.CaseInsensitiveDict[str]:
+        return requests.structures.CaseInsensitiveDict(headers)
+
+    def _clone(self) -> Response:
+        clone: Response = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        if "headers" in self.__dict__:
+            clone.headers = self.headers.copy()
+        clone.cookies = requests.cookies.cookiejar_from_dict({})
+        clone.history = list(self.history)
+        return clone
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, Optional, Pattern, Sequence, Union
+from unittest import mock
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.utils import get_encoding_from_headers
+
+from .. import models
+from ..cassette import Cassette
+from ..mockish import _HAS_CALL_HOOKS, Mock
+from ..routing import RouteTable
+from .response import Response
+
+
+class Router(BaseAdapter):
+    def __init__(self, cassette: Optional[Cassette] = None) -> None:
+        """A `requests` transport adapter that routes requests to mocked responses.
+
+        Mount it on a `requests.Session` to exercise the session's own
+        request pipeline (hooks, redirects, retries, ...) without a network.
+
+        Routes are indexed by method, URL, and optionally the request body,
+        just like `mockish.httpx.Router`. Each route is backed by a
+        `mockish.Mock` that is called with the `PreparedRequest` (and any path
+        parameters); calls to a route are `thread_safe` (from Python 3.8),
+        so a session can be shared across threads. Routes may return a
+        `mockish.models.ResponseTemplate` to hand out a fresh response per call,
+        which is recommended when responses are shared across threads.
+
+        Args:
+            cassette: replay interactions from a `mockish.cassette.Cassette`
+                for requests that match no route
+
+        Examples:
+            >>> import requests
+            >>> from mockish.requests import Response, Router
+
+            >>> router = Router()
+            >>> route = router.add(
+            ...     "GET",
+            ...     "https://www.fresh2.dev/users/{id}",
+            ...     return_call=lambda request, id: Response.from_dict({"id": id}),
+            ... )
+
+            >>> session = requests.Session()
+            >>> session.mount("https://www.fresh2.dev", router)
+            >>> session.get("https://www.fresh2.dev/users/123").json()
+            {'id': '123'}
+            >>> route.assert_called_once()
+        """
+        super().__init__()
+        self._routes = RouteTable()
+        self._cassette: Optional[Cassette] = cassette
+
+    def add(
+        self,
+        method: str,
+        url: Union[str, Pattern[str]],
+        *,
+        body: Union[str, bytes, None] = None,
+        return_value: Optional[Any] = None,
+        return_call: Optional[Callable[..., Optional[Any]]] = None,
+        return_once: Optional[Any] = None,
+        return_each: Optional[Sequence[Any]] = None,
+        return_exception: Optional[Exception] = None,
+        **kwargs: Any,
+    ) -> mock.Mock:
+        """Add a route, returning the `mockish.Mock` that handles it.
+
+        See `mockish.httpx.Router.add`.
+        """
+        kwargs.setdefault("thread_safe", _HAS_CALL_HOOKS)
+        handler: mock.Mock = Mock(
+            return_value=return_value,
+            return_call=return_call,
+            return_once=return_once,
+            return_each=return_each,
+            return_exception=return_exception,
+            **kwargs,
+        )
+        self._routes.add(method, url, handler, body=body)
+        return handler
+
+    def send(  # pylint: disable=too-many-arguments,unused-argument
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, str, tuple[str, str]] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        body: Any = request.body
+        if isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            # streamed bodies (e.g., files) are not matched.
+            body = None
+
+        route, params = self._routes.match(
+            request.method or "GET", request.url or "", body
+        )
+        result: Any = (
+            self._replay(request, body)
+            if route is None
+            else route.call(request, **params)
+        )
+
+        response: requests.Response
+        if isinstance(result, models.ResponseTemplate):
+            response = result.build(Response)
+        elif isinstance(result, Response):
+            # a shared response (e.g., a `return_value`) is handed out as a copy,
+            # as it is updated below for each request.
+            response = result._clone()
+        elif isinstance(result, requests.Response):
+            response = result
+        else:
+            raise TypeError(f"Expected type 'requests.Response'; given: {type(result)}")
+
+        # as in `requests.adapters.HTTPAdapter.build_response`
+        response.encoding = get_encoding_from_headers(
+            # without serializing lazy responses (see `from_dict`).
+            response._peek_headers()
+            if isinstance(response, Response)
+            else response.headers,
+        )
+        response.request = request
+        response.url = request.url or ""
+        # typed as `HTTPAdapter`, the adapter `requests` sets by default.
+        response.connection = self  # type: ignore[assignment]
+        return response
+
+    def _replay(
+        self,
+        request: requests.PreparedRequest,
+        body: Optional[bytes],
+    ) -> requests.Response:
+        data: Optional[models.ResponseData] = (
+            None
+            if self._cassette is None
+            else self._cassette.play(request.method or "GET", request.url or "", body)
+        )
+        if data is None:
+            raise LookupError(f"No route matches: {request.method} {request.url}")
+        return Response.from_data(data)
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+from unittest import mock
+from urllib.parse import urlsplit
+
+from .mockish import _Mock
+
+__all__ = [
+    "Route",
+    "RouteTable",
+]
+
+_PLACEHOLDER_PATTERN: Pattern[str] = re.compile(r"{([A-Za-z_][A-Za-z0-9_]*)}")
+
+# (method, host, path, body digest)
+_ExactKey = Tuple[str, Optional[str], str, Optional[bytes]]
+# (method, host)
+_TemplateKey = Tuple[str, Optional[str]]
+
+
+def _body_digest(body: Union[str, bytes, None]) -> Optional[bytes]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        body = body.encode()
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def _split_url(url: str) -> Tuple[Optional[str], str, str]:
+    """Return the (host, path, query) of a URL, where `host` is `None` for paths."""
+    parts = urlsplit(url)
+    return (parts.netloc.lower() or None, parts.path or "/", parts.query)
+
+
+def _compile_template(path: str) -> Pattern[str]:
+    # split() alternates between literal text and placeholder names.
+    parts: List[str] = _PLACEHOLDER_PATTERN.split(path)
+    return re.compile(
+        "".join(
+            f"(?P<{x}>[^/]+)" if i % 2 else re.escape(x) for i, x in enumerate(parts)
+        ),
+    )
+
+
+@dataclass
+class Route:
+    method: str
+    url: Union[str, Pattern[str]]
+    handler: mock.Mock
+    body: Union[str, bytes, None] = None
+    # serializes calls to `handler`, unless it is a `thread_safe` mock
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # matched against the path (templates) or the full URL (patterns)
+    _regex: Optional[Pattern[str]] = field(default=None, repr=False)
+    _template: Optional[str] = field(default=None, repr=False)
+
+    def call(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the handler.
+
+        A `thread_safe` mock serializes only its own bookkeeping (recording the
+        call, and handing out the next of `return_each`), so a `return_call`
+        runs unlocked and may itself send requests to this route. Other handlers
+        are called under `lock`.
+
+        Raises:
+            LookupError: raised if the route has no more responses
+                (e.g., an exhausted `return_once` or `return_each`)
+        """
+        try:
+            handler: Any = self.handler
+            if isinstance(handler, _Mock) and handler._mockish_lock is not None:
+                return handler(*args, **kwargs)
+            with self.lock:
+                return handler(*args, **kwargs)
+        except StopIteration:
+            # raised as is, it would be a `RuntimeError` in async clients.
+            raise LookupError(
+                f"No more responses for route: {self.method} {self.url}",
+            ) from None
+
+    def match_params(self, path: str, url: str) -> Optional[Dict[str, str]]:
+        if self._template is not None:
+            if self._regex is None:
+                # compiled on first use; most template routes are never tried.
+                self._regex = _compile_template(self._template)
+            match = self._regex.fullmatch(path)
+        elif self._regex is not None:
+            match = self._regex.fullmatch(url)
+        else:
+            return {}
+        return None if match is None else match.groupdict()
+
+
+class _TemplateNode:
+    """A trie of path segments; segments with placeholders share one child."""
+
+    __slots__ = ("literals", "wildcard", "routes")
+
+    def __init__(self) -> None:
+        self.literals: Dict[str, _TemplateNode] = {}
+        self.wildcard: Optional[_TemplateNode] = None
+        self.routes: List[Route] = []
+
+    def insert(self, segments: List[str], route: Route) -> None:
+        node: _TemplateNode = self
+        for x in segments:
+            if _PLACEHOLDER_PATTERN.search(x):
+                if node.wildcard is None:
+                    node.wildcard = _TemplateNode()
+                node = node.wildcard
+            else:
+                node = node.literals.setdefault(x, _TemplateNode())
+        node.routes.append(route)
+
+    def candidates(self, segments: List[str], i: int = 0) -> Iterator[Route]:
+        # literal segments are tried before placeholders, so specific routes win.
+        if i == len(segments):
+            yield from self.routes
+            return
+        child: Optional[_TemplateNode] = self.literals.get(segments[i])
+        if child is not None:
+            yield from child.candidates(segments, i + 1)
+        if self.wildcard is not None and segments[i]:
+            yield from self.wildcard.candidates(segments, i + 1)
+
+
+class RouteTable:
+    """An index of routes by method, URL, and (optionally) request body.
+
+    Exact routes are found with a single dict lookup. Routes with path
+    placeholders (`/users/{id}`) are kept in a trie of path segments per
+    method and host, so only routes sharing the request's literal segments
+    are tried. Routes given as compiled patterns (matched against the full URL)
+    are scanned last.
+
+    Routes without a host match any host, and routes without a body
+    match any body.
+    """
+
+    def __init__(self) -> None:
+        self._exact: Dict[_ExactKey, Route] = {}
+        self._templates: Dict[_TemplateKey, _TemplateNode] = {}
+        self._n_templates: int = 0
+        self._patterns: Dict[str, List[Route]] = {}
+        self._match_body: bool = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return (
+            len(self._exact)
+            + self._n_templates
+            + sum(len(x) for x in self._patterns.values())
+        )
+
+    def add(
+        self,
+        method: str,
+        url: Union[str, Pattern[str]],
+        handler: mock.Mock,
+        body: Union[str, bytes, None] = None,
+    ) -> Route:
+        method = method.upper()
+        route = Route(method=method, url=url, handler=handler, body=body)
+        digest: Optional[bytes] = _body_digest(body)
+
+        with self._lock:
+            if body is not None:
+                self._match_body = True
+
+            if not isinstance(url, str):
+                route._regex = url
+                self._patterns.setdefault(method, []).append(route)
+                return route
+
+            host, path, query = _split_url(url)
+
+            if not _PLACEHOLDER_PATTERN.search(path):
+                if query:
+                    path += "?" + query
+                self._exact[(method, host, path, digest)] = route
+                return route
+
+            route._template = path
+            self._templates.setdefault((method, host), _TemplateNode()).insert(
+                path.split("/"),
+                route,
+            )
+            self._n_templates += 1
+            return route
+
+    def match(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+    ) -> Tuple[Optional[Route], Dict[str, str]]:
+        """Return the matching route, if any, and its path parameters."""
+        method = method.upper()
+        host, path, query = _split_url(url)
+
+        digests: Tuple[Optional[bytes], ...] = (None,)
+        if self._match_body and body:
+            digests = (_body_digest(body), None)
+
+        paths: Tuple[str, ...] = (path + "?" + query, path) if query else (path,)
+
+        hosts: Tuple[Optional[str], ...] = (host, None) if host else (None,)
+
+        exact: Dict[_ExactKey, Route] = self._exact
+        for digest in digests:
+            for p in paths:
+                for h in hosts:
+                    route: Optional[Route] = exact.get((method, h, p, digest))
+                    if route is not None:
+                        return route, {}
+
+        segments: List[str] = path.split("/")
+        for h in hosts:
+            root: Optional[_TemplateNode] = self._templates.get((method, h))
+            if root is None:
+                continue
+            for route in root.candidates(segments):
+                if not self._body_matches(route, body):
+                    continue
+                params: Optional[Dict[str, str]] = route.match_params(path, url)
+                if params is not None:
+                    return route, params
+
+        for route in self._patterns.get(method, ()):
+            if not self._body_matches(route, body):
+                continue
+            params = route.match_params(path, url)
+            if params is not None:
+                return route, params
+
+        return None, {}
+
+    @staticmethod
+    def _body_matches(route: Route, body: Optional[bytes]) -> bool:
+        if route.body is None:
+            return True
+        expected: Any = route.body
+        if isinstance(expected, str):
+            expected = expected.encode()
+        return bool(expected == (body or b""))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Union
+
+__all__ = [
+    "JsonSerializer",
+    "dumps_json",
+    "dumps_orjson",
+    "dumps_ujson",
+    "get_json_serializer",
+    "set_json_serializer",
+]
+
+JsonSerializer = Callable[[Any], Union[str, bytes]]
+"""Serializes an object to JSON, as `str` or already-encoded UTF-8 `bytes`."""
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize with the standard library (the default)."""
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def dumps_orjson(obj: Any) -> bytes:
+    """Serialize with `orjson`, which returns `bytes` directly.
+
+    > Note: `orjson` must be installed.
+    """
+    import orjson  # pylint: disable=import-error
+
+    serialized: bytes = orjson.dumps(obj)
+    return serialized
+
+
+def dumps_ujson(obj: Any) -> str:
+    """Serialize with `ujson`.
+
+    > Note: `ujson` must be installed.
+    """
+    import ujson  # pylint: disable=import-error
+
+    serialized: str = ujson.dumps(obj, ensure_ascii=False)
+    return serialized
+
+
+SERIALIZERS: Dict[str, JsonSerializer] = {
+    "json": dumps_json,
+    "orjson": dumps_orjson,
+    "ujson": dumps_ujson,
+}
+
+_default_serializer: JsonSerializer = dumps_json
+
+
+def get_json_serializer(
+    serializer: JsonSerializer | str | None = None,
+) -> JsonSerializer:
+    """Resolve a serializer by name or callable; `None` gives the global default.
+
+    Raises:
+        ValueError: raised if `serializer` is an unknown name
+    """
+    if serializer is None:
+        return _default_serializer
+    if callable(serializer):
+        return serializer
+    try:
+        return SERIALIZERS[serializer]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON serializer '{serializer}'; expected one of: "
+            f"{list(SERIALIZERS)}",
+        ) from None
+
+
+def set_json_serializer(serializer: JsonSerializer | str | None) -> None:
+    """Set the JSON serializer used by `Response.from_dict` by default.
+
+    Args:
+        serializer: a name in `SERIALIZERS`, a callable, or `None` to restore
+            the standard library serializer.
+
+    Examples:
+        >>> from mockish.serializers import set_json_serializer
+        >>> from mockish.requests import Response
+        >>> set_json_serializer(lambda x: b'{"hello":"world"}')
+        >>> Response.from_dict({}).content
+        b'{"hello":"world"}'
+        >>> set_json_serializer(None)
+        >>> Response.from_dict({}).content
+        b'{}'
+    """
+    global _default_serializer  # pylint: disable=global-statement
+    _default_serializer = get_json_serializer(serializer or dumps_json)
@@ -10,6 +10,8 @@ import pytest
 from _pytest.config import Config
 from packaging.version import VERSION_PATTERN
 
+pytest_plugins = ["pytester"]
+
 
 @pytest.fixture(name="root_dir", scope="session")
 def fixture_root_dir(pytestconfig: Config) -> Path:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Generator
+from uuid import uuid4
+
+import pytest
+
+import mockish
+from mockish.cache import LRUCache, fixture_cache
+from mockish.models import Response
+
+
+@pytest.fixture(name="clear_fixture_cache", autouse=True)
+def _fixture_clear_fixture_cache() -> Generator[None, None, None]:
+    fixture_cache.cache_clear()
+    yield
+    fixture_cache.cache_clear()
+    fixture_cache.enabled = False
+
+
+def test_lru_cache_eviction() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(max_bytes=10)
+
+    cache.put("a", b"12345", size=5)
+    cache.put("b", b"67890", size=5)
+    assert cache.get("a") == b"12345"
+
+    cache.put("c", b"abcde", size=5)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.cache_info().evictions == 1
+    assert cache.cache_info().current_bytes == 10
+
+    cache.put("d", b"too large", size=11)
+    assert "d" not in cache
+    assert len(cache) == 2
+
+    cache.put("c", b"abc", size=3)
+    assert cache.cache_info().current_bytes == 8
+
+
+def test_from_file_cache_shared_across_backends(tmp_path: Path) -> None:
+    path: Path = tmp_path / "fixture.json"
+    path.write_text(f'{{"hello": "{uuid4()}"}}', encoding="utf-8")
+
+    fixture_cache.enabled = True
+
+    response_types: list[type[Response]] = [
+        mockish.httpx.Response,
+        mockish.requests.Response,
+    ]
+    responses: list[Response] = [
+        x.from_file(str(path), status_code=200 + i)
+        for i, x in enumerate(response_types * 2)
+    ]
+
+    assert fixture_cache.cache_info().misses == 1
+    assert fixture_cache.cache_info().hits == len(responses) - 1
+    assert fixture_cache.cache_info().current_bytes == path.stat().st_size
+
+    for i, resp in enumerate(responses):
+        assert resp.status_code == 200 + i
+        assert resp.content == path.read_bytes()
+        assert resp.headers["Content-Type"] == "application/json"
+
+
+def test_from_file_cache_invalidated_on_change(tmp_path: Path) -> None:
+    path: Path = tmp_path / "fixture.txt"
+    path.write_text("hello", encoding="utf-8")
+
+    first: Response = mockish.requests.Response.from_file(str(path), cache=True)
+
+    path.write_text("hello world", encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+
+    second: Response = mockish.requests.Response.from_file(str(path), cache=True)
+
+    assert first.content == b"hello"
+    assert second.content == b"hello world"
+    assert fixture_cache.cache_info().misses == 2
+
+
+def test_from_file_cache_opt_in(tmp_path: Path) -> None:
+    path: Path = tmp_path / "fixture.txt"
+    path.write_text("hello", encoding="utf-8")
+
+    mockish.requests.Response.from_file(str(path))
+    mockish.requests.Response.from_file(str(path))
+
+    assert fixture_cache.cache_info().misses == 0
+    assert not fixture_cache
+
+    fixture_cache.enabled = True
+    mockish.requests.Response.from_file(str(path), cache=False)
+    assert not fixture_cache
+
+
+def test_from_file_cache_headers_not_shared(tmp_path: Path) -> None:
+    path: Path = tmp_path / "fixture.txt"
+    path.write_text("hello", encoding="utf-8")
+
+    first: Response = mockish.httpx.Response.from_file(
+        str(path),
+        cache=True,
+        headers={"X-Hello": "world"},
+    )
+    second: Response = mockish.httpx.Response.from_file(str(path), cache=True)
+
+    assert first.headers["X-Hello"] == "world"
+    assert "X-Hello" not in second.headers
+    assert fixture_cache.cache_info().hits == 1
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Generator
+
+import httpx
+import pytest
+import requests
+
+import mockish
+from mockish.cassette import Cassette, CassetteWriter
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        body: bytes = json.dumps({"path": self.path}).encode()
+        if self.path.startswith("/gzip"):
+            body = gzip.compress(body)
+        self.send_response(404 if self.path.startswith("/missing") else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/gzip"):
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802
+        body: bytes = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(201)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(name="server_url", scope="module")
+def fixture_server_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(name="cassette_path")
+def fixture_cassette_path(tmp_path: Path, server_url: str) -> str:
+    path: str = str(tmp_path / "test.cassette")
+
+    with CassetteWriter(path, match_body=True) as writer:
+        client = httpx.Client(event_hooks={"response": [writer.record]})
+        client.get(f"{server_url}/users/1")
+        client.get(f"{server_url}/gzip")
+        client.post(f"{server_url}/echo", content=b"a")
+
+        session = requests.Session()
+        session.hooks["response"].append(writer.record)
+        session.get(f"{server_url}/users/2")
+        session.get(f"{server_url}/missing")
+        session.post(f"{server_url}/echo", data=b"b")
+
+    return path
+
+
+def test_replay_httpx(cassette_path: str, server_url: str) -> None:
+    with Cassette(cassette_path) as cassette:
+        assert len(cassette) == 6
+
+        router = mockish.httpx.Router(cassette=cassette)
+        with httpx.Client(transport=router, base_url=server_url) as client:
+            assert client.get("/users/1").json() == {"path": "/users/1"}
+            assert client.get("/users/2").json() == {"path": "/users/2"}
+
+            resp: httpx.Response = client.get("/gzip")
+            assert resp.json() == {"path": "/gzip"}
+            assert "Content-Encoding" not in resp.headers
+
+            assert client.get("/missing").status_code == 404
+            assert client.post("/echo", content=b"a").text == "a"
+            assert client.post("/echo", content=b"b").text == "b"
+
+            with pytest.raises(LookupError):
+                client.post("/echo", content=b"c")
+
+            with pytest.raises(LookupError):
+                client.get("/users/3")
+
+
+def test_replay_requests(cassette_path: str, server_url: str) -> None:
+    with Cassette(cassette_path) as cassette:
+        session = requests.Session()
+        session.mount("http://", mockish.requests.Router(cassette=cassette))
+
+        resp: requests.Response = session.get(f"{server_url}/users/1")
+        assert resp.json() == {"path": "/users/1"}
+        assert resp.elapsed.total_seconds() > 0
+
+        assert session.get(f"{server_url}/gzip").json() == {"path": "/gzip"}
+        assert session.get(f"{server_url}/missing").status_code == 404
+        assert session.post(f"{server_url}/echo", data=b"b").text == "b"
+
+        with pytest.raises(LookupError):
+            session.get(f"{server_url}/users/3")
+
+
+def test_routes_take_precedence(cassette_path: str, server_url: str) -> None:
+    with Cassette(cassette_path) as cassette:
+        router = mockish.httpx.Router(cassette=cassette)
+        router.add("GET", "/users/1", return_value=mockish.httpx.Response(content="hi"))
+
+        with httpx.Client(transport=router, base_url=server_url) as client:
+            assert client.get("/users/1").text == "hi"
+            assert client.get("/users/2").json() == {"path": "/users/2"}
+
+
+def test_play_order(tmp_path: Path) -> None:
+    path: str = str(tmp_path / "test.cassette")
+
+    with CassetteWriter(path) as writer:
+        for i in range(3):
+            writer.add("GET", "http://localhost/poll", content=str(i).encode())
+        writer.add("GET", "http://localhost/other", content=b"other")
+
+    with Cassette(path) as cassette:
+        assert ("GET", "http://localhost/poll") in cassette
+        assert ("GET", "http://localhost/nope") not in cassette
+
+        played: list[bytes] = []
+        for _ in range(5):
+            data = cassette.play("GET", "http://localhost/poll")
+            assert data is not None
+            played.append(bytes(data.content))
+
+        assert played == [b"0", b"1", b"2", b"2", b"2"]
+
+        first = cassette.get("GET", "http://localhost/poll")
+        assert first is not None
+        assert bytes(first.content) == b"0"
+
+        cassette.rewind()
+        data = cassette.play("GET", "http://localhost/poll")
+        assert data is not None
+        assert bytes(data.content) == b"0"
+
+
+def test_lazy_bodies(tmp_path: Path) -> None:
+    path: str = str(tmp_path / "test.cassette")
+    body: bytes = b"x" * (1024 * 1024)
+
+    with CassetteWriter(path) as writer:
+        writer.add("GET", "http://localhost/big", content=body)
+        writer.add("GET", "http://localhost/empty", status_code=204)
+
+    with Cassette(path) as cassette:
+        data = cassette.get("GET", "http://localhost/big")
+        assert data is not None
+        assert isinstance(data.content, memoryview)
+        assert data.content == body
+        assert data.headers["Content-Length"] == str(len(body))
+
+        data = cassette.get("GET", "http://localhost/empty")
+        assert data is not None
+        assert data.status_code == 204
+        assert not data.content
+
+
+def test_not_a_cassette(tmp_path: Path) -> None:
+    path: Path = tmp_path / "test.cassette"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError, match="Not a cassette"):
+        Cassette(str(path))
+
+
+def test_many_interactions(tmp_path: Path) -> None:
+    n_interactions: int = 100_000
+    path: str = str(tmp_path / "test.cassette")
+
+    with CassetteWriter(path) as writer:
+        for i in range(n_interactions):
+            writer.add("GET", f"http://localhost/items/{i}", content=str(i).encode())
+
+    # timed by `benchmarks/bench_routing.py`.
+    cassette = Cassette(path)
+    try:
+        for i in range(0, n_interactions, 100):
+            data = cassette.get("GET", f"http://localhost/items/{i}")
+            assert data is not None
+            assert data.content == str(i).encode()
+    finally:
+        cassette.close()
+
+    assert len(cassette) == n_interactions
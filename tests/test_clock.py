@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import mockish
+from mockish import AsyncMock
+from mockish.clock import VirtualClock, sample_latency
+from mockish.models import Response
+
+RESPONSE_TYPES: list[type[Response]] = [
+    mockish.httpx.Response,
+    mockish.requests.Response,
+]
+
+
+def test_sample_latency() -> None:
+    assert sample_latency(2) == timedelta(seconds=2)
+    assert sample_latency(timedelta(milliseconds=5)) == timedelta(milliseconds=5)
+    assert sample_latency(lambda: 0.5) == timedelta(milliseconds=500)
+
+    with pytest.raises(ValueError, match="non-negative"):
+        sample_latency(-1)
+
+
+def test_concurrent_awaits() -> None:
+    n_calls: int = 10_000
+    fetch = AsyncMock(
+        return_value="hello",
+        latency=functools.partial(random.Random(0).uniform, 1, 60),
+    )
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*[fetch() for _ in range(n_calls)])
+
+    clock = VirtualClock(start=0)
+    start: float = time.perf_counter()
+    results: list[str] = clock.run(main())
+    elapsed: float = time.perf_counter() - start
+
+    assert results == ["hello"] * n_calls
+    assert fetch.call_count == n_calls
+    assert 59 < clock.time() <= 60
+    # generous bound to stay stable on slow machines.
+    assert elapsed < 10
+
+
+def test_timeout() -> None:
+    fetch = AsyncMock(return_value="hello", latency=10)
+
+    async def main() -> None:
+        await asyncio.wait_for(fetch(), timeout=2)
+
+    clock = VirtualClock(start=0)
+    with pytest.raises(asyncio.TimeoutError):
+        clock.run(main())
+
+    assert clock.time() == 2
+    fetch.assert_called_once()
+
+
+def test_concurrency_limit() -> None:
+    fetch = AsyncMock(return_value="hello", latency=timedelta(seconds=1))
+    limit = asyncio.Semaphore(10)
+
+    async def limited() -> str:
+        async with limit:
+            return await fetch()  # type: ignore[no-any-return]
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*[limited() for _ in range(100)])
+
+    clock = VirtualClock(start=0)
+    clock.run(main())
+
+    assert clock.time() == pytest.approx(10)
+
+
+def test_hedging() -> None:
+    latencies = iter([5, 1])
+    fetch = AsyncMock(return_each=["slow", "fast"], latency=lambda: next(latencies))
+
+    async def main() -> str:
+        tasks = [asyncio.ensure_future(fetch()) for _ in range(2)]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for x in pending:
+            x.cancel()
+        return done.pop().result()  # type: ignore[no-any-return]
+
+    clock = VirtualClock(start=0)
+    assert clock.run(main()) == "fast"
+    assert clock.time() == 1
+
+
+def test_exception_after_latency() -> None:
+    fetch = AsyncMock(return_exception=ConnectionError("boom"), latency=3)
+
+    clock = VirtualClock(start=0)
+    with pytest.raises(ConnectionError):
+        clock.run(fetch())
+
+    assert clock.time() == 3
+
+
+def test_child_mocks_inherit_latency() -> None:
+    session = AsyncMock(latency=3)
+
+    clock = VirtualClock(start=0)
+    clock.run(session.get("https://www.fresh2.dev"))
+
+    assert clock.time() == 3
+
+
+def test_attach_running_loop() -> None:
+    async def main() -> float:
+        loop = asyncio.get_running_loop()
+        with VirtualClock(start=100).attach() as clock:
+            await asyncio.sleep(3600)
+            assert loop.time() == clock.time()
+            now: float = clock.time()
+        assert loop.time() != now
+        return now
+
+    assert asyncio.run(main()) == 3700
+
+
+def test_advance() -> None:
+    clock = VirtualClock(start=0)
+    clock.advance(5)
+    assert clock.time() == 5
+
+    with pytest.raises(ValueError, match="backwards"):
+        clock.advance(-1)
+
+    with pytest.raises(RuntimeError, match="not been started"):
+        VirtualClock().time()
+
+
+def test_attach_twice() -> None:
+    async def main() -> None:
+        clock = VirtualClock().attach()
+        try:
+            with pytest.raises(RuntimeError, match="already attached"):
+                clock.attach()
+        finally:
+            clock.detach()
+
+    asyncio.run(main())
+
+
+def test_attach_not_selector_loop() -> None:
+    loop: Any = object()
+
+    with pytest.raises(TypeError, match="selector-based"):
+        VirtualClock().attach(loop)
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_response_elapsed(response_type: type[Response]) -> None:
+    template: Response = response_type.from_dict({"hello": "world"})
+    fetch = AsyncMock(return_value=template, latency=lambda: 0.25)
+
+    resp: Any = VirtualClock().run(fetch())
+
+    assert resp is not template
+    assert resp.elapsed == timedelta(milliseconds=250)
+    assert resp.json() == {"hello": "world"}
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_builder_latency(response_type: type[Response], tmp_path: Path) -> None:
+    resp: Any = response_type(content="hello", latency=0.5)
+    assert resp.elapsed == timedelta(milliseconds=500)
+
+    resp = response_type(content="hello", latency=0.5, elapsed=timedelta(seconds=1))
+    assert resp.elapsed == timedelta(seconds=1)
+
+    resp = response_type.from_dict({}, latency=lambda: timedelta(seconds=2))
+    assert resp.elapsed == timedelta(seconds=2)
+
+    path: Path = tmp_path / "fixture.json"
+    path.write_text("{}")
+    resp = response_type.from_file(str(path), latency=3)
+    assert resp.elapsed == timedelta(seconds=3)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Generator
+
+import pytest
+
+import mockish
+from mockish import compression
+from mockish.cache import compression_cache
+from mockish.models import Response
+
+RESPONSE_TYPES: list[type[Response]] = [
+    mockish.httpx.Response,
+    mockish.requests.Response,
+]
+
+PAYLOAD: dict[str, Any] = {
+    "items": [{"id": i, "name": f"item-{i}"} for i in range(100)]
+}
+
+
+@pytest.fixture(autouse=True)
+def _fixture_compression_cache() -> Generator[None, None, None]:
+    compression_cache.cache_clear()
+    yield
+    compression_cache.cache_clear()
+
+
+def test_compress() -> None:
+    content: bytes = json.dumps(PAYLOAD).encode()
+
+    compressed: bytes = compression.compress(content, "gzip")
+    assert gzip.decompress(compressed) == content
+    assert zlib.decompress(compression.compress(content, "deflate")) == content
+
+    # cached by (content, codec, level).
+    assert compression.compress(bytearray(content), "gzip") is compressed
+    assert compression.compress(content, "gzip", level=1) is not compressed
+    assert compression.compress(content, "gzip", cache=False) == compressed
+    info = compression_cache.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 3, 3)
+
+    with pytest.raises(ValueError, match="Unknown content encoding 'lzma'"):
+        compression.compress(content, "lzma")
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+@pytest.mark.parametrize("content_encoding", ["gzip", "deflate", "br", "zstd"])
+def test_from_dict_content_encoding(
+    response_type: type[Response],
+    content_encoding: str,
+) -> None:
+    if content_encoding == "br":
+        pytest.importorskip("brotli")
+    elif content_encoding == "zstd":
+        pytest.importorskip("zstandard")
+
+    resp: Any = response_type.from_dict(PAYLOAD, content_encoding=content_encoding)
+
+    assert resp.json() == PAYLOAD
+    assert resp.content == json.dumps(PAYLOAD, ensure_ascii=False).encode()
+    assert resp.headers["Content-Encoding"] == content_encoding
+    assert int(resp.headers["Content-Length"]) < len(resp.content)
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+@pytest.mark.parametrize("mmap", [False, True])
+def test_from_file_content_encoding(
+    response_type: type[Response],
+    mmap: bool,
+    tmp_path: Path,
+) -> None:
+    path: Path = tmp_path / "fixture.json"
+    path.write_text(json.dumps(PAYLOAD), encoding="utf-8")
+
+    for _ in range(2):
+        resp: Any = response_type.from_file(
+            str(path),
+            mmap=mmap,
+            content_encoding="gzip",
+            compression_level=9,
+        )
+        assert resp.json() == PAYLOAD
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert int(resp.headers["Content-Length"]) == len(
+            compression.compress(path.read_bytes(), "gzip", level=9),
+        )
+
+    assert compression_cache.cache_info().hits >= 2
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_content_encoding_header(response_type: type[Response]) -> None:
+    # precompressed content is decoded per its `Content-Encoding` header.
+    resp: Any = response_type(
+        content=gzip.compress(b"hello world"),
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert resp.content == b"hello world"
+
+    resp = response_type(
+        content=b"hello world",
+        headers={"Content-Encoding": "identity"},
+    )
+    assert resp.content == b"hello world"
+
+    with pytest.raises(ValueError, match="streamed"):
+        response_type.from_iter([b"hello world"], content_encoding="gzip")
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import weakref
+from typing import Any, Callable, Dict
+from unittest import mock
+
+import pytest
+
+import mockish
+from mockish.mockish import _fastapi_app_tree
+
+fastapi = pytest.importorskip("fastapi")
+
+
+def _get_settings() -> Dict[str, str]:
+    return {"hello": "world"}
+
+
+def _get_user() -> str:
+    return "user"
+
+
+def _make_app(n_routes: int = 1) -> Any:
+    app = fastapi.FastAPI()
+    for i in range(n_routes):
+
+        @app.get(f"/items/{i}")
+        def _get(settings: Dict[str, str] = fastapi.Depends(_get_settings)) -> Any:
+            return settings
+
+    return app
+
+
+@pytest.fixture(name="app")
+def fixture_app() -> Any:
+    app = _make_app()
+    sub = _make_app()
+    sub.mount("/nested", _make_app())
+    app.mount("/sub", sub)
+    return app
+
+
+def _all_overrides(app: Any) -> list[Dict[Callable[..., Any], Callable[..., Any]]]:
+    return [dict(x.dependency_overrides) for x in _fastapi_app_tree(app)]
+
+
+def test_patch(app: Any) -> None:
+    override: Callable[[], Dict[str, str]] = lambda: {"hello": "mockish"}  # noqa: E731
+
+    mockish.patch_fastapi_dependencies(app, overrides={_get_settings: override})
+
+    assert len(_fastapi_app_tree(app)) == 3
+    assert _all_overrides(app) == [{_get_settings: override}] * 3
+
+    mockish.patch_fastapi_dependencies(
+        app,
+        overrides={_get_settings: override},
+        remove=True,
+    )
+    assert _all_overrides(app) == [{}] * 3
+
+
+def test_patch_restore(app: Any) -> None:
+    original: Callable[[], str] = lambda: "original"  # noqa: E731
+    app.dependency_overrides[_get_user] = original
+
+    with mockish.patch_fastapi_dependencies(
+        app,
+        overrides={_get_settings: dict, _get_user: str},
+    ) as patch:
+        assert len(patch) == 6
+        assert app.dependency_overrides == {_get_settings: dict, _get_user: str}
+
+        with mockish.patch_fastapi_dependencies(app, overrides=None):
+            assert _all_overrides(app) == [{}] * 3
+
+        assert _all_overrides(app)[-1] == {_get_settings: dict, _get_user: str}
+
+    assert _all_overrides(app) == [{_get_user: original}, {}, {}]
+
+    patch.restore()
+    assert _all_overrides(app) == [{_get_user: original}, {}, {}]
+
+
+def test_patch_remove_missing(app: Any) -> None:
+    app.dependency_overrides[_get_settings] = dict
+
+    with pytest.raises(KeyError):
+        mockish.patch_fastapi_dependencies(
+            app,
+            overrides={_get_settings: dict},
+            remove=True,
+        )
+
+    # no partial changes were left behind.
+    assert app.dependency_overrides == {_get_settings: dict}
+
+
+def test_patch_requests(app: Any) -> None:
+    testclient = pytest.importorskip("fastapi.testclient")
+    client = testclient.TestClient(app)
+
+    with mockish.patch_fastapi_dependencies(
+        app,
+        overrides={_get_settings: lambda: {"hello": "mockish"}},
+    ):
+        assert client.get("/sub/nested/items/0").json() == {"hello": "mockish"}
+
+    assert client.get("/sub/nested/items/0").json() == {"hello": "world"}
+
+
+def test_app_tree_cached(app: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    tree = _fastapi_app_tree(app)
+
+    walk = mock.Mock(wraps=mockish.mockish._walk_fastapi_apps)
+    monkeypatch.setattr(mockish.mockish, "_walk_fastapi_apps", walk)
+    assert _fastapi_app_tree(app) == tree
+    walk.assert_not_called()
+
+    nested = _fastapi_app_tree(app)[-1]
+    nested.mount("/more", _make_app())
+
+    assert len(_fastapi_app_tree(app)) == 4
+
+    with mockish.patch_fastapi_dependencies(app, overrides={_get_settings: dict}):
+        assert _all_overrides(app) == [{_get_settings: dict}] * 4
+
+
+def test_app_tree_not_kept_alive() -> None:
+    app = _make_app()
+    app.mount("/sub", _make_app())
+
+    with mockish.patch_fastapi_dependencies(app, overrides={_get_settings: dict}):
+        pass
+
+    ref: weakref.ref[Any] = weakref.ref(app)
+    del app
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_patch_invalid() -> None:
+    app = _make_app()
+
+    with pytest.raises(TypeError, match="FastAPI"):
+        mockish.patch_fastapi_dependencies(app, object(), overrides={})
+
+    assert not app.dependency_overrides
+
+
+def test_patch_local(app: Any) -> None:
+    httpx = pytest.importorskip("httpx")
+
+    app.dependency_overrides[_get_settings] = lambda: {"hello": "global"}
+
+    async def _scenario(i: int) -> Any:
+        await asyncio.sleep(0)
+        with mockish.patch_fastapi_dependencies(
+            app,
+            overrides={_get_settings: lambda: {"hello": str(i)}},
+            local=True,
+        ):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://test",
+            ) as client:
+                resp: Any = await client.get("/sub/nested/items/0")
+                await asyncio.sleep(0)
+                resp_root: Any = await client.get("/items/0")
+        return resp.json(), resp_root.json()
+
+    async def _main() -> list[Any]:
+        return await asyncio.gather(*[_scenario(i) for i in range(20)])
+
+    assert asyncio.run(_main()) == [
+        ({"hello": str(i)}, {"hello": str(i)}) for i in range(20)
+    ]
+
+    # only the global override is left.
+    assert list(app.dependency_overrides) == [_get_settings]
+    assert app.dependency_overrides[_get_settings]() == {"hello": "global"}
+    assert not _fastapi_app_tree(app)[-1].dependency_overrides
+
+
+def test_patch_local_remove(app: Any) -> None:
+    nested: Any = _fastapi_app_tree(app)[-1]
+
+    with mockish.patch_fastapi_dependencies(
+        app, overrides={_get_settings: dict, _get_user: str}, local=True
+    ):
+        assert nested.dependency_overrides
+        assert nested.dependency_overrides.get(_get_user) is str
+
+        with mockish.patch_fastapi_dependencies(
+            app, overrides={_get_user: str}, remove=True, local=True
+        ):
+            assert _get_user not in nested.dependency_overrides
+            assert nested.dependency_overrides[_get_settings] is dict
+
+        with mockish.patch_fastapi_dependencies(app, overrides=None, local=True):
+            assert not nested.dependency_overrides
+
+        with pytest.raises(KeyError):
+            mockish.patch_fastapi_dependencies(
+                app, overrides={_make_app: str}, remove=True, local=True
+            )
+
+        assert nested.dependency_overrides.get(_get_user) is str
+
+    assert not nested.dependency_overrides
+    assert nested.dependency_overrides.get(_get_user, _get_user) is _get_user
+
+
+def test_patch_global_then_local(app: Any) -> None:
+    nested: Any = _fastapi_app_tree(app)[-1]
+
+    outer = mockish.patch_fastapi_dependencies(app, overrides={_get_settings: dict})
+    inner = mockish.patch_fastapi_dependencies(
+        app, overrides={_get_settings: set}, local=True
+    )
+    # a global patch made while the local one is active.
+    with mockish.patch_fastapi_dependencies(app, overrides={_get_settings: list}):
+        assert dict.get(nested.dependency_overrides, _get_settings) is list
+    assert dict.get(nested.dependency_overrides, _get_settings) is dict
+    assert nested.dependency_overrides[_get_settings] is set
+
+    inner.restore()
+    outer.restore()
+
+    assert _all_overrides(app) == [{}] * 3
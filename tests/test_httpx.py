@@ -152,3 +152,49 @@ def test_mock_request_method_callable() -> None:
             httpx.get(...)
         except StopIteration:
             pytest.fail("method should return the value indefinitely")
+
+
+def test_request_lazy() -> None:
+    mock_resp: httpx.Response = mockish.httpx.Response(content="hello world")
+
+    assert mock_resp._request is None
+
+    assert isinstance(mock_resp.request, httpx.Request)
+    assert mock_resp.request is mock_resp.request
+    assert mock_resp.request.method == "GET"
+    assert mock_resp.url == "http://localhost/"
+
+
+def test_request_given() -> None:
+    request = httpx.Request("POST", "https://www.fresh2.dev/users")
+
+    mock_resp: httpx.Response = mockish.httpx.Response.from_dict(
+        {"hello": "world"},
+        status_code=409,
+        request=request,
+    )
+
+    assert mock_resp.request is request
+    assert mock_resp.url == "https://www.fresh2.dev/users"
+
+    with pytest.raises(httpx.HTTPStatusError, match="www.fresh2.dev") as e:
+        mock_resp.raise_for_status()
+    assert e.value.request is request
+    assert e.value.response is mock_resp
+
+
+def test_raise_for_status_default_request() -> None:
+    assert mockish.httpx.Response().raise_for_status().status_code == 200
+
+    with pytest.raises(httpx.HTTPStatusError, match="404 Not Found"):
+        mockish.httpx.Response(status_code=404).raise_for_status()
+
+
+def test_request_set_by_client() -> None:
+    router = mockish.httpx.Router()
+    router.add("GET", "/users/1", return_value=mockish.httpx.Response(content="hi"))
+
+    with httpx.Client(transport=router, base_url="https://www.fresh2.dev") as client:
+        resp: httpx.Response = client.get("/users/1")
+
+    assert resp.request.url == "https://www.fresh2.dev/users/1"
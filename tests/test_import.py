@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+_IMPORTTIME_PATTERN: re.Pattern[str] = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$",
+)
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Return the cumulative import time (in us) of each module loaded
+    by `statement`."""
+    proc: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def test_import_does_not_load_http_libraries() -> None:
+    times: dict[str, int] = _import_times("import mockish")
+
+    assert "mockish" in times
+
+    loaded: list[str] = [
+        x
+        for x in times
+        if x.split(".")[0] in ("httpx", "requests")
+        or x.startswith(("mockish.httpx", "mockish.requests"))
+    ]
+    assert not loaded, (
+        f"`import mockish` loaded HTTP libraries: {loaded} "
+        f"(mockish: {times['mockish']}us cumulative)"
+    )
+
+
+@pytest.mark.parametrize("name", ["httpx", "requests"])
+def test_import_submodule_on_access(name: str) -> None:
+    times: dict[str, int] = _import_times(
+        f"import mockish; mockish.{name}.Response",
+    )
+
+    assert name in times
+    assert f"mockish.{name}.response" in times
+    assert ({"httpx", "requests"} - {name}).isdisjoint(times)
+
+
+def test_all_names_resolve() -> None:
+    import mockish
+
+    for name in mockish.__all__:
+        assert getattr(mockish, name) is not None
+        assert name in dir(mockish)
+
+    with pytest.raises(AttributeError):
+        getattr(mockish, "does_not_exist")  # noqa: B009
@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import itertools
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generator
+from unittest import mock
+
+import pytest
+
+import mockish
+
+
+def test_record_full() -> None:
+    n_calls: int = 10
+
+    obj: mock.Mock = mockish.Mock(return_value="hello world")
+
+    for i in range(n_calls):
+        obj(i)
+
+    assert obj.call_count == n_calls
+    assert obj.call_args_list == [mock.call(i) for i in range(n_calls)]
+    obj.assert_called_with(n_calls - 1)
+    obj.assert_any_call(0)
+
+
+def test_record_ring_buffer() -> None:
+    n_calls: int = 100
+    n_keep: int = 3
+
+    obj: mock.Mock = mockish.Mock(return_value="hello world", record=n_keep)
+
+    for i in range(n_calls):
+        assert obj(i) == "hello world"
+
+    assert obj.call_count == n_calls
+    assert obj.call_args_list == [
+        mock.call(i) for i in range(n_calls - n_keep, n_calls)
+    ]
+    assert len(obj.mock_calls) == n_keep
+
+    obj.assert_called()
+    obj.assert_called_with(n_calls - 1)
+    obj.assert_any_call(n_calls - n_keep)
+    obj.assert_has_calls([mock.call(n_calls - 2), mock.call(n_calls - 1)])
+
+    with pytest.raises(AssertionError):
+        obj.assert_any_call(0)
+
+    obj.reset_mock()
+    obj.assert_not_called()
+    assert not obj.call_args_list
+
+
+def test_record_ring_buffer_bounded() -> None:
+    n_keep: int = 1000
+
+    obj: mock.Mock = mockish.Mock(record=n_keep)
+    for i in range(10 * n_keep):
+        obj.get(i)
+
+    # the call lists never hold more than `n_keep` calls, not just when read.
+    for calls in (obj.get.call_args_list, obj.mock_calls, obj.method_calls):
+        assert calls.maxlen == n_keep
+        assert len(calls) == n_keep
+    assert obj.get.call_args_list[-2:] == [mock.call(9998), mock.call(9999)]
+    assert [mock.call.get(9998), mock.call.get(9999)] in obj.mock_calls
+    assert repr(obj.get.call_args_list).endswith("call(9999)]")
+
+
+def test_repr() -> None:
+    assert repr(mockish.Mock()).startswith("<Mock id=")
+    assert repr(mockish.Mock(name="session").get).startswith("<Mock name=")
+    assert repr(mockish.AsyncMock()).startswith("<AsyncMock id=")
+
+
+def test_record_count() -> None:
+    n_calls: int = 100
+
+    obj: mock.Mock = mockish.Mock(return_value="hello world", record="count")
+
+    for i in range(n_calls):
+        obj(i)
+
+    assert obj.call_count == n_calls
+    assert obj.call_args is None
+    assert not obj.call_args_list
+    assert not obj.mock_calls
+
+    obj.assert_called()
+
+    with pytest.raises(ValueError, match="not recorded"):
+        obj.assert_called_with(n_calls - 1)
+
+    obj.reset_mock()
+    obj()
+    obj.assert_called_once()
+
+
+def test_record_child_mocks() -> None:
+    n_calls: int = 50
+
+    session: mock.Mock = mockish.Mock(record=1)
+
+    for i in range(n_calls):
+        session.get(i)
+
+    assert session.get.call_count == n_calls
+    assert session.get.call_args_list == [mock.call(n_calls - 1)]
+    assert session.method_calls == [mock.call.get(n_calls - 1)]
+    assert session.mock_calls == [mock.call.get(n_calls - 1)]
+
+
+def test_record_async() -> None:
+    obj: mock.Mock = mockish.AsyncMock(return_value="hello world", record=1)
+
+    async def _main() -> None:
+        for i in range(10):
+            assert await obj(i) == "hello world"
+
+    asyncio.run(_main())
+
+    assert obj.call_count == 10
+    assert obj.call_args_list == [mock.call(9)]
+
+
+@pytest.mark.parametrize("record", ["asdf", 0, -1, True, 1.5])
+def test_record_invalid(record: object) -> None:
+    with pytest.raises(ValueError, match="record"):
+        mockish.Mock(record=record)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"record": 1}, {"record": "count"}, {"thread_safe": True}, {"profile": True}],
+)
+def test_call_hooks_required(
+    monkeypatch: pytest.MonkeyPatch,
+    kwargs: dict[str, Any],
+) -> None:
+    # as on Python 3.7, where `mock` has no hooks to record or time calls.
+    monkeypatch.setattr(mockish.mockish, "_HAS_CALL_HOOKS", False)
+
+    with pytest.raises(ValueError, match="Python 3.8"):
+        mockish.Mock(return_value=1, **kwargs)
+
+    assert mockish.Mock(return_value=1)() == 1
+
+
+@pytest.mark.parametrize(
+    "value", [0, "", False, [], mockish.requests.Response(status_code=404)]
+)
+def test_return_falsy_value(value: object) -> None:
+    obj: mock.Mock = mockish.Mock(return_value=value)
+
+    assert obj() is value
+    assert obj() is value
+
+
+def test_return_once_falsy_value() -> None:
+    obj: mock.Mock = mockish.Mock(return_once=0)
+
+    assert obj() == 0
+
+    with pytest.raises(StopIteration):
+        obj()
+
+
+def test_return_each_empty() -> None:
+    obj: mock.Mock = mockish.Mock(return_each=[])
+
+    with pytest.raises(StopIteration):
+        obj()
+
+
+def test_return_falsy_value_exclusive() -> None:
+    with pytest.raises(ValueError, match="exactly one"):
+        mockish.Mock(return_value=0, return_call=lambda: 1)
+
+
+@pytest.fixture(name="contention")
+def fixture_contention() -> Generator[None, None, None]:
+    # switch threads as often as possible, to surface races with the GIL too;
+    # free-threaded builds run the workers truly in parallel.
+    interval: float = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("contention")
+def test_thread_safe_stress() -> None:
+    n_threads: int = 16
+    n_calls: int = 20_000
+
+    session: mock.Mock = mockish.Mock(thread_safe=True)
+    session.get = mockish.Mock(return_each=range(n_calls), thread_safe=True)
+    barrier = threading.Barrier(n_threads)
+
+    def _worker(k: int) -> list[int]:
+        barrier.wait()
+        return [session.get(k, i) for i in range(n_calls // n_threads)]
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        results: list[list[int]] = list(pool.map(_worker, range(n_threads)))
+
+    # every value handed out exactly once, in order within each thread.
+    assert sorted(x for y in results for x in y) == list(range(n_calls))
+    assert all(x == sorted(x) for x in results)
+
+    assert session.get.call_count == n_calls
+    assert len(session.get.call_args_list) == n_calls
+    assert len(session.mock_calls) == n_calls
+
+    by_thread: dict[int, list[mock._Call]] = mockish.calls_by_thread(session.get)
+    assert len(by_thread) == n_threads
+    for calls in by_thread.values():
+        assert len(calls) == n_calls // n_threads
+        # each worker passes its own index; calls are never misattributed.
+        assert len({x.args[0] for x in calls}) == 1
+
+    with pytest.raises(StopIteration):
+        session.get()
+
+
+@pytest.mark.usefixtures("contention")
+def test_thread_safe_return_once() -> None:
+    n_threads: int = 8
+    obj: mock.Mock = mockish.Mock(return_once="hello world", thread_safe=True)
+    barrier = threading.Barrier(n_threads)
+
+    def _worker() -> str | None:
+        barrier.wait()
+        try:
+            return obj()  # type: ignore[no-any-return]
+        except StopIteration:
+            return None
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        futures = [pool.submit(_worker) for _ in range(n_threads)]
+        results: list[str | None] = [x.result() for x in futures]
+
+    assert results.count("hello world") == 1
+    assert obj.call_count == n_threads
+
+
+def test_thread_safe_exceptions() -> None:
+    obj: mock.Mock = mockish.Mock(
+        return_each=[1, ValueError("hello"), KeyError, mock.DEFAULT],
+        thread_safe=True,
+    )
+    obj.return_value = "default"
+
+    assert obj() == 1
+    with pytest.raises(ValueError, match="hello"):
+        obj()
+    with pytest.raises(KeyError):
+        obj()
+    assert obj() == "default"
+
+
+def test_thread_safe_record_limit() -> None:
+    obj: mock.Mock = mockish.Mock(return_value=1, thread_safe=True, record=2)
+    for i in range(10):
+        obj(i)
+
+    assert mockish.calls_by_thread(obj) == {
+        threading.get_ident(): [mock.call(8), mock.call(9)],
+    }
+
+    obj.reset_mock()
+    assert not mockish.calls_by_thread(obj)
+
+    counted: mock.Mock = mockish.Mock(thread_safe=True, record="count")
+    counted()
+    with pytest.raises(ValueError, match="not recorded"):
+        mockish.calls_by_thread(counted)
+
+
+def test_calls_by_thread_not_thread_safe() -> None:
+    with pytest.raises(ValueError, match="thread_safe"):
+        mockish.calls_by_thread(mockish.Mock())
+
+
+def test_fast_mock_modes() -> None:
+    assert mockish.FastMock(return_value=0)() == 0
+    assert mockish.FastMock(return_call=lambda x: x * 2)(21) == 42
+    assert mockish.FastMock()() is None
+
+    once: Any = mockish.FastMock(return_once="hello")
+    assert once() == "hello"
+    with pytest.raises(StopIteration):
+        once()
+
+    each: Any = mockish.FastMock(return_each=[1, KeyError, 3])
+    assert each() == 1
+    with pytest.raises(KeyError):
+        each()
+    assert each() == 3
+
+    error: Any = mockish.FastMock(return_exception=ValueError("hello"))
+    with pytest.raises(ValueError, match="hello"):
+        error()
+    assert error.call_count == 1
+
+    with pytest.raises(ValueError, match="exactly one"):
+        mockish.FastMock(return_value=1, return_once=2)
+
+
+def test_fast_mock_assertions() -> None:
+    obj: Any = mockish.FastMock(return_value="hello world")
+
+    obj.assert_not_called()
+    assert obj.call_args is None
+    with pytest.raises(AssertionError, match="Not called"):
+        obj.assert_called_with(1)
+
+    obj(1, hello="world")
+    obj.assert_called()
+    obj.assert_called_once()
+    obj.assert_called_once_with(1, hello="world")
+    assert obj.called
+    assert obj.call_args == mock.call(1, hello="world")
+
+    obj(2)
+    assert obj.call_count == 2
+    obj.assert_called_with(2)
+    with pytest.raises(AssertionError, match="Actual call"):
+        obj.assert_called_with(1)
+    with pytest.raises(AssertionError, match="Called 2 times"):
+        obj.assert_called_once()
+
+    obj.reset_mock()
+    obj.assert_not_called()
+
+    with pytest.raises(AttributeError):
+        obj.anything = 1  # type: ignore[attr-defined]
+
+
+class _Spec:
+    def get(self, url: str) -> str:
+        return url
+
+    async def aget(self, url: str) -> str:
+        return url
+
+
+def test_spec_cached() -> None:
+    first: mock.Mock = mockish.Mock(spec_set=_Spec)
+    second: mock.Mock = mockish.Mock(spec=_Spec)
+
+    assert first._mock_methods is second._mock_methods
+    assert first._spec_set
+    assert not second._spec_set
+
+    for obj in (first, second):
+        assert isinstance(obj, _Spec)
+        assert asyncio.iscoroutinefunction(obj.aget)
+        with pytest.raises(AttributeError):
+            obj.asdf  # noqa: B018
+
+    with pytest.raises(AttributeError):
+        first.asdf = 1
+    second.asdf = 1
+
+    expected: mock.Mock = mock.Mock(spec_set=_Spec)
+    for k in ("_spec_class", "_spec_signature", "_mock_methods", "_spec_asyncs"):
+        assert getattr(first, k) == getattr(expected, k)
+
+
+def test_spec_cache_invalidated() -> None:
+    class Spec:
+        def get(self) -> None:
+            pass
+
+    assert not hasattr(mockish.Mock(spec_set=Spec), "post")
+
+    Spec.post = lambda self: None  # type: ignore[attr-defined]
+
+    obj: mock.Mock = mockish.Mock(spec_set=Spec)
+    obj.post()
+    obj.post.assert_called_once()
+
+
+def test_spec_cache_invalidated_by_base() -> None:
+    class Base:
+        pass
+
+    class Spec(Base):
+        pass
+
+    assert not hasattr(mockish.Mock(spec_set=Spec), "extra")
+
+    Base.extra = lambda self: None  # type: ignore[attr-defined]
+
+    obj: mock.Mock = mockish.Mock(spec_set=Spec)
+    obj.extra()
+    obj.extra.assert_called_once()
+
+
+def test_spec_cache_invalidated_by_patch() -> None:
+    class Spec:
+        def get(self) -> None:
+            pass
+
+    assert not asyncio.iscoroutinefunction(mockish.Mock(spec_set=Spec).get)
+
+    async def _get(self: Spec) -> None:
+        pass
+
+    with mock.patch.object(Spec, "get", _get):
+        assert asyncio.iscoroutinefunction(mockish.Mock(spec_set=Spec).get)
+
+    assert not asyncio.iscoroutinefunction(mockish.Mock(spec_set=Spec).get)
+
+
+def test_spec_cache_not_keeping_spec() -> None:
+    class Spec:
+        def get(self) -> None:
+            pass
+
+    obj: mock.Mock = mockish.Mock(spec_set=Spec)
+    assert mockish.Mock(spec_set=Spec)._spec_class is Spec
+
+    ref: weakref.ref[type] = weakref.ref(Spec)
+    del obj, Spec
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_spec_instance_not_cached() -> None:
+    spec: _Spec = _Spec()
+
+    first: mock.Mock = mockish.Mock(spec_set=spec)
+    spec.hello = "world"  # type: ignore[attr-defined]
+    second: mock.Mock = mockish.Mock(spec_set=spec)
+
+    assert not hasattr(first, "hello")
+    assert hasattr(second, "hello")
+
+
+def test_return_each_lazy() -> None:
+    produced: list[int] = []
+
+    def _values() -> Generator[int, None, None]:
+        for i in itertools.count():
+            produced.append(i)
+            yield i
+
+    obj: mock.Mock = mockish.Mock(return_each=_values())
+    assert not produced
+
+    assert [obj() for _ in range(3)] == [0, 1, 2]
+    assert produced == [0, 1, 2]
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_return_cycle(thread_safe: bool) -> None:
+    pattern: list[Any] = [1, ValueError("hello"), 3]
+    obj: mock.Mock = mockish.Mock(return_cycle=pattern, thread_safe=thread_safe)
+
+    for _ in range(3):
+        assert obj() == 1
+        with pytest.raises(ValueError, match="hello"):
+            obj()
+        assert obj() == 3
+
+    assert obj.call_count == 9
+
+
+def test_return_cycle_no_copy() -> None:
+    pattern: range = range(10**12)
+    obj: mock.Mock = mockish.Mock(return_cycle=pattern, record="count")
+
+    assert [obj() for _ in range(3)] == [0, 1, 2]
+
+
+def test_return_cycle_async() -> None:
+    obj: mock.Mock = mockish.AsyncMock(return_cycle="ab")
+
+    async def _main() -> list[str]:
+        return [await obj() for _ in range(3)]
+
+    assert asyncio.run(_main()) == ["a", "b", "a"]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "error"),
+    [([], ValueError), ((x for x in [1]), TypeError)],
+)
+def test_return_cycle_invalid(pattern: Any, error: type[Exception]) -> None:
+    with pytest.raises(error, match="return_cycle"):
+        mockish.Mock(return_cycle=pattern)
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_exhausted_raise(thread_safe: bool) -> None:
+    obj: mock.Mock = mockish.Mock(
+        return_each=iter([1]),
+        exhausted="raise",
+        thread_safe=thread_safe,
+    )
+
+    assert obj() == 1
+    with pytest.raises(StopIteration):
+        obj()
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_exhausted_repeat_last(thread_safe: bool) -> None:
+    obj: mock.Mock = mockish.Mock(
+        return_each=(x for x in [1, 2]),
+        exhausted="repeat_last",
+        thread_safe=thread_safe,
+    )
+    assert [obj() for _ in range(4)] == [1, 2, 2, 2]
+
+    empty: mock.Mock = mockish.Mock(return_each=[], exhausted="repeat_last")
+    with pytest.raises(StopIteration):
+        empty()
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_exhausted_return_value(thread_safe: bool) -> None:
+    obj: mock.Mock = mockish.Mock(
+        return_once="hello",
+        return_value="world",
+        exhausted="return_value",
+        thread_safe=thread_safe,
+    )
+    assert [obj() for _ in range(3)] == ["hello", "world", "world"]
+
+    obj.return_value = "mockish"
+    assert obj() == "mockish"
+
+
+def test_exhausted_async() -> None:
+    obj: mock.Mock = mockish.AsyncMock(return_each=[1], exhausted="repeat_last")
+
+    async def _main() -> list[int]:
+        return [await obj() for _ in range(3)]
+
+    assert asyncio.run(_main()) == [1, 1, 1]
+
+
+def test_exhausted_invalid() -> None:
+    with pytest.raises(ValueError, match="exhausted"):
+        mockish.Mock(return_each=[1], exhausted="asdf")
+
+    with pytest.raises(ValueError, match="exhausted"):
+        mockish.Mock(return_value=1, exhausted="repeat_last")
+
+    with pytest.raises(ValueError, match="exactly one"):
+        mockish.Mock(return_each=[1], return_value=1, exhausted="repeat_last")
+
+
+def test_fast_mock_return_cycle() -> None:
+    obj: Any = mockish.FastMock(return_cycle=[1, 2])
+
+    assert [obj() for _ in range(5)] == [1, 2, 1, 2, 1]
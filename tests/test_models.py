@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import json
+import pickle
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Iterator
+from uuid import uuid4
+
+import httpx
+import pytest
+import requests
+
+import mockish
+from mockish.constants import (
+    CONTENT_TYPE_BINARY,
+    CONTENT_TYPE_DEFAULT,
+    CONTENT_TYPE_JSON,
+)
+from mockish import serializers
+from mockish.models import Response, ResponseData, ResponseTemplate
+
+RESPONSE_TYPES: list[type[Response]] = [
+    mockish.httpx.Response,
+    mockish.requests.Response,
+]
+
+
+def _make_data(content: bytes, status_code: int = 200) -> ResponseData:
+    return ResponseData(
+        status_code=status_code,
+        headers={
+            "Content-Type": CONTENT_TYPE_JSON,
+            "Content-Length": str(len(content)),
+        },
+        content=content,
+        elapsed=timedelta(milliseconds=42),
+    )
+
+
+def test_template_interned() -> None:
+    content: bytes = f'{{"hello": "{uuid4()}"}}'.encode()
+
+    template: ResponseTemplate = ResponseTemplate.from_data(_make_data(content))
+
+    assert ResponseTemplate.from_data(_make_data(bytes(bytearray(content)))) is template
+
+    other: ResponseTemplate = ResponseTemplate.from_data(
+        _make_data(bytes(bytearray(content)), status_code=201),
+    )
+    assert other is not template
+    assert other.content is template.content
+
+
+def test_template_immutable() -> None:
+    template: ResponseTemplate = ResponseTemplate.from_data(_make_data(b"{}"))
+
+    with pytest.raises(AttributeError):
+        template.status_code = 500  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_template_build(response_type: type[Response]) -> None:
+    content: bytes = f'{{"hello": "{uuid4()}"}}'.encode()
+    template: ResponseTemplate = ResponseTemplate.from_data(
+        _make_data(content, status_code=201),
+    )
+
+    first: Response = response_type.from_template(template)
+    second: Response = template.build(response_type)
+
+    assert isinstance(first, response_type)
+    assert isinstance(second, response_type)
+    assert first is not second
+
+    for resp in (first, second):
+        assert resp.status_code == 201
+        assert resp.content == content
+        assert resp.json() == first.json()
+        assert resp.headers["content-type"] == CONTENT_TYPE_JSON
+        assert resp.headers["content-length"] == str(len(content))
+        assert resp.elapsed == timedelta(milliseconds=42)
+
+    first.headers["X-Hello"] = "world"
+    first.history.append(second)
+
+    assert "X-Hello" not in second.headers
+    assert not second.history
+    assert "X-Hello" not in template.build(response_type).headers
+
+
+def test_template_build_httpx_request() -> None:
+    template: ResponseTemplate = ResponseTemplate.from_data(_make_data(b"{}"))
+
+    first: httpx.Response = template.build(mockish.httpx.Response)
+    second: httpx.Response = template.build(mockish.httpx.Response)
+
+    assert first.request is not second.request
+
+
+def test_template_build_requests_cookies() -> None:
+    template: ResponseTemplate = ResponseTemplate.from_data(_make_data(b"{}"))
+
+    first: requests.Response = template.build(mockish.requests.Response)
+    second: requests.Response = template.build(mockish.requests.Response)
+
+    first.cookies.set("hello", "world")
+    assert "hello" not in second.cookies
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+@pytest.mark.parametrize("mode", ["text", "binary", "mmap"])
+def test_from_file_json(
+    response_type: type[Response],
+    mode: str,
+    tmp_path: Path,
+) -> None:
+    expected: dict[str, str] = {"hello": str(uuid4()), "snowman": "☃"}
+    path: Path = tmp_path / "fixture.json"
+    path.write_text(json.dumps(expected, ensure_ascii=False), encoding="utf-8")
+
+    resp: Response = response_type.from_file(
+        str(path),
+        binary=mode == "binary",
+        mmap=mode == "mmap",
+        status_code=201,
+    )
+
+    assert resp.status_code == 201
+    assert resp.headers["Content-Type"] == CONTENT_TYPE_JSON
+    assert int(resp.headers["Content-Length"]) == path.stat().st_size
+    assert resp.content == path.read_bytes()
+    assert resp.text == path.read_text(encoding="utf-8")
+    assert resp.json() == expected
+
+    if mode == "binary":
+        assert isinstance(resp.content, bytes)
+    elif mode == "mmap":
+        assert isinstance(resp.content, memoryview)
+        assert resp.content.readonly
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+@pytest.mark.parametrize(
+    ("filename", "binary", "expected_content_type"),
+    [
+        ("fixture.png", True, "image/png"),
+        ("fixture.html", False, "text/html"),
+        ("fixture.txt", False, CONTENT_TYPE_DEFAULT),
+        ("fixture", False, CONTENT_TYPE_DEFAULT),
+        ("fixture", True, CONTENT_TYPE_BINARY),
+    ],
+)
+def test_from_file_content_type(
+    response_type: type[Response],
+    filename: str,
+    binary: bool,
+    expected_content_type: str,
+    tmp_path: Path,
+) -> None:
+    path: Path = tmp_path / filename
+    path.write_bytes(b"hello world")
+
+    resp: Response = response_type.from_file(str(path), binary=binary)
+
+    assert resp.headers["Content-Type"] == expected_content_type
+    assert resp.content == b"hello world"
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_file_mmap_empty(response_type: type[Response], tmp_path: Path) -> None:
+    path: Path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    resp: Response = response_type.from_file(str(path), mmap=True, status_code=204)
+
+    assert resp.status_code == 204
+    assert not resp.content
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+@pytest.mark.parametrize(
+    "serializer",
+    [
+        None,
+        "json",
+        serializers.dumps_json,
+        lambda x: json.dumps(x, separators=(",", ":")).encode(),
+    ],
+)
+def test_from_dict_serializer(
+    response_type: type[Response],
+    serializer: serializers.JsonSerializer | str | None,
+) -> None:
+    expected: dict[str, str] = {"hello": str(uuid4()), "snowman": "☃"}
+
+    resp: Response = response_type.from_dict(expected, serializer=serializer)
+
+    assert resp.json() == expected
+    assert resp.headers["Content-Type"] == CONTENT_TYPE_JSON
+    assert int(resp.headers["Content-Length"]) == len(resp.content)
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_dict_serializer_orjson(response_type: type[Response]) -> None:
+    orjson = pytest.importorskip("orjson")
+
+    expected: dict[str, str] = {"hello": str(uuid4()), "snowman": "☃"}
+
+    resp: Response = response_type.from_dict(expected, serializer="orjson")
+
+    assert resp.content == orjson.dumps(expected)
+    assert resp.json() == expected
+
+
+def test_from_dict_serializer_default() -> None:
+    expected: dict[str, str] = {"hello": str(uuid4())}
+
+    try:
+        serializers.set_json_serializer(
+            lambda x: json.dumps(x, separators=(",", ":")).encode(),
+        )
+        resp: Response = mockish.requests.Response.from_dict(expected)
+        assert b" " not in resp.content
+    finally:
+        serializers.set_json_serializer(None)
+
+    resp = mockish.requests.Response.from_dict(expected)
+    assert b" " in resp.content
+
+
+def test_from_dict_serializer_bytes_reencoded() -> None:
+    resp: Response = mockish.requests.Response.from_dict(
+        {"snowman": "☃"},
+        serializer=lambda x: json.dumps(x, ensure_ascii=False).encode(),
+        encoding="utf-16",
+    )
+
+    assert resp.headers["Content-Type"] == f"{CONTENT_TYPE_JSON}; charset=utf-16"
+    assert resp.content.decode("utf-16") == '{"snowman": "☃"}'
+
+
+def test_from_dict_serializer_unknown() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON serializer"):
+        mockish.requests.Response.from_dict({}, serializer="asdf")
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_records(response_type: type[Response]) -> None:
+    records: list[dict[str, Any]] = [{"id": i, "snowman": "☃"} for i in range(10)]
+
+    responses = response_type.from_records(
+        records,
+        batch_size=3,
+        status_code=201,
+        headers={"X-Hello": "world"},
+    )
+
+    observed: list[Response] = list(responses)
+    assert [x.json() for x in observed] == records
+    for resp in observed:
+        assert resp.status_code == 201
+        assert resp.headers["Content-Type"] == CONTENT_TYPE_JSON
+        assert resp.headers["X-Hello"] == "world"
+        assert int(resp.headers["Content-Length"]) == len(resp.content)
+
+    # headers are shared per batch, but never between responses.
+    observed[0].headers["X-Hello"] = "mockish"
+    assert observed[1].headers["X-Hello"] == "world"
+
+
+def test_from_records_lazy() -> None:
+    n_records: int = 1_000_000
+    n_consumed: int = 1000
+    produced: list[int] = []
+
+    def _records() -> Iterator[dict[str, int]]:
+        for i in range(n_records):
+            produced.append(i)
+            yield {"id": i}
+
+    obj = mockish.Mock(
+        return_each=mockish.requests.Response.from_records(_records(), batch_size=100),
+    )
+    assert not produced
+
+    tracemalloc.start()
+    try:
+        for i in range(n_consumed):
+            assert obj().json() == {"id": i}
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert len(produced) == n_consumed
+    assert peak < 10 * 1024**2
+
+
+def test_from_records_thread_safe() -> None:
+    obj = mockish.Mock(
+        return_each=mockish.httpx.Response.from_records([{"id": 1}]),
+        thread_safe=True,
+    )
+
+    assert obj().json() == {"id": 1}
+    with pytest.raises(StopIteration):
+        obj()
+
+
+def test_from_records_encoding() -> None:
+    resp: Response = next(
+        mockish.requests.Response.from_records(
+            [{"snowman": "☃"}],
+            serializer=lambda x: json.dumps(x, ensure_ascii=False).encode(),
+            encoding="utf-16",
+        ),
+    )
+
+    assert resp.headers["Content-Type"] == f"{CONTENT_TYPE_JSON}; charset=utf-16"
+    assert resp.content.decode("utf-16") == '{"snowman": "☃"}'
+    assert resp.json() == {"snowman": "☃"}
+
+
+def test_from_records_invalid() -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        mockish.requests.Response.from_records([], batch_size=0)
+
+    with pytest.raises(ValueError, match="Unknown JSON serializer"):
+        mockish.requests.Response.from_records([], serializer="asdf")
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_jsonl(response_type: type[Response], tmp_path: Path) -> None:
+    records: list[dict[str, Any]] = [{"id": i} for i in range(5)]
+    path: Path = tmp_path / "fixture.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(x) for x in records[:3])
+        + "\n\n"
+        + "\n".join(json.dumps(x) for x in records[3:])
+        + "\n",
+    )
+
+    obj = mockish.Mock(return_each=response_type.from_jsonl(str(path), status_code=202))
+
+    for expected in records:
+        resp: Any = obj()
+        assert resp.status_code == 202
+        assert resp.json() == expected
+        assert resp.headers["Content-Length"] == str(len(json.dumps(expected)))
+
+    with pytest.raises(StopIteration):
+        obj()
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_records_latency(response_type: type[Response]) -> None:
+    latencies: Iterator[float] = iter([1, 2])
+
+    observed: list[Any] = list(
+        response_type.from_records(
+            [{}, {}],
+            latency=lambda: next(latencies),
+        ),
+    )
+
+    assert [x.elapsed for x in observed] == [timedelta(seconds=1), timedelta(seconds=2)]
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+@pytest.mark.parametrize("encoding", [None, "utf-16"])
+def test_from_dict_lazy(response_type: type[Response], encoding: str | None) -> None:
+    payload: dict[str, Any] = {"hello": "wörld", "items": [{"id": 1}, {"id": 2}]}
+    calls: list[Any] = []
+
+    def _serialize(obj: Any) -> str:
+        calls.append(obj)
+        return json.dumps(obj)
+
+    resp: Any = response_type.from_dict(
+        payload,
+        serializer=_serialize,
+        lazy=True,
+        encoding=encoding,
+        status_code=201,
+    )
+    expected: Any = response_type.from_dict(
+        payload,
+        serializer=json.dumps,
+        encoding=encoding,
+        status_code=201,
+    )
+
+    assert resp.status_code == 201
+
+    # an independent copy, without serializing.
+    data: Any = resp.json()
+    assert data == payload
+    assert data is not payload
+    assert data["items"][0] is not payload["items"][0]
+    assert not calls
+
+    assert dict(resp.headers) == dict(expected.headers)
+    assert calls == [payload]
+    assert resp.content == expected.content
+    assert resp.text == expected.text
+    assert resp.json(parse_int=str) == {
+        "hello": "wörld",
+        "items": [{"id": "1"}, {"id": "2"}],
+    }
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_dict_lazy_content_first(response_type: type[Response]) -> None:
+    resp: Any = response_type.from_dict({"hello": "world"}, lazy=True)
+    clone: Any = resp._clone()
+
+    assert resp.content == b'{"hello": "world"}'
+    assert resp.headers["Content-Length"] == "18"
+
+    # clones made before serializing share the serialized content.
+    assert clone.headers["Content-Length"] == "18"
+    assert clone.content is resp.content
+
+    template: ResponseTemplate = ResponseTemplate.from_data(
+        response_type._prepare_response_data(),
+    )
+    assert template.build(response_type).status_code == 200
+
+
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_from_dict_lazy_pickle(response_type: type[Response]) -> None:
+    resp: Any = response_type.from_dict({"hello": "world"}, lazy=True)
+
+    restored: Any = pickle.loads(pickle.dumps(resp))
+    assert restored.json() == {"hello": "world"}
+    assert restored.content == b'{"hello": "world"}'
+    assert restored.headers["Content-Length"] == "18"
+
+    lazy: mockish.models.LazyJson = pickle.loads(
+        pickle.dumps(mockish.models.LazyJson({"hello": "world"}, json.dumps)),
+    )
+    assert lazy.encode() == b'{"hello": "world"}'
+
+
+def test_from_dict_lazy_httpx_read() -> None:
+    resp: Any = mockish.httpx.Response.from_dict({"hello": "world"}, lazy=True)
+    assert b"".join(resp.iter_bytes()) == b'{"hello": "world"}'
+    assert resp.read() == b'{"hello": "world"}'
+
+
+def test_from_dict_lazy_template() -> None:
+    data: ResponseData = mockish.requests.Response._prepare_response_data()
+    data.lazy = mockish.models.LazyJson({"hello": "world"}, json.dumps)
+
+    template: ResponseTemplate = ResponseTemplate.from_data(data)
+    assert template.content == b'{"hello": "world"}'
+    assert dict(template.headers)["Content-Length"] == "18"
+
+
+def test_from_dict_lazy_invalid() -> None:
+    with pytest.raises(ValueError, match="compress"):
+        mockish.requests.Response.from_dict({}, lazy=True, content_encoding="gzip")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Generator
+
+import pytest
+
+import mockish
+from mockish.profiling import Profiler, profiler
+
+
+@pytest.fixture(autouse=True)
+def _fixture_profiler() -> Generator[None, None, None]:
+    profiler.reset()
+    yield
+    profiler.enabled = False
+    profiler.reset()
+
+
+def test_profile() -> None:
+    obj: Any = mockish.Mock(return_call=lambda: time.sleep(0.01), profile=True)
+
+    for _ in range(5):
+        obj()
+    obj.get()
+
+    stats = profiler.stats()
+    assert [(x.name, x.calls) for x in stats] == [("mock", 5), ("mock.get", 1)]
+    assert stats[0].total_seconds >= 0.05
+    assert 0.01 <= stats[0].percentile(50) <= stats[0].percentile(99)
+
+    # not profiled, unless enabled.
+    mockish.Mock(return_value=1)()
+    mockish.FastMock(return_value=1)()
+    assert len(profiler.stats()) == 2
+
+    profiler.enabled = True
+    mockish.Mock(return_value=1, name="enabled")()
+    mockish.Mock(return_value=1, profile=False)()
+    assert [x.name for x in profiler.stats()][-1] == "enabled"
+
+
+def test_profile_async() -> None:
+    obj: Any = mockish.AsyncMock(return_value=1, name="fetch", profile=True)
+    assert asyncio.run(obj()) == 1
+    assert profiler.profile("fetch").calls == 1
+
+
+def test_profile_patch_target() -> None:
+    with mockish.patch.object(json, "dumps", mockish.Mock(profile=True)):
+        json.dumps({})
+        json.dumps({})
+
+    with mockish.patch("json.loads", mockish.Mock(profile=True)):
+        json.loads("{}")
+
+    with mockish.patch.object(json, "JSONDecoder", mockish.Mock(profile=True)):
+        json.JSONDecoder().decode("{}")
+
+    with mockish.patch.object(Path, "read_text", mockish.Mock(profile=True)):
+        Path("hello").read_text()
+
+    with mockish.patch.multiple("json", dump=mockish.Mock(profile=True)):
+        json.dump({}, None)
+
+    assert {x.name: x.calls for x in profiler.stats()} == {
+        "json.dumps": 2,
+        "json.loads": 1,
+        "json.JSONDecoder": 1,
+        "json.JSONDecoder().decode": 1,
+        "pathlib.Path.read_text": 1,
+        "json.dump": 1,
+    }
+
+
+def test_profiler_merge_export(tmp_path: Path) -> None:
+    local = Profiler(max_samples=3)
+    for x in [1.0, 2.0, 3.0, 4.0]:
+        local.profile("a").add(x)
+    local.profile("b").add(0.5)
+
+    assert local.profile("a").calls == 4
+    assert len(local.profile("a").samples) == 3
+    assert local.profile("b").percentile(0) == local.profile("b").percentile(100) == 0.5
+    with pytest.raises(ValueError, match="percentile"):
+        local.profile("b").percentile(101)
+
+    path: Path = tmp_path / "profile.json"
+    local.export(str(path))
+
+    merged = Profiler()
+    merged.merge(json.loads(path.read_text()))
+    merged.merge(local.to_dict())
+    assert [(x.name, x.calls, x.total_seconds) for x in merged.stats()] == [
+        ("a", 8, 20.0),
+        ("b", 2, 1.0),
+    ]
+
+    lines = merged.report(top=1).splitlines()
+    assert lines[0].split() == ["name", "calls", "total", "p50", "p90", "p99"]
+    assert lines[1].split()[:3] == ["a", "8", "20.00s"]
+    assert len(lines) == 2
+
+
+def test_plugin_profile(
+    pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
+
+    pytester.makepyfile(
+        """
+        import json
+        import mockish
+
+        def test_hot():
+            with mockish.patch.object(json, "dumps", mockish.Mock(return_value="{}")):
+                for _ in range(10):
+                    json.dumps({})
+        """,
+    )
+    result = pytester.runpytest_inprocess(
+        "-p",
+        "mockish.pytest_plugin",
+        "--mockish-profile",
+        "--mockish-profile-top=5",
+        "--mockish-profile-json=profile.json",
+    )
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        ["*mockish profile: top 5 mocks*", "name *calls*", "json.dumps *10 *"],
+    )
+
+    data: Any = json.loads((pytester.path / "profile.json").read_text())
+    assert [(x["name"], x["calls"]) for x in data["mocks"]] == [("json.dumps", 10)]
+    assert not profiler.enabled
+
+
+def test_plugin_profile_xdist() -> None:
+    from mockish.pytest_plugin import _XdistController
+
+    worker = Profiler()
+    worker.profile("json.dumps").add(1.0)
+
+    controller = _XdistController()
+    for _ in range(2):
+        controller.pytest_testnodedown(
+            SimpleNamespace(workeroutput={"mockish_profile": worker.to_dict()}),
+            None,
+        )
+    controller.pytest_testnodedown(SimpleNamespace(), None)
+
+    assert profiler.profile("json.dumps").calls == 2
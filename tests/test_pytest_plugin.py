@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+
+import mockish
+from mockish.models import ResponseData
+from mockish.pytest_plugin import (
+    SharedResponses,
+    _attach,
+    _publish,
+    _to_data,
+    _XdistController,
+)
+
+
+def _responses() -> Dict[str, Any]:
+    return {
+        "dict": mockish.requests.Response.from_dict({"hello": "world"}),
+        "data": ResponseData(
+            status_code=404,
+            headers={"Content-Type": "text/plain"},
+            content=b"not found",
+            elapsed=None,
+        ),
+        "empty": mockish.httpx.Response(status_code=204),
+    }
+
+
+def test_publish_attach() -> None:
+    path, index = _publish(SharedResponses({}))
+    try:
+        assert not _attach(path, index)
+    finally:
+        os.remove(path)
+
+    controller = _XdistController()
+    config = SimpleNamespace(
+        hook=SimpleNamespace(pytest_mockish_responses=lambda config: [_responses()]),
+    )
+    nodes = [SimpleNamespace(config=config, workerinput={}) for _ in range(2)]
+    for x in nodes:
+        controller.pytest_configure_node(x)
+
+    published: Dict[str, Any] = nodes[0].workerinput["mockish_responses"]
+    assert nodes[1].workerinput["mockish_responses"] is published
+    assert Path(published["path"]).stat().st_size == len(b'{"hello": "world"}') + len(
+        b"not found",
+    )
+
+    shared: SharedResponses = _attach(published["path"], published["index"])
+    assert list(shared) == ["dict", "data", "empty"]
+
+    content: Any = shared["dict"].content
+    assert isinstance(content, memoryview)
+    assert content.readonly
+
+    for response_cls in (mockish.httpx.Response, mockish.requests.Response):
+        resp: Any = shared.build("dict", response_cls)
+        assert resp.json() == {"hello": "world"}
+        assert resp.content is content or resp.content.obj is content.obj
+
+        resp = shared.build("data", response_cls, status_code=410)
+        assert resp.status_code == 410
+        assert resp.text == "not found"
+
+        resp = shared.build("empty", response_cls)
+        assert resp.status_code == 204
+        assert not resp.content
+
+    controller.pytest_unconfigure()
+    assert not Path(published["path"]).exists()
+
+
+def test_publish_nothing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    controller = _XdistController()
+    config = SimpleNamespace(
+        hook=SimpleNamespace(pytest_mockish_responses=lambda config: []),
+    )
+    node = SimpleNamespace(config=config, workerinput={})
+    controller.pytest_configure_node(node)
+
+    assert node.workerinput["mockish_responses"] == {"path": None, "index": {}}
+    assert not list(tmp_path.iterdir())
+
+    controller.pytest_unconfigure()
+
+
+def test_plugin(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+    # loaded explicitly below, whether or not the entry point is installed.
+    monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
+
+    pytester.makeconftest(
+        """
+        import mockish
+
+        calls = []
+
+        def pytest_mockish_responses(config):
+            calls.append(None)
+            return {"hello": mockish.requests.Response.from_dict({"hello": "world"})}
+        """,
+    )
+    pytester.makepyfile(
+        """
+        import mockish
+        import pytest
+
+        @pytest.mark.parametrize("response_cls", ["httpx", "requests"])
+        def test_hello(mockish_responses, response_cls):
+            response_cls = getattr(mockish, response_cls).Response
+            resp = mockish_responses.build("hello", response_cls)
+            assert resp.json() == {"hello": "world"}
+
+        def test_built_once(mockish_responses):
+            from conftest import calls
+            assert len(calls) == 1
+        """,
+    )
+    result = pytester.runpytest_inprocess("-p", "mockish.pytest_plugin")
+    result.assert_outcomes(passed=3)
+
+
+def test_plugin_duplicate(
+    pytester: pytest.Pytester,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
+
+    pytester.makeconftest(
+        """
+        import mockish
+
+        def pytest_mockish_responses(config):
+            return {"hello": mockish.requests.Response(content="a")}
+        """,
+    )
+    pytester.mkpydir("sub").joinpath("conftest.py").write_text(
+        "import mockish\n"
+        "def pytest_mockish_responses(config):\n"
+        "    return {'hello': mockish.requests.Response(content='b')}\n",
+    )
+    pytester.path.joinpath("sub", "test_sub.py").write_text(
+        "def test_hello(mockish_responses):\n    pass\n",
+    )
+    result = pytester.runpytest_inprocess("-p", "mockish.pytest_plugin")
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*Response 'hello' is defined more than once*"])
+
+
+@pytest.mark.parametrize(
+    "response_cls",
+    [mockish.httpx.Response, mockish.requests.Response],
+)
+def test_to_data_decoded(response_cls: Any) -> None:
+    resp: Any = response_cls.from_dict(
+        {"hello": "world" * 100}, content_encoding="gzip"
+    )
+
+    data: ResponseData = _to_data("gzip", resp)
+
+    assert data.content == resp.content
+    assert {k.lower(): v for k, v in data.headers.items()} == {
+        "content-type": "application/json",
+        "content-length": str(len(resp.content)),
+    }
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+import requests
+
+import mockish
+from mockish.models import ResponseTemplate
+from mockish.requests import Response, Router
+
+
+@pytest.fixture(name="router")
+def fixture_router() -> Router:
+    return Router()
+
+
+@pytest.fixture(name="session")
+def fixture_session(router: Router) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", router)
+    session.mount("http://", router)
+    return session
+
+
+def test_router_exact(router: Router, session: requests.Session) -> None:
+    route = router.add(
+        "GET",
+        "https://www.fresh2.dev/hello",
+        return_value=Response.from_dict({"hello": "world"}),
+    )
+
+    for _ in range(3):
+        resp: requests.Response = session.get("https://www.fresh2.dev/hello")
+        assert resp.json() == {"hello": "world"}
+        assert resp.url == "https://www.fresh2.dev/hello"
+        assert resp.request.method == "GET"
+        assert resp.connection is router
+
+    with pytest.raises(LookupError):
+        session.get("https://www.fresh2.dev/goodbye")
+
+    assert route.call_count == 3
+    assert isinstance(route.call_args.args[0], requests.PreparedRequest)
+
+
+def test_router_templates_and_query(router: Router, session: requests.Session) -> None:
+    router.add(
+        "GET",
+        "/users/{user_id}",
+        return_call=lambda request, user_id: Response.from_dict({"id": user_id}),
+    )
+    router.add("GET", "/search?q=mockish", return_value=Response(content="found"))
+    router.add("GET", "/search", return_value=Response(content="empty"))
+
+    assert session.get("http://localhost/users/123").json() == {"id": "123"}
+    assert session.get("http://localhost/search", params={"q": "mockish"}).text == (
+        "found"
+    )
+    assert session.get("http://localhost/search", params={"q": "asdf"}).text == (
+        "empty"
+    )
+
+
+def test_router_body(router: Router, session: requests.Session) -> None:
+    router.add(
+        "POST",
+        "/items",
+        body=b'{"a": 1}',
+        return_value=Response(content="a", status_code=201),
+    )
+    router.add("POST", "/items", body="b=2", return_value=Response(content="b"))
+    router.add("POST", "/items", return_value=Response(content="any"))
+
+    assert session.post("http://localhost/items", data=b'{"a": 1}').text == "a"
+    assert session.post("http://localhost/items", data={"b": "2"}).text == "b"
+    assert session.post("http://localhost/items", json={"c": 3}).text == "any"
+
+
+def test_router_encoding(router: Router, session: requests.Session) -> None:
+    router.add(
+        "GET",
+        "/",
+        return_value=Response(content="☃", encoding="utf-8"),
+    )
+
+    resp: requests.Response = session.get("http://localhost/")
+
+    assert resp.encoding == "utf-8"
+    assert resp.text == "☃"
+
+
+def test_router_stream(router: Router, session: requests.Session) -> None:
+    router.add(
+        "GET",
+        "/stream",
+        return_call=lambda request: Response.from_iter([b"hello", b" world"]),
+    )
+
+    resp: requests.Response = session.get("http://localhost/stream", stream=True)
+    assert b"".join(resp.iter_content(3)) == b"hello world"
+
+    resp = session.get("http://localhost/stream")
+    assert resp.content == b"hello world"
+
+
+def test_router_hooks(router: Router, session: requests.Session) -> None:
+    router.add("GET", "/", return_value=Response(status_code=503))
+
+    hook = mockish.Mock(return_call=lambda resp, *args, **kwargs: resp)
+    session.hooks["response"].append(hook)
+
+    resp: requests.Response = session.get("http://localhost/")
+
+    hook.assert_called_once()
+    with pytest.raises(requests.HTTPError):
+        resp.raise_for_status()
+
+
+def test_router_wrong_type(router: Router, session: requests.Session) -> None:
+    router.add("GET", "/", return_value="hello")
+
+    with pytest.raises(TypeError):
+        session.get("http://localhost/")
+
+
+def test_router_thread_pool(router: Router, session: requests.Session) -> None:
+    n_requests: int = 1000
+
+    route = router.add(
+        "GET",
+        "/each",
+        return_each=[Response(content=str(i)) for i in range(n_requests)],
+    )
+    template: ResponseTemplate = ResponseTemplate.from_data(
+        Response._prepare_response_data(content="template"),
+    )
+    router.add("GET", "/template", return_value=template)
+    shared: Response = Response(content="shared")
+    router.add("GET", "/shared", return_value=shared)
+
+    def _get(path: str) -> Any:
+        return session.get(f"http://localhost{path}")
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        each: list[requests.Response] = list(pool.map(_get, ["/each"] * n_requests))
+        templated: list[requests.Response] = list(
+            pool.map(_get, ["/template"] * 100),
+        )
+        shared_paths: list[str] = [f"/shared?i={i}" for i in range(n_requests)]
+        shared_responses: list[requests.Response] = list(
+            pool.map(_get, shared_paths),
+        )
+
+    assert sorted(int(x.text) for x in each) == list(range(n_requests))
+    assert route.call_count == n_requests
+
+    assert len({id(x) for x in templated}) == len(templated)
+    assert all(x.text == "template" for x in templated)
+
+    assert [x.url for x in shared_responses] == [
+        f"http://localhost{x}" for x in shared_paths
+    ]
+    assert all(x.text == "shared" for x in shared_responses)
+    assert shared.request is None
+
+
+def test_router_exported() -> None:
+    assert mockish.requests.Router is Router
+
+
+def test_router_lazy(router: Router, session: requests.Session) -> None:
+    router.add("GET", "/lazy", return_value=Response.from_dict({"a": 1}, lazy=True))
+    router.add(
+        "GET",
+        "/redirect",
+        return_value=Response(status_code=302, headers={"Location": "/lazy"}),
+    )
+
+    # the content is read by `requests.Session` itself, unless streamed.
+    resp: requests.Response = session.get("http://localhost/lazy", stream=True)
+    assert "headers" not in resp.__dict__
+    assert resp.encoding == "utf-8"
+    assert resp.json() == {"a": 1}
+
+    resp = session.get("http://localhost/redirect")
+    assert [x.status_code for x in resp.history] == [302]
+    assert resp.json() == {"a": 1}
+
+
+def test_router_exhausted(router: Router, session: requests.Session) -> None:
+    router.add("GET", "/once", return_once=Response(status_code=204))
+
+    assert session.get("http://localhost/once").status_code == 204
+    with pytest.raises(LookupError, match="No more responses"):
+        session.get("http://localhost/once")
+
+
+def test_router_reentrant(router: Router, session: requests.Session) -> None:
+    def _handler(request: requests.PreparedRequest, n: str) -> requests.Response:
+        if n == "0":
+            return Response(content="done")
+        return session.get(f"http://localhost/countdown/{int(n) - 1}")
+
+    route = router.add("GET", "/countdown/{n}", return_call=_handler)
+
+    assert session.get("http://localhost/countdown/3").text == "done"
+    assert route.call_count == 4
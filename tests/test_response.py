@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import array
+import asyncio
 import json
 from random import randint
 from typing import Any
@@ -165,3 +167,91 @@ def test_mock_request_method_callable() -> None:
         mock_session.get(...)
     except StopIteration:
         pytest.fail("method should return the value indefinitely")
+
+
+def test_request_given() -> None:
+    request: requests.PreparedRequest = requests.Request(
+        "POST",
+        "https://www.fresh2.dev/users",
+    ).prepare()
+
+    mock_resp: requests.Response = mockish.requests.Response.from_dict(
+        {"hello": "world"},
+        status_code=409,
+        request=request,
+    )
+
+    assert mock_resp.request is request
+    assert mock_resp.url == "https://www.fresh2.dev/users"
+
+    with pytest.raises(requests.HTTPError, match="www.fresh2.dev") as e:
+        mock_resp.raise_for_status()
+    assert e.value.request is request
+
+
+@pytest.mark.parametrize(
+    "response_type",
+    [mockish.httpx.Response, mockish.requests.Response],
+)
+def test_binary_content(response_type: Any) -> None:
+    payload: bytes = json.dumps({"hello": "world"}).encode()
+
+    # read-only content is passed through as-is.
+    resp: Any = response_type(content=payload, content_type=CONTENT_TYPE_JSON)
+    assert resp.content is payload
+    assert resp.json() == {"hello": "world"}
+    assert resp.headers["Content-Length"] == str(len(payload))
+
+    # viewed as bytes, without copying.
+    view: memoryview = memoryview(payload)
+    resp = response_type(content=view, content_type=CONTENT_TYPE_JSON)
+    assert resp.content is view
+    assert resp.json() == {"hello": "world"}
+
+    matrix: memoryview = memoryview(bytes(range(12))).cast("B", (3, 4))
+    resp = response_type(content=matrix)
+    assert resp.content.obj is matrix.obj
+    assert resp.headers["Content-Length"] == "12"
+
+    # writable buffers are copied, as they may change after the response is made.
+    buffer: bytearray = bytearray(payload)
+    for content in (buffer, memoryview(buffer)):
+        resp = response_type(content=content, content_type=CONTENT_TYPE_JSON)
+        buffer[:] = bytes(len(buffer))
+        assert isinstance(resp.content, bytes)
+        assert resp.json() == {"hello": "world"}
+        assert resp.headers["Content-Length"] == str(len(payload))
+        buffer[:] = payload
+
+    numbers: array.array[int] = array.array("i", range(100))
+    resp = response_type(content=numbers)
+    assert resp.content == numbers.tobytes()
+    assert resp.headers["Content-Length"] == str(100 * numbers.itemsize)
+
+    # non-contiguous buffers are copied.
+    resp = response_type(content=memoryview(bytes(range(10)))[::2])
+    assert resp.content == bytes(range(0, 10, 2))
+    assert resp.headers["Content-Length"] == "5"
+
+    with pytest.raises(TypeError, match="bytes-like"):
+        response_type(content=42)
+
+
+def test_binary_content_chunks() -> None:
+    view: memoryview = memoryview(b"hello world")
+
+    resp: Any = mockish.httpx.Response(content=view)
+    chunks: list[Any] = list(resp.iter_bytes(chunk_size=4))
+    assert chunks == [b"hell", b"o wo", b"rld"]
+    assert all(type(x) is bytes for x in chunks)
+
+    async def _aiter() -> list[Any]:
+        return [x async for x in resp.aiter_bytes(chunk_size=4)]
+
+    assert all(type(x) is bytes for x in asyncio.run(_aiter()))
+
+    resp = mockish.requests.Response(content=view)
+    chunks = list(resp.iter_content(chunk_size=4))
+    assert chunks == [b"hell", b"o wo", b"rld"]
+    assert all(type(x) is bytes for x in chunks)
+    assert list(resp.iter_lines()) == [b"hello world"]
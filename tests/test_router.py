@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from uuid import uuid4
+
+import httpx
+import pytest
+
+import mockish
+from mockish.httpx import Response, Router
+from mockish.models import ResponseTemplate
+
+
+def test_router_exact() -> None:
+    router = Router()
+    route = router.add(
+        "GET",
+        "https://www.fresh2.dev/hello",
+        return_value=Response.from_dict({"hello": "world"}),
+    )
+
+    with httpx.Client(transport=router) as client:
+        for _ in range(3):
+            resp: httpx.Response = client.get("https://www.fresh2.dev/hello")
+            assert resp.json() == {"hello": "world"}
+            assert resp.request.url == "https://www.fresh2.dev/hello"
+
+        with pytest.raises(LookupError):
+            client.get("https://www.fresh2.dev/goodbye")
+
+        with pytest.raises(LookupError):
+            client.post("https://www.fresh2.dev/hello")
+
+        with pytest.raises(LookupError):
+            client.get("https://www.f2dv.com/hello")
+
+    assert route.call_count == 3
+    assert isinstance(route.call_args.args[0], httpx.Request)
+
+
+def test_router_any_host_and_query() -> None:
+    router = Router()
+    any_host = router.add("GET", "/items", return_value=Response(content="all"))
+    with_query = router.add(
+        "GET",
+        "/items?page=2",
+        return_value=Response(content="page 2"),
+    )
+    specific_host = router.add(
+        "GET",
+        "https://www.fresh2.dev/items",
+        return_value=Response(content="specific"),
+    )
+
+    with httpx.Client(transport=router) as client:
+        assert client.get("https://www.f2dv.com/items").text == "all"
+        assert client.get("https://www.f2dv.com/items?page=1").text == "all"
+        assert client.get("https://www.f2dv.com/items?page=2").text == "page 2"
+        assert client.get("https://www.fresh2.dev/items").text == "specific"
+
+    assert any_host.call_count == 2
+    assert with_query.call_count == 1
+    assert specific_host.call_count == 1
+
+
+def test_router_templates_and_patterns() -> None:
+    router = Router()
+    user = router.add(
+        "GET",
+        "/users/{user_id}/posts/{post_id}",
+        return_call=lambda request, user_id, post_id: Response.from_dict(
+            {"user": user_id, "post": post_id},
+        ),
+    )
+    router.add(
+        "GET",
+        re.compile(r"https://(?P<sub>\w+)\.fresh2\.dev/.*"),
+        return_call=lambda request, sub: Response(content=sub),
+    )
+
+    with httpx.Client(transport=router) as client:
+        assert client.get("http://localhost/users/1/posts/2").json() == {
+            "user": "1",
+            "post": "2",
+        }
+        assert client.get("https://docs.fresh2.dev/anything/here").text == "docs"
+
+        with pytest.raises(LookupError):
+            client.get("http://localhost/users/1/posts")
+
+    user.assert_called_once()
+    assert user.call_args.kwargs == {"user_id": "1", "post_id": "2"}
+
+
+def test_router_return_each_and_once() -> None:
+    responses: list[httpx.Response] = [
+        Response.from_dict({"i": i}, status_code=200 + i) for i in range(3)
+    ]
+
+    router = Router()
+    router.add("GET", "/each", return_each=responses)
+    router.add("GET", "/once", return_once=Response(status_code=204))
+
+    with httpx.Client(transport=router, base_url="http://localhost") as client:
+        assert [client.get("/each").status_code for _ in range(3)] == [200, 201, 202]
+        assert client.get("/once").status_code == 204
+
+        with pytest.raises(LookupError, match="No more responses"):
+            client.get("/each")
+
+        with pytest.raises(LookupError, match="No more responses"):
+            client.get("/once")
+
+
+def test_router_exhausted_async() -> None:
+    router = Router()
+    router.add("GET", "/once", return_once=Response(status_code=204))
+
+    async def _main() -> None:
+        async with httpx.AsyncClient(
+            transport=router,
+            base_url="http://localhost",
+        ) as client:
+            assert (await client.get("/once")).status_code == 204
+            with pytest.raises(LookupError, match="No more responses"):
+                await client.get("/once")
+
+    asyncio.run(_main())
+
+
+def test_router_reentrant() -> None:
+    router = Router()
+    client = httpx.Client(transport=router, base_url="http://localhost")
+
+    def _handler(request: httpx.Request, n: str) -> httpx.Response:
+        if n == "0":
+            return Response(content="done")
+        return client.get(f"/countdown/{int(n) - 1}")
+
+    route = router.add("GET", "/countdown/{n}", return_call=_handler)
+
+    with client:
+        assert client.get("/countdown/3").text == "done"
+
+    assert route.call_count == 4
+
+
+def test_router_body() -> None:
+    router = Router()
+    router.add("POST", "/items", body=b'{"a": 1}', return_value=Response(content="a"))
+    router.add("POST", "/items", return_value=Response(content="any"))
+
+    with httpx.Client(transport=router, base_url="http://localhost") as client:
+        assert client.post("/items", content=b'{"a": 1}').text == "a"
+        assert client.post("/items", content=b'{"b": 2}').text == "any"
+
+
+def test_router_template_fresh_responses() -> None:
+    template: ResponseTemplate = ResponseTemplate.from_data(
+        Response._prepare_response_data(content='{"hello": "world"}'),
+    )
+
+    router = Router()
+    router.add("GET", "/hello", return_value=template)
+
+    with httpx.Client(transport=router, base_url="http://localhost") as client:
+        first: httpx.Response = client.get("/hello")
+        second: httpx.Response = client.get("/hello")
+
+    assert first is not second
+    assert first.content == second.content == b'{"hello": "world"}'
+
+
+def test_router_shared_return_value() -> None:
+    shared: Response = Response.from_dict({"hello": "world"})
+
+    router = Router()
+    router.add("GET", "/hello", return_value=shared)
+
+    with httpx.Client(transport=router, base_url="http://localhost") as client:
+        # more than the recursion limit, were the shared stream re-wrapped each time.
+        for i in range(2000):
+            resp: httpx.Response = client.get("/hello", params={"i": i})
+            assert resp is not shared
+            assert resp.request.url.params["i"] == str(i)
+            assert resp.json() == {"hello": "world"}
+            resp.close()
+
+    assert shared._request is None
+    assert isinstance(shared.stream, httpx.ByteStream)
+
+
+def test_router_async() -> None:
+    router = Router()
+    route = router.add(
+        "GET",
+        "/users/{user_id}",
+        return_call=lambda request, user_id: Response.from_dict({"id": user_id}),
+    )
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0)
+        return Response(content=request.method)
+
+    router.add("PUT", "/async", return_call=_handler)
+
+    async def _main() -> list[httpx.Response]:
+        async with httpx.AsyncClient(
+            transport=router,
+            base_url="http://localhost",
+        ) as client:
+            return await asyncio.gather(
+                client.put("/async"),
+                *[client.get(f"/users/{i}") for i in range(10)],
+            )
+
+    results: list[httpx.Response] = asyncio.run(_main())
+
+    assert results[0].text == "PUT"
+    assert [x.json() for x in results[1:]] == [{"id": str(i)} for i in range(10)]
+    assert route.call_count == 10
+
+
+def test_router_wrong_type() -> None:
+    router = Router()
+    router.add("GET", "/", return_value="hello")
+
+    with httpx.Client(
+        transport=router,
+        base_url="http://localhost",
+    ) as client, pytest.raises(TypeError):
+        client.get("/")
+
+
+def test_router_many_routes() -> None:
+    n_routes: int = 10_000
+
+    router = Router()
+    handler = mockish.Mock(return_value=Response(content="hello"))
+    for i in range(n_routes):
+        router._routes.add("GET", f"/exact/{i}", handler)
+        router._routes.add("GET", f"/template/{i}/{{item_id}}", handler)
+        router._routes.add("GET", f"/{{tenant}}/{i}/{{item_id}}", handler)
+
+    assert len(router._routes) == 3 * n_routes
+
+    # timed by `benchmarks/bench_routing.py`.
+    for i in range(0, n_routes, 10):
+        route, params = router._routes.match("GET", f"http://localhost/exact/{i}")
+        assert route is not None
+        assert not params
+
+        route, params = router._routes.match(
+            "GET",
+            f"http://localhost/template/{i}/{uuid4()}",
+        )
+        assert route is not None
+        assert route.url == f"/template/{i}/{{item_id}}"
+
+        route, params = router._routes.match("GET", f"http://localhost/tenant/{i}/1")
+        assert route is not None
+        assert params == {"tenant": "tenant", "item_id": "1"}
+
+    with httpx.Client(transport=router, base_url="http://localhost") as client:
+        assert client.get(f"/template/{n_routes - 1}/asdf").text == "hello"
+
+
+def test_router_exported() -> None:
+    assert mockish.httpx.Router is Router
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import tracemalloc
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+import requests
+
+import mockish
+from mockish.constants import CONTENT_TYPE_BINARY
+from mockish.models import ResponseTemplate
+
+CHUNK_SIZE: int = 64 * 1024
+
+
+def _chunks(n_bytes: int, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    chunk: bytes = b"x" * chunk_size
+    for _ in range(n_bytes // chunk_size):
+        yield chunk
+
+
+async def _achunks(n_bytes: int, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    for chunk in _chunks(n_bytes, chunk_size):
+        yield chunk
+
+
+def test_httpx_iter_bytes() -> None:
+    resp: httpx.Response = mockish.httpx.Response.from_iter(
+        [b"hello", b" ", b"world"],
+        status_code=201,
+    )
+
+    assert resp.status_code == 201
+    assert resp.headers["Content-Type"] == CONTENT_TYPE_BINARY
+    assert "Content-Length" not in resp.headers
+
+    with pytest.raises(httpx.ResponseNotRead):
+        _ = resp.content
+
+    assert b"".join(resp.iter_bytes()) == b"hello world"
+
+    with pytest.raises(httpx.StreamConsumed):
+        list(resp.iter_bytes())
+
+
+def test_httpx_read() -> None:
+    resp: httpx.Response = mockish.httpx.Response.from_stream(
+        x for x in (b'{"hello": ', b'"world"}')
+    )
+
+    resp.read()
+    assert resp.json() == {"hello": "world"}
+
+
+@pytest.mark.parametrize("is_async_source", [False, True])
+def test_httpx_aiter_bytes(is_async_source: bool) -> None:
+    n_bytes: int = 4 * CHUNK_SIZE
+
+    resp: httpx.Response = mockish.httpx.Response.from_stream(
+        _achunks(n_bytes) if is_async_source else _chunks(n_bytes),
+    )
+
+    async def _main() -> int:
+        return sum([len(x) async for x in resp.aiter_bytes()])
+
+    assert asyncio.run(_main()) == n_bytes
+
+
+def test_httpx_async_source_in_sync_context() -> None:
+    resp: httpx.Response = mockish.httpx.Response.from_stream(_achunks(CHUNK_SIZE))
+
+    with pytest.raises(RuntimeError):
+        list(resp.iter_bytes())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024, None])
+def test_requests_iter_content(chunk_size: int | None) -> None:
+    resp: requests.Response = mockish.requests.Response.from_iter(
+        [b"hello", b" ", b"world"],
+        headers={"Content-Length": "11"},
+    )
+
+    chunks: list[bytes] = list(resp.iter_content(chunk_size))
+
+    assert b"".join(chunks) == b"hello world"
+    assert resp.headers["Content-Length"] == "11"
+    if chunk_size:
+        assert all(len(x) == chunk_size for x in chunks[:-1])
+
+
+def test_requests_content() -> None:
+    resp: requests.Response = mockish.requests.Response.from_iter(
+        [b'{"hello": ', b'"world"}'],
+    )
+
+    assert resp.json() == {"hello": "world"}
+    assert resp.content == b'{"hello": "world"}'
+
+
+def test_requests_async_source() -> None:
+    with pytest.raises(TypeError):
+        mockish.requests.Response.from_iter(_achunks(CHUNK_SIZE))
+
+
+def test_template_from_stream() -> None:
+    data = mockish.requests.Response._prepare_response_data(stream=[b"asdf"])
+
+    with pytest.raises(ValueError, match="stream"):
+        ResponseTemplate.from_data(data)
+
+
+def test_content_and_stream() -> None:
+    with pytest.raises(ValueError, match="stream"):
+        mockish.requests.Response._prepare_response_data(
+            content="asdf",
+            stream=[b"asdf"],
+        )
+
+
+@pytest.mark.parametrize("backend", ["httpx", "requests"])
+def test_constant_memory(backend: str) -> None:
+    n_bytes: int = 256 * 1024 * 1024
+
+    tracemalloc.start()
+    try:
+        n_read: int = 0
+        if backend == "httpx":
+            resp_httpx = mockish.httpx.Response.from_iter(_chunks(n_bytes))
+            for chunk in resp_httpx.iter_bytes():
+                n_read += len(chunk)
+        else:
+            resp_requests = mockish.requests.Response.from_iter(_chunks(n_bytes))
+            for chunk in resp_requests.iter_content(CHUNK_SIZE):
+                n_read += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert n_read == n_bytes
+    assert peak < 16 * CHUNK_SIZE